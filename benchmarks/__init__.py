@@ -0,0 +1,6 @@
+"""
+Benchmark suite untuk Robot Gesture Control System
+
+Jalankan dari root project:
+    python -m benchmarks.bench_pipeline
+"""
@@ -0,0 +1,316 @@
+"""
+Pipeline Benchmark
+Ukur latency per panggilan dan alokasi memori untuk recognition, command
+mapping dan rendering overlay dengan data sintetis.
+
+Penggunaan (dari root project):
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --save-baseline
+    python -m benchmarks.bench_pipeline --require-baseline   # mode CI
+    python -m benchmarks.bench_pipeline --filter draw --threshold 0.3
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from modules.gesture_recognizer import (
+    GestureRecognizer, MultiBodyGestureRecognizer, JOINT_NAMES
+)
+from modules.joint_filter import JointFilter
+from modules.robot_controller import RobotController
+from modules.visualizer import Visualizer
+from modules.depth_preview import colorize_depth, colorize_body_index
+from .synthetic import synthetic_sequence, synthetic_images, synthetic_raw_images
+
+# Resolusi depth yang diukur
+BENCH_DEPTH_MODES = ('WFOV_2X2BINNED', 'NFOV_UNBINNED')
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Metrik yang dibandingkan dengan baseline
+COMPARED_METRICS = ('p50_us', 'p90_us')
+
+
+def _cycle(items):
+    """
+    Buat fungsi yang mengembalikan elemen items secara bergantian
+
+    Args:
+        items (list): Elemen input
+
+    Returns:
+        callable: Fungsi tanpa argumen
+    """
+    state = {'i': 0}
+
+    def next_item():
+        item = items[state['i']]
+        state['i'] = (state['i'] + 1) % len(items)
+        return item
+
+    return next_item
+
+
+def build_cases(num_frames=450):
+    """
+    Siapkan semua kasus benchmark
+
+    Args:
+        num_frames (int): Jumlah frame skeleton sintetis
+
+    Returns:
+        list: List (name, fn) dengan fn() menjalankan satu panggilan
+    """
+    cases = []
+
+    # Recognition
+    single_frames, _ = synthetic_sequence(num_frames, num_bodies=1)
+    single_bodies = _cycle([bodies[0] for bodies in single_frames])
+    recognizer = GestureRecognizer()
+    cases.append((
+        'recognize_gesture',
+        lambda: recognizer.recognize_gesture(single_bodies())
+    ))
+
+    for num_bodies in (1, 6):
+        frames, _ = synthetic_sequence(num_frames, num_bodies=num_bodies)
+        next_frame = _cycle(frames)
+        multi = MultiBodyGestureRecognizer(max_bodies=6)
+        cases.append((
+            f'recognize_bodies[{num_bodies}]',
+            lambda multi=multi, next_frame=next_frame:
+                multi.recognize_bodies(next_frame())
+        ))
+
+    # Filter joint semua body (state per slot)
+    frames, _ = synthetic_sequence(num_frames, num_bodies=6)
+    next_batch = _cycle([
+        np.array([recognizer.extract_keypoints(body) for body in bodies])
+        for bodies in frames
+    ])
+    joint_filter = JointFilter(JOINT_NAMES, num_tracks=6)
+    filter_tracks = np.arange(6)
+    cases.append((
+        'joint_filter[6]',
+        lambda: joint_filter.apply(next_batch(), tracks=filter_tracks)
+    ))
+
+    # Evaluasi rule untuk batch frame (mis. evaluasi offline)
+    batch = np.array([recognizer.extract_keypoints(bodies[0])
+                      for bodies in single_frames])
+    cases.append((
+        f'rules.evaluate[{num_frames}]',
+        lambda: recognizer.rules.evaluate(batch)
+    ))
+
+    # Command mapping
+    gesture_lists = GestureRecognizer()
+    gesture_sets = _cycle([
+        gesture_lists.recognize_gesture(bodies[0]) for bodies in single_frames
+    ])
+    robot = RobotController(async_write=False)
+    cases.append((
+        'gesture_to_command',
+        lambda: robot.gesture_to_command(gesture_sets())
+    ))
+
+    # Rendering overlay
+    visualizer = Visualizer(create_window=False)
+    gestures = ['KEDUA_TANGAN', 'LAMBAI']
+
+    for depth_mode in BENCH_DEPTH_MODES:
+        depth_image, body_image = synthetic_images(depth_mode)
+        depth_map, body_index = synthetic_raw_images(depth_mode)
+        canvas = depth_image.copy()
+
+        cases.extend([
+            (f'colorize_combine[{depth_mode}]',
+             lambda d=depth_map, b=body_index: visualizer.combine_images(
+                 colorize_depth(d), colorize_body_index(b))),
+            (f'blend_raw[{depth_mode}]',
+             lambda d=depth_map, b=body_index: visualizer.blend_raw(d, b)),
+            (f'combine_images[{depth_mode}]',
+             lambda d=depth_image, b=body_image: visualizer.combine_images(d, b)),
+            (f'draw_gestures[{depth_mode}]',
+             lambda c=canvas: visualizer.draw_gestures(c, gestures)),
+            (f'draw_robot_command[{depth_mode}]',
+             lambda c=canvas: visualizer.draw_robot_command(c, 'F', True, gestures)),
+            (f'draw_status[{depth_mode}]',
+             lambda c=canvas: visualizer.draw_status(c, 1234, True)),
+        ])
+
+    return cases
+
+
+def measure(fn, iterations, warmup, alloc_iterations):
+    """
+    Ukur latency dan alokasi memori satu kasus
+
+    Args:
+        fn (callable): Fungsi yang diukur
+        iterations (int): Jumlah panggilan untuk latency
+        warmup (int): Jumlah panggilan pemanasan
+        alloc_iterations (int): Jumlah panggilan untuk pengukuran alokasi
+
+    Returns:
+        dict: Persentil latency (mikrodetik) dan alokasi puncak per panggilan
+    """
+    for _ in range(warmup):
+        fn()
+
+    timings = np.empty(iterations, dtype=np.int64)
+    clock = time.perf_counter_ns
+    for i in range(iterations):
+        start = clock()
+        fn()
+        timings[i] = clock() - start
+
+    # Alokasi diukur terpisah karena tracemalloc memperlambat eksekusi
+    reset_peak = getattr(tracemalloc, 'reset_peak', tracemalloc.clear_traces)
+    peaks = np.empty(alloc_iterations, dtype=np.int64)
+    tracemalloc.start()
+    try:
+        for i in range(alloc_iterations):
+            reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            fn()
+            peaks[i] = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+    timings_us = timings / 1000.0
+    return {
+        'calls': iterations,
+        'mean_us': float(timings_us.mean()),
+        'p50_us': float(np.percentile(timings_us, 50)),
+        'p90_us': float(np.percentile(timings_us, 90)),
+        'p99_us': float(np.percentile(timings_us, 99)),
+        'max_us': float(timings_us.max()),
+        'alloc_peak_kib': float(peaks.max()) / 1024,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Bandingkan hasil dengan baseline
+
+    Args:
+        results (dict): Hasil benchmark {name: metrics}
+        baseline (dict): Baseline {name: metrics}
+        threshold (float): Toleransi kenaikan relatif (0.25 = 25%)
+
+    Returns:
+        list: List (name, metric, baseline, current) yang melewati threshold
+    """
+    regressions = []
+    for name, metrics in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if metric not in reference:
+                continue
+            if metrics[metric] > reference[metric] * (1 + threshold):
+                regressions.append(
+                    (name, metric, reference[metric], metrics[metric])
+                )
+    return regressions
+
+
+def print_results(results):
+    """Cetak tabel hasil benchmark"""
+    header = (f"{'Benchmark':<36} {'p50':>9} {'p90':>9} {'p99':>9} "
+              f"{'max':>9} {'alloc':>10}")
+    print(header)
+    print("-" * len(header))
+    for name, m in results.items():
+        print(f"{name:<36} {m['p50_us']:>7.1f}us {m['p90_us']:>7.1f}us "
+              f"{m['p99_us']:>7.1f}us {m['max_us']:>7.1f}us "
+              f"{m['alloc_peak_kib']:>7.1f}KiB")
+
+
+def parse_args(argv=None):
+    """Parse argumen command line"""
+    parser = argparse.ArgumentParser(description="Benchmark pipeline gesture control")
+    parser.add_argument('--iterations', type=int, default=2000,
+                        help="Jumlah panggilan per benchmark")
+    parser.add_argument('--warmup', type=int, default=100,
+                        help="Jumlah panggilan pemanasan")
+    parser.add_argument('--alloc-iterations', type=int, default=100,
+                        help="Jumlah panggilan untuk pengukuran alokasi")
+    parser.add_argument('--filter', default='',
+                        help="Hanya jalankan benchmark yang namanya mengandung teks ini")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help="File baseline JSON untuk perbandingan")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Simpan hasil sebagai baseline baru")
+    parser.add_argument('--require-baseline', action='store_true',
+                        help="Gagal (exit 2) jika file baseline tidak ada (mode CI)")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Toleransi regresi relatif (default 0.25 = 25%%)")
+    parser.add_argument('--json', metavar='PATH',
+                        help="Simpan hasil lengkap ke file JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Jalankan benchmark
+
+    Returns:
+        int: Exit code (1 jika ada regresi terhadap baseline, 2 jika
+            baseline tidak ada dan --require-baseline aktif)
+    """
+    args = parse_args(argv)
+
+    results = {}
+    for name, fn in build_cases():
+        if args.filter not in name:
+            continue
+        results[name] = measure(fn, args.iterations, args.warmup,
+                                args.alloc_iterations)
+
+    print_results(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\n💾 Baseline disimpan: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        if args.require_baseline:
+            print(f"\n❌ Baseline tidak ditemukan ({args.baseline}), "
+                  "regression gate tidak bisa dijalankan")
+            return 2
+        print(f"\nℹ️  Baseline tidak ditemukan ({args.baseline}), "
+              "jalankan dengan --save-baseline")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.threshold)
+    if not regressions:
+        print(f"\n✅ Tidak ada regresi (threshold {args.threshold:.0%})")
+        return 0
+
+    print(f"\n❌ Regresi melewati threshold {args.threshold:.0%}:")
+    for name, metric, reference, current in regressions:
+        print(f"  - {name} {metric}: {reference:.1f}us → {current:.1f}us "
+              f"(+{current / reference - 1:.0%})")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
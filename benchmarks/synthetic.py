@@ -0,0 +1,206 @@
+"""
+Synthetic Data
+Skeleton dan frame depth/segmentation sintetis untuk benchmark tanpa Azure Kinect
+"""
+
+import numpy as np
+
+from modules.kinect_manager import DEPTH_RESOLUTIONS
+
+# Pose berdiri netral (x, y, z dalam mm, koordinat kamera Azure Kinect:
+# y positif ke bawah). Urutan mengikuti index joint K4ABT (32 joint).
+NEUTRAL_POSE = np.array([
+    (0, 0, 2000),        # 0  pelvis
+    (0, -200, 2000),     # 1  spine_navel
+    (0, -380, 2000),     # 2  spine_chest
+    (0, -550, 2000),     # 3  neck
+    (-50, -520, 2000),   # 4  clavicle_left
+    (-180, -500, 2000),  # 5  shoulder_left
+    (-220, -250, 2000),  # 6  elbow_left
+    (-230, -20, 2000),   # 7  wrist_left
+    (-235, 40, 2000),    # 8  hand_left
+    (-240, 100, 2000),   # 9  handtip_left
+    (-220, 60, 1990),    # 10 thumb_left
+    (50, -520, 2000),    # 11 clavicle_right
+    (180, -500, 2000),   # 12 shoulder_right
+    (220, -250, 2000),   # 13 elbow_right
+    (230, -20, 2000),    # 14 wrist_right
+    (235, 40, 2000),     # 15 hand_right
+    (240, 100, 2000),    # 16 handtip_right
+    (220, 60, 1990),     # 17 thumb_right
+    (-100, 0, 2000),     # 18 hip_left
+    (-110, 420, 2000),   # 19 knee_left
+    (-115, 820, 2000),   # 20 ankle_left
+    (-115, 870, 1900),   # 21 foot_left
+    (100, 0, 2000),      # 22 hip_right
+    (110, 420, 2000),    # 23 knee_right
+    (115, 820, 2000),    # 24 ankle_right
+    (115, 870, 1900),    # 25 foot_right
+    (0, -680, 2000),     # 26 head
+    (0, -670, 1900),     # 27 nose
+    (-35, -700, 1920),   # 28 eye_left
+    (-75, -690, 1980),   # 29 ear_left
+    (35, -700, 1920),    # 30 eye_right
+    (75, -690, 1980),    # 31 ear_right
+], dtype=np.float64)
+
+# Gesture yang disimulasikan, diputar bergantian per segmen frame
+SYNTHETIC_GESTURES = (
+    'NETRAL',
+    'TANGAN_KANAN',
+    'TANGAN_KIRI',
+    'KEDUA_TANGAN',
+    'LAMBAI',
+    'TANGAN_DI_WAJAH',
+)
+
+
+class SyntheticPosition:
+    """Posisi joint dengan atribut x, y, z seperti pykinect"""
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class SyntheticJoint:
+    """Joint dengan atribut position dan confidence_level seperti pykinect"""
+
+    __slots__ = ('position', 'confidence_level')
+
+    def __init__(self, position, confidence_level):
+        self.position = SyntheticPosition(*position)
+        self.confidence_level = confidence_level
+
+
+class SyntheticBody:
+    """Body dengan atribut id dan joints seperti pykinect Body"""
+
+    def __init__(self, body_id, positions, confidence=2):
+        self.id = body_id
+        self.joints = [SyntheticJoint(pos, confidence)
+                       for pos in positions.tolist()]
+
+
+def gesture_pose(gesture, phase):
+    """
+    Pose joint untuk gesture tertentu
+
+    Args:
+        gesture (str): Nama gesture (lihat SYNTHETIC_GESTURES)
+        phase (int): Frame ke-n dalam segmen (untuk gerakan lambaian)
+
+    Returns:
+        np.ndarray: Posisi joint (32, 3)
+    """
+    pose = NEUTRAL_POSE.copy()
+
+    if gesture in ('TANGAN_KANAN', 'KEDUA_TANGAN'):
+        pose[13] = (250, -650, 1980)
+        pose[14] = (260, -820, 1960)
+        pose[15] = (262, -880, 1960)
+    if gesture in ('TANGAN_KIRI', 'KEDUA_TANGAN'):
+        pose[6] = (-250, -650, 1980)
+        pose[7] = (-260, -820, 1960)
+        pose[8] = (-262, -880, 1960)
+    if gesture == 'LAMBAI':
+        offset = 200 * np.sin(2 * np.pi * phase / 12)
+        pose[13] = (260, -450, 1980)
+        pose[14] = (260 + offset, -500, 1960)
+        pose[15] = (262 + offset, -560, 1960)
+    if gesture == 'TANGAN_DI_WAJAH':
+        pose[13] = (150, -450, 1900)
+        pose[14] = (40, -600, 1850)
+        pose[15] = (30, -640, 1840)
+
+    return pose
+
+
+def synthetic_sequence(num_frames, num_bodies=1, segment=45, noise=8.0, seed=0):
+    """
+    Buat urutan frame berisi body sintetis
+
+    Args:
+        num_frames (int): Jumlah frame
+        num_bodies (int): Jumlah body per frame
+        segment (int): Jumlah frame per gesture
+        noise (float): Standar deviasi jitter posisi (mm)
+        seed (int): Seed random
+
+    Returns:
+        tuple: (frames, labels) dengan frames = list of list SyntheticBody dan
+               labels = gesture body pertama per frame
+    """
+    rng = np.random.RandomState(seed)
+    frames = []
+    labels = []
+
+    for t in range(num_frames):
+        bodies = []
+        for b in range(num_bodies):
+            index = (t // segment + b) % len(SYNTHETIC_GESTURES)
+            gesture = SYNTHETIC_GESTURES[index]
+            pose = gesture_pose(gesture, t % segment)
+            pose[:, 0] += (b - (num_bodies - 1) / 2) * 900
+            pose += rng.normal(0, noise, pose.shape)
+            bodies.append(SyntheticBody(b + 1, pose))
+            if b == 0:
+                labels.append(gesture)
+        frames.append(bodies)
+
+    return frames, labels
+
+
+def synthetic_images(depth_mode, seed=0):
+    """
+    Buat depth color image dan body segmentation image sintetis
+
+    Args:
+        depth_mode (str): Depth mode Azure Kinect (lihat DEPTH_RESOLUTIONS)
+        seed (int): Seed random
+
+    Returns:
+        tuple: (depth_image, body_image) masing-masing (H, W, 3) uint8
+    """
+    height, width = DEPTH_RESOLUTIONS[depth_mode]
+    rng = np.random.RandomState(seed)
+
+    depth_image = rng.randint(0, 256, (height, width, 3)).astype(np.uint8)
+
+    body_image = np.zeros((height, width, 3), dtype=np.uint8)
+    body_image[height // 4:height * 3 // 4, width // 3:width * 2 // 3] = (0, 128, 255)
+
+    return depth_image, body_image
+
+
+def synthetic_raw_images(depth_mode, num_bodies=2, seed=0):
+    """
+    Buat depth map raw dan body index map sintetis
+
+    Args:
+        depth_mode (str): Depth mode Azure Kinect (lihat DEPTH_RESOLUTIONS)
+        num_bodies (int): Jumlah body pada body index map
+        seed (int): Seed random
+
+    Returns:
+        tuple: (depth_map (H, W) uint16 dalam mm, body_index (H, W) uint8
+            dengan 255 = tanpa body)
+    """
+    height, width = DEPTH_RESOLUTIONS[depth_mode]
+    rng = np.random.RandomState(seed)
+
+    # Latar 1-5 m dengan noise, piksel tanpa data bernilai 0
+    depth_map = rng.randint(1000, 5000, (height, width)).astype(np.uint16)
+    depth_map[rng.rand(height, width) < 0.05] = 0
+
+    body_index = np.full((height, width), 255, dtype=np.uint8)
+    for body in range(num_bodies):
+        left = width * (2 * body + 1) // (2 * num_bodies + 1)
+        right = left + width // (2 * num_bodies + 1)
+        body_index[height // 4:height * 3 // 4, left:right] = body
+        depth_map[height // 4:height * 3 // 4, left:right] = 2000 + 300 * body
+
+    return depth_map, body_index
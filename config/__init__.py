@@ -5,10 +5,14 @@ Configuration package untuk Robot Gesture Control System
 from .settings import (
     KINECT_CONFIG,
     GESTURE_CONFIG,
+    JOINT_FILTER_CONFIG,
     ROBOT_CONFIG,
+    GESTURE_FEATURES,
+    GESTURE_RULES,
     GESTURE_COMMANDS,
     DISPLAY_CONFIG,
     GESTURE_COLORS,
+    BODY_INDEX_COLORS,
     COMMAND_NAMES,
     JOINT_MAP,
 )
@@ -16,10 +20,14 @@ from .settings import (
 __all__ = [
     'KINECT_CONFIG',
     'GESTURE_CONFIG',
+    'JOINT_FILTER_CONFIG',
     'ROBOT_CONFIG',
+    'GESTURE_FEATURES',
+    'GESTURE_RULES',
     'GESTURE_COMMANDS',
     'DISPLAY_CONFIG',
     'GESTURE_COLORS',
+    'BODY_INDEX_COLORS',
     'COMMAND_NAMES',
     'JOINT_MAP',
 ]
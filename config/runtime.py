@@ -0,0 +1,495 @@
+"""
+Runtime Configuration
+Snapshot konfigurasi bertipe yang bisa di-reload tanpa restart Kinect
+"""
+
+import copy
+import dataclasses
+import os
+import runpy
+import threading
+import typing
+
+from . import settings
+
+# Interval cek perubahan file config (detik) pada mode watch
+DEFAULT_WATCH_INTERVAL = 1.0
+
+# Section yang hanya dibaca saat startup (device, link robot, tampilan):
+# perubahan baru berlaku setelah program di-restart
+STARTUP_SECTIONS = ('KINECT_CONFIG', 'ROBOT_CONFIG', 'JOINT_MAP',
+                    'COMMAND_NAMES', 'GESTURE_COLORS', 'BODY_INDEX_COLORS')
+
+# Key section hot-reload yang tetap hanya dibaca saat startup
+STARTUP_KEYS = {
+    'GESTURE_CONFIG': ('max_bodies',),
+    'DISPLAY_CONFIG': ('window_name', 'show_gestures', 'fps_display',
+                       'sprite_cache_size', 'status_frame_bucket',
+                       'status_fps_bucket', 'depth_scale', 'depth_weight',
+                       'body_weight', 'body_background_color'),
+}
+
+
+class ConfigError(ValueError):
+    """Config tidak valid (key tidak dikenal, tipe salah atau nilai di luar batas)"""
+
+
+def _coerce(value, kind, name):
+    """
+    Validasi dan normalisasi satu nilai config sesuai anotasi field
+
+    Args:
+        value: Nilai dari file config
+        kind: Tipe field (int, float, bool, str, tuple, dict atau Optional)
+        name (str): Nama key untuk pesan error
+
+    Returns:
+        Nilai dengan tipe field (int -> float, list -> tuple, dict di-copy)
+
+    Raises:
+        ConfigError: Jika tipe tidak sesuai
+    """
+    if typing.get_origin(kind) is typing.Union:
+        if value is None:
+            return None
+        kind = next(arg for arg in typing.get_args(kind) if arg is not type(None))
+
+    if kind is float and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if kind is int and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if kind is tuple and isinstance(value, (list, tuple)):
+        return tuple(value)
+    if kind is dict and isinstance(value, dict):
+        return copy.deepcopy(value)
+    if kind in (bool, str) and isinstance(value, kind):
+        return value
+    raise ConfigError(f"{name} harus {kind.__name__}, bukan "
+                      f"{type(value).__name__} ({value!r})")
+
+
+class _Section:
+    """Dasar section bertipe: field = key dict config di settings.py"""
+
+    # Nama dict di config/settings.py
+    SECTION = None
+
+    # Field yang harus >= 1 / > 0
+    POSITIVE_INTS = ()
+    POSITIVE_FLOATS = ()
+
+    @classmethod
+    def from_dict(cls, values):
+        """
+        Buat section dari dict config
+
+        Args:
+            values (dict): Isi dict, mis. GESTURE_CONFIG
+
+        Returns:
+            _Section: Section bertipe (immutable)
+
+        Raises:
+            ConfigError: Jika ada key yang tidak dikenal atau hilang, tipe
+                salah, atau nilai di luar batas
+        """
+        fields = {field.name: field.type for field in dataclasses.fields(cls)}
+        unknown = sorted(set(values) - set(fields))
+        if unknown:
+            raise ConfigError(f"Key tidak dikenal di {cls.SECTION}: {unknown}")
+        missing = sorted(set(fields) - set(values))
+        if missing:
+            raise ConfigError(f"Key hilang di {cls.SECTION}: {missing}")
+
+        kwargs = {key: _coerce(values[key], kind, f"{cls.SECTION}['{key}']")
+                  for key, kind in fields.items()}
+        for key in cls.POSITIVE_INTS:
+            if kwargs[key] < 1:
+                raise ConfigError(f"{cls.SECTION}['{key}'] harus >= 1")
+        for key in cls.POSITIVE_FLOATS:
+            if kwargs[key] is not None and kwargs[key] <= 0:
+                raise ConfigError(f"{cls.SECTION}['{key}'] harus > 0")
+        return cls(**kwargs)
+
+    def to_dict(self):
+        """
+        Section sebagai dict dengan key yang sama dengan settings.py
+
+        Returns:
+            dict: Copy nilai section (aman diubah pemanggil)
+        """
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass(frozen=True)
+class GestureSettings(_Section):
+    """Threshold recognition dan hysteresis perintah (GESTURE_CONFIG)"""
+
+    SECTION = 'GESTURE_CONFIG'
+    POSITIVE_INTS = ('buffer_size', 'max_bodies')
+
+    buffer_size: int
+    raise_threshold: float
+    nose_margin: float
+    wave_threshold: float
+    face_distance_threshold: float
+    confidence_threshold: int
+    max_bodies: int
+    command_enter_frames: int
+    command_exit_frames: int
+    command_dwell_frames: int
+    command_passthrough: tuple
+    command_thresholds: dict
+
+
+@dataclasses.dataclass(frozen=True)
+class JointFilterSettings(_Section):
+    """Parameter filter One-Euro posisi joint (JOINT_FILTER_CONFIG)"""
+
+    SECTION = 'JOINT_FILTER_CONFIG'
+    POSITIVE_FLOATS = ('rate', 'min_cutoff', 'd_cutoff')
+
+    enabled: bool
+    rate: float
+    min_cutoff: float
+    beta: float
+    d_cutoff: float
+    joints: dict
+
+
+@dataclasses.dataclass(frozen=True)
+class DisplaySettings(_Section):
+    """Tampilan dan rate preview (DISPLAY_CONFIG)"""
+
+    SECTION = 'DISPLAY_CONFIG'
+    POSITIVE_FLOATS = ('frame_budget_ms', 'min_display_rate')
+
+    window_name: str
+    show_gestures: bool
+    fps_display: bool
+    sprite_cache_size: int
+    status_frame_bucket: int
+    status_fps_bucket: float
+    display_rate: typing.Optional[float]
+    adaptive_display: bool
+    frame_budget_ms: float
+    min_display_rate: float
+    depth_scale: float
+    depth_weight: float
+    body_weight: float
+    body_background_color: tuple
+
+
+@dataclasses.dataclass(frozen=True)
+class RuntimeConfig:
+    """
+    Snapshot config yang bisa diganti saat program berjalan
+
+    Snapshot tidak pernah diubah setelah dibuat; reload menghasilkan
+    snapshot baru yang diterapkan main loop ke semua komponen di antara dua
+    frame (apply_config), sehingga satu frame selalu memakai satu versi
+    config yang utuh.
+
+    Attributes:
+        gesture (GestureSettings): GESTURE_CONFIG
+        joint_filter (JointFilterSettings): JOINT_FILTER_CONFIG
+        display (DisplaySettings): DISPLAY_CONFIG
+        features (dict): GESTURE_FEATURES
+        rules (tuple): GESTURE_RULES
+        version (int): Nomor reload (0 = config startup)
+        source (str): File asal snapshot (None = config/settings.py yang di-import)
+        restart_required (tuple): Key yang berubah tetapi hanya dibaca saat
+            startup, mis. "KINECT_CONFIG['depth_mode']"
+    """
+
+    gesture: GestureSettings
+    joint_filter: JointFilterSettings
+    display: DisplaySettings
+    features: dict
+    rules: tuple
+    version: int = 0
+    source: typing.Optional[str] = None
+    restart_required: tuple = ()
+
+    @classmethod
+    def from_settings(cls):
+        """
+        Snapshot dari dict di config/settings.py (nilai saat ini)
+
+        Returns:
+            RuntimeConfig: Config startup
+        """
+        return cls.from_namespace(vars(settings))
+
+    @classmethod
+    def from_namespace(cls, namespace, base=None, version=0, source=None):
+        """
+        Buat snapshot dari namespace file config
+
+        Dict section di namespace menimpa key base (file boleh hanya berisi
+        sebagian key); GESTURE_FEATURES di-merge per feature dan GESTURE_RULES
+        diganti seluruhnya. GESTURE_COMMANDS selalu diturunkan dari rule.
+
+        Args:
+            namespace (dict): Global hasil eksekusi file config
+            base (dict, optional): Namespace dasar. Default: config/settings.py.
+            version (int): Nomor reload
+            source (str, optional): Path file config
+
+        Returns:
+            RuntimeConfig: Snapshot baru
+
+        Raises:
+            ConfigError: Jika config tidak valid
+        """
+        if base is None:
+            base = vars(settings)
+
+        def section(name):
+            override = namespace.get(name, {})
+            if not isinstance(override, dict):
+                raise ConfigError(f"{name} harus dict, bukan {type(override).__name__}")
+            merged = dict(base[name])
+            merged.update(override)
+            return merged
+
+        rules = namespace.get('GESTURE_RULES', base['GESTURE_RULES'])
+        if not isinstance(rules, (list, tuple)):
+            raise ConfigError("GESTURE_RULES harus list")
+        for rule in rules:
+            if not isinstance(rule, dict) or 'gesture' not in rule or 'command' not in rule:
+                raise ConfigError(f"Rule gesture harus dict dengan key 'gesture' "
+                                  f"dan 'command': {rule!r}")
+
+        merged = {name: section(name) for name in
+                  ('GESTURE_CONFIG', 'JOINT_FILTER_CONFIG', 'DISPLAY_CONFIG',
+                   'GESTURE_FEATURES')}
+
+        return cls(
+            gesture=GestureSettings.from_dict(merged['GESTURE_CONFIG']),
+            joint_filter=JointFilterSettings.from_dict(merged['JOINT_FILTER_CONFIG']),
+            display=DisplaySettings.from_dict(merged['DISPLAY_CONFIG']),
+            features=copy.deepcopy(merged['GESTURE_FEATURES']),
+            rules=tuple(copy.deepcopy(list(rules))),
+            version=version,
+            source=source,
+            restart_required=cls._startup_changes(namespace, merged, base),
+        )
+
+    @staticmethod
+    def _startup_changes(namespace, merged, base):
+        """Key yang berbeda dari config startup tetapi tidak bisa di-reload"""
+        changed = []
+        for name in STARTUP_SECTIONS:
+            if name not in namespace:
+                continue
+            value = namespace[name]
+            if isinstance(value, dict) and isinstance(base[name], dict):
+                changed.extend(f"{name}['{key}']" for key in value
+                               if value[key] != base[name].get(key))
+            elif value != base[name]:
+                changed.append(name)
+        for name, keys in STARTUP_KEYS.items():
+            changed.extend(f"{name}['{key}']" for key in keys
+                           if merged[name][key] != base[name][key])
+        return tuple(changed)
+
+    @property
+    def gesture_params(self):
+        """dict: Parameter rule (format GESTURE_CONFIG) untuk GestureRuleSet"""
+        return self.gesture.to_dict()
+
+    @property
+    def gesture_commands(self):
+        """dict: Gesture -> perintah robot (format GESTURE_COMMANDS)"""
+        return {rule['gesture']: rule['command'] for rule in self.rules}
+
+
+def load_config(path, base=None, version=0):
+    """
+    Eksekusi file config Python dan buat snapshot
+
+    File memakai format config/settings.py; section yang tidak didefinisikan
+    memakai nilai startup.
+
+    Args:
+        path (str): Path file config
+        base (dict, optional): Namespace dasar. Default: config/settings.py.
+        version (int): Nomor reload
+
+    Returns:
+        RuntimeConfig: Snapshot baru
+
+    Raises:
+        ConfigError: Jika config tidak valid
+        OSError: Jika file tidak bisa dibaca
+        SyntaxError: Jika file bukan Python yang valid
+    """
+    namespace = runpy.run_path(path)
+    return RuntimeConfig.from_namespace(namespace, base=base, version=version,
+                                        source=path)
+
+
+class ConfigReloader:
+    """
+    Reload config di background dan serahkan snapshot baru ke main loop
+
+    File config dieksekusi dan divalidasi di thread loader (atas permintaan
+    lewat request(), mis. tombol R, atau saat mtime file berubah pada mode
+    watch), sehingga frame loop tidak pernah menunggu I/O atau kompilasi
+    rule. Snapshot yang valid diletakkan di slot latest-wins; main loop
+    mengambilnya dengan poll() di awal frame lalu menerapkannya ke semua
+    komponen sebelum frame diproses. Config yang gagal divalidasi tidak
+    pernah sampai ke main loop.
+
+    Attributes:
+        path (str): File config yang di-reload
+        watch (bool): Reload otomatis saat file berubah
+        interval (float): Interval cek mtime (detik)
+        current (RuntimeConfig): Snapshot terakhir yang diserahkan
+        reloads (int): Jumlah reload yang berhasil
+        failures (int): Jumlah reload yang gagal
+    """
+
+    def __init__(self, path=None, watch=False, interval=DEFAULT_WATCH_INTERVAL,
+                 validate=None):
+        """
+        Inisialisasi ConfigReloader
+
+        Args:
+            path (str, optional): File config. Default: config/settings.py.
+            watch (bool): Reload otomatis saat file berubah
+            interval (float): Interval cek mtime (detik)
+            validate (callable, optional): Dipanggil dengan RuntimeConfig
+                baru di thread loader; raise ValueError untuk menolak config
+                (mis. kompilasi rule gagal)
+        """
+        self.path = path or settings.__file__
+        self.watch = watch
+        self.interval = interval
+        self.validate = validate
+
+        self.current = None
+        self.reloads = 0
+        self.failures = 0
+
+        self._base = {name: copy.deepcopy(value)
+                      for name, value in vars(settings).items()
+                      if name.isupper()}
+        self._cond = threading.Condition()
+        self._requested = False
+        self._pending = None
+        self._stopped = False
+        self._thread = None
+        self._mtime = None
+
+    def load(self):
+        """
+        Muat dan validasi config secara sinkron (config startup)
+
+        Returns:
+            RuntimeConfig: Snapshot config
+
+        Raises:
+            ConfigError: Jika config tidak valid atau ditolak validate
+        """
+        self._mtime = self._stat()
+        config = self._load(version=0)
+        self.current = config
+        return config
+
+    def _stat(self):
+        """mtime file config (None jika tidak bisa dibaca)"""
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load(self, version):
+        """Eksekusi file, buat snapshot dan jalankan validate"""
+        try:
+            config = load_config(self.path, base=self._base, version=version)
+        except ConfigError:
+            raise
+        except (OSError, SyntaxError) as e:
+            raise ConfigError(f"Gagal membaca {self.path}: {e}") from e
+        except Exception as e:
+            # File config dieksekusi sebagai Python: error apa pun = config tidak valid
+            raise ConfigError(f"Error saat eksekusi {self.path}: {e!r}") from e
+        if self.validate is not None:
+            try:
+                self.validate(config)
+            except ValueError as e:
+                raise ConfigError(str(e)) from e
+        return config
+
+    def start(self):
+        """Mulai thread loader"""
+        if self._thread is not None:
+            return
+        if self._mtime is None:
+            self._mtime = self._stat()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name='ConfigReloader',
+                                        daemon=True)
+        self._thread.start()
+
+    def request(self):
+        """Minta reload segera (tidak menunggu hasilnya)"""
+        with self._cond:
+            self._requested = True
+            self._cond.notify()
+
+    def _run(self):
+        """Loop thread loader: tunggu permintaan atau perubahan file"""
+        version = self.current.version if self.current is not None else 0
+        while True:
+            with self._cond:
+                if not self._requested and not self._stopped:
+                    self._cond.wait(self.interval if self.watch else None)
+                if self._stopped:
+                    return
+                requested = self._requested
+                self._requested = False
+
+            mtime = self._stat()
+            if not requested and (not self.watch or mtime == self._mtime):
+                continue
+            self._mtime = mtime
+
+            try:
+                config = self._load(version + 1)
+            except ConfigError as e:
+                self.failures += 1
+                print(f"❌ Reload config gagal, config lama tetap dipakai: {e}")
+                continue
+
+            version = config.version
+            with self._cond:
+                self._pending = config
+
+    def poll(self):
+        """
+        Ambil snapshot baru jika ada (dipanggil main loop di antara frame)
+
+        Returns:
+            RuntimeConfig: Snapshot baru, atau None jika tidak ada perubahan
+        """
+        if self._pending is None:
+            return None
+        with self._cond:
+            config, self._pending = self._pending, None
+        if config is None:
+            return None
+        self.current = config
+        self.reloads += 1
+        return config
+
+    def stop(self):
+        """Hentikan thread loader"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
@@ -8,6 +8,9 @@ Configuration settings untuk Robot Gesture Control System
 KINECT_CONFIG = {
     'color_resolution': 'OFF',  # OFF, 720P, 1080P, etc.
     'depth_mode': 'WFOV_2X2BINNED',  # NFOV_UNBINNED, WFOV_2X2BINNED, etc.
+    'threaded_capture': False,       # Capture di background thread (latest-frame handoff)
+    'capture_timeout': 1.0,          # Detik - timeout menunggu frame dari capture thread
+    'pykinect_path': '../../pyKinectAzure',  # Checkout pyKinectAzure jika pykinect_azure tidak ter-install
 }
 
 # ============================================================================
@@ -16,9 +19,35 @@ KINECT_CONFIG = {
 GESTURE_CONFIG = {
     'buffer_size': 15,              # Jumlah frame untuk analisis temporal
     'raise_threshold': 100,         # mm - threshold tangan terangkat
+    'nose_margin': 50,              # mm - pergelangan tangan terangkat maksimal sejauh ini di bawah hidung
     'wave_threshold': 80,           # mm - threshold variasi untuk lambai
     'face_distance_threshold': 200, # mm - threshold tangan di wajah
     'confidence_threshold': 1,      # Minimal confidence level (0=none, 1=low, 2=high)
+    'max_bodies': 6,                # Jumlah maksimal body yang dilacak bersamaan
+    # Hysteresis gesture -> perintah robot (CommandStateMachine)
+    'command_enter_frames': 3,      # Frame berturut-turut sebelum perintah baru dipakai
+    'command_exit_frames': 3,       # Frame berturut-turut tanpa perintah aktif sebelum dilepas
+    'command_dwell_frames': 5,      # Frame minimal sebuah perintah ditahan
+    'command_passthrough': ('LAMBAI',),  # Gesture yang perintahnya langsung diteruskan (STOP eksplisit)
+    # Override per gesture (key: nama gesture di GESTURE_RULES), mis.
+    # {'TANGAN_DI_WAJAH': {'enter': 6}, 'TANGAN_KANAN': {'exit': 5}}
+    'command_thresholds': {},
+}
+
+# ============================================================================
+# JOINT FILTER SETTINGS (One-Euro)
+# ============================================================================
+# Posisi joint difilter sebelum evaluasi rule agar getaran tracker di sekitar
+# threshold tidak membuat gesture (dan perintah robot) berganti setiap frame.
+JOINT_FILTER_CONFIG = {
+    'enabled': True,                # False = pakai posisi mentah
+    'rate': 30.0,                   # Hz - rate body tracking (dt filter)
+    'min_cutoff': 1.0,              # Hz - cutoff saat diam (kecil = lebih halus, lag lebih besar)
+    'beta': 0.01,                   # Kenaikan cutoff per mm/s (besar = lag kecil saat bergerak)
+    'd_cutoff': 1.0,                # Hz - cutoff untuk kecepatan
+    # Override per joint (key: nama di JOINT_MAP), mis.
+    # {'right_wrist': {'min_cutoff': 1.5, 'beta': 0.02}}
+    'joints': {},
 }
 
 # ============================================================================
@@ -26,22 +55,98 @@ GESTURE_CONFIG = {
 # ============================================================================
 ROBOT_CONFIG = {
     'port': 'COM5',                 # Serial port untuk robot (GANTI SESUAI SISTEM ANDA!)
+                                    # atau 'udp://host:port' / 'tcp://host:port' untuk robot WiFi
+    'port_match': None,             # Cari port dari HWID/description, mis. 'VID:PID=1A86:7523' (None = pakai 'port')
     'baud_rate': 9600,              # Baud rate komunikasi
     'timeout': 1,                   # Timeout koneksi (detik)
     'command_delay': 0.5,           # Delay antar perintah (detik)
+    'settle_time': 0.5,             # Jeda setelah port dibuka sebelum kirim perintah (detik)
+    'async_write': True,            # Tulis serial di thread terpisah (non-blocking)
+    'auto_reconnect': True,         # Reconnect di background saat link gagal
+    'reconnect_min_delay': 0.5,     # Detik - backoff reconnect awal
+    'reconnect_max_delay': 8.0,     # Detik - backoff reconnect maksimal
+    'protocol': 'ascii',            # 'ascii' (satu huruf) atau 'binary' (frame + seq + CRC)
+    'heartbeat_interval': 1.0,      # Detik - heartbeat saat link diam (protocol binary)
+    'ack_timeout': 1.0,             # Detik - frame tanpa echo dihitung hilang
+    'speed': None,                  # Byte speed 0-255 per frame (None = tidak dikirim)
+    # Beberapa robot dari satu recognizer (kosong = satu robot dari config di atas).
+    # Setiap entry menimpa key di atas untuk link tersebut (async_write wajib
+    # True jika lebih dari satu robot), mis.
+    # [{'name': 'car1', 'port': 'COM5'},
+    #  {'name': 'car2', 'port_match': 'VID:PID=1A86:7523', 'command_delay': 0.3}]
+    'robots': [],
 }
 
+# ============================================================================
+# GESTURE RULES
+# ============================================================================
+# Feature = AND dari beberapa kondisi. Jenis kondisi:
+#   compare  : joint.axis <op> ref.axis + value  (tanpa 'ref': joint.axis <op> value)
+#              axis: 'x', 'y', 'z' atau 'confidence'. Koordinat kamera, y positif ke bawah.
+#   distance : jarak 3D joint-ref <op> value
+#   wave     : lambaian pada trajectory x pergelangan tangan 'hand'
+#              (standar deviasi > value dan minimal 'min_changes' perubahan arah)
+# value berupa angka atau nama parameter GESTURE_CONFIG (awalan '-' untuk negatif).
+GESTURE_FEATURES = {
+    # Tangan terangkat: pergelangan tangan lebih tinggi dari bahu dan mendekati hidung
+    'right_raised': [
+        {'type': 'compare', 'joint': 'right_wrist', 'axis': 'confidence',
+         'op': '>=', 'value': 'confidence_threshold'},
+        {'type': 'compare', 'joint': 'right_wrist', 'axis': 'y', 'op': '<',
+         'ref': 'right_shoulder', 'value': '-raise_threshold'},
+        {'type': 'compare', 'joint': 'right_wrist', 'axis': 'y', 'op': '<',
+         'ref': 'nose', 'value': 'nose_margin'},
+    ],
+    'left_raised': [
+        {'type': 'compare', 'joint': 'left_wrist', 'axis': 'confidence',
+         'op': '>=', 'value': 'confidence_threshold'},
+        {'type': 'compare', 'joint': 'left_wrist', 'axis': 'y', 'op': '<',
+         'ref': 'left_shoulder', 'value': '-raise_threshold'},
+        {'type': 'compare', 'joint': 'left_wrist', 'axis': 'y', 'op': '<',
+         'ref': 'nose', 'value': 'nose_margin'},
+    ],
+    # Tangan dekat wajah
+    'right_near_face': [
+        {'type': 'distance', 'joint': 'right_wrist', 'ref': 'nose',
+         'op': '<', 'value': 'face_distance_threshold'},
+    ],
+    'left_near_face': [
+        {'type': 'distance', 'joint': 'left_wrist', 'ref': 'nose',
+         'op': '<', 'value': 'face_distance_threshold'},
+    ],
+    # Lambaian (temporal)
+    'right_waving': [
+        {'type': 'wave', 'hand': 'right', 'value': 'wave_threshold', 'min_changes': 3},
+    ],
+    'left_waving': [
+        {'type': 'wave', 'hand': 'left', 'value': 'wave_threshold', 'min_changes': 3},
+    ],
+}
+
+# Rule gesture. Urutan list = urutan gesture pada hasil deteksi.
+#   all / any : rule aktif jika semua feature 'all' dan minimal satu feature 'any' aktif
+#   group     : dalam satu group hanya rule dengan priority tertinggi yang aktif
+#   priority  : juga menentukan perintah robot jika beberapa gesture aktif
+#   default   : aktif jika tidak ada rule lain yang aktif
+GESTURE_RULES = [
+    {'gesture': 'KEDUA_TANGAN', 'all': ['right_raised', 'left_raised'],
+     'group': 'raise', 'priority': 30, 'command': 'F'},       # Forward/Maju
+    {'gesture': 'TANGAN_KANAN', 'all': ['right_raised'],
+     'group': 'raise', 'priority': 20, 'command': 'R'},       # Right/Kanan
+    {'gesture': 'TANGAN_KIRI', 'all': ['left_raised'],
+     'group': 'raise', 'priority': 10, 'command': 'L'},       # Left/Kiri
+    {'gesture': 'LAMBAI', 'any': ['right_waving', 'left_waving'],
+     'priority': 50, 'command': 'S'},                         # Stop
+    {'gesture': 'TANGAN_DI_WAJAH', 'any': ['right_near_face', 'left_near_face'],
+     'priority': 40, 'command': 'B'},                         # Backward/Mundur
+    {'gesture': 'NETRAL', 'default': True,
+     'priority': 0, 'command': 'S'},                          # Stop (default)
+]
+
 # ============================================================================
 # GESTURE TO COMMAND MAPPING
 # ============================================================================
-GESTURE_COMMANDS = {
-    'KEDUA_TANGAN': 'F',        # Forward/Maju
-    'TANGAN_KANAN': 'R',        # Right/Kanan
-    'TANGAN_KIRI': 'L',         # Left/Kiri
-    'LAMBAI': 'S',              # Stop
-    'TANGAN_DI_WAJAH': 'B',     # Backward/Mundur
-    'NETRAL': 'S',              # Stop (default)
-}
+GESTURE_COMMANDS = {rule['gesture']: rule['command'] for rule in GESTURE_RULES}
 
 # ============================================================================
 # DISPLAY SETTINGS
@@ -50,6 +155,17 @@ DISPLAY_CONFIG = {
     'window_name': 'Kontrol Robot dengan Gesture',
     'show_gestures': True,
     'fps_display': True,
+    'sprite_cache_size': 64,        # Jumlah maksimal sprite overlay di cache (LRU)
+    'status_frame_bucket': 10,      # Nomor frame di status bar dibulatkan per N frame
+    'status_fps_bucket': 0.5,       # FPS di status bar dibulatkan ke kelipatan ini
+    'display_rate': 15,             # Hz - rate preview (0 = hanya atas permintaan, None = setiap frame)
+    'adaptive_display': True,       # Turunkan rate preview jika budget frame terlampaui
+    'frame_budget_ms': 33.0,        # ms - budget waktu per frame untuk mode adaptive
+    'min_display_rate': 2,          # Hz - rate preview minimal mode adaptive
+    'depth_scale': 0.05,            # Skala depth (mm) ke 8-bit sebelum colormap
+    'depth_weight': 0.6,            # Weight depth image pada preview
+    'body_weight': 0.4,             # Weight body segmentation pada preview
+    'body_background_color': (255, 255, 255),  # Warna piksel tanpa body
 }
 
 # ============================================================================
@@ -64,6 +180,18 @@ GESTURE_COLORS = {
     'NETRAL': (128, 128, 128),          # Abu - NETRAL
 }
 
+# Warna body segmentation per body index (BGR, sama dengan body_colors pykinect;
+# index berikutnya memakai DISPLAY_CONFIG['body_background_color'])
+BODY_INDEX_COLORS = [
+    (202, 183, 42),
+    (42, 61, 202),
+    (42, 202, 183),
+    (202, 42, 61),
+    (183, 42, 202),
+    (42, 202, 61),
+    (141, 202, 42),
+]
+
 # ============================================================================
 # COMMAND NAMES
 # ============================================================================
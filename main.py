@@ -7,15 +7,26 @@ Date: November 2025
 Version: 1.0
 """
 
+import argparse
 import sys
 import time
 
 from modules import (
-    GestureRecognizer,
-    RobotController,
+    MultiBodyGestureRecognizer,
+    RobotPool,
     KinectManager,
-    Visualizer
+    SessionRecorder,
+    SessionReplay,
 )
+from modules.command_state import CommandStateMachine
+from modules.display_throttle import DisplayThrottle
+from modules.gesture_recognizer import JOINT_INDEX, HAND_TRACKS
+from modules.gesture_rules import GestureRuleSet
+from modules.gesture_statistics import GestureStatistics
+from modules.key_input import StdinKeyReader
+from modules.stage_profiler import StageProfiler
+from modules.skeleton_session import frame_timestamp_usec
+from config.runtime import ConfigReloader, ConfigError
 from config.settings import COMMAND_NAMES
 
 
@@ -35,114 +46,379 @@ def print_header():
     print()
 
 
-def print_controls():
+def print_controls(headless=False):
     """Cetak kontrol keyboard"""
+    if headless:
+        print("🎮 Kontrol Headless (ketik lalu Enter, atau kirim signal):")
+        print("  Q - Keluar dari program           (SIGTERM)")
+        print("  C - Toggle koneksi robot          (SIGUSR2)")
+        print("  S - Emergency STOP                (SIGUSR1)")
+        print("  R - Reload config                 (SIGHUP)")
+        print()
+        return
+    
     print("🎮 Kontrol Keyboard:")
     print("  Q - Keluar dari program")
     print("  C - Toggle koneksi robot (connect/disconnect)")
     print("  D - Toggle tampilan gesture info")
     print("  F - Toggle tampilan FPS")
+    print("  P - Toggle tampilan latency per stage (dengan --profile)")
+    print("  V - Refresh preview (mode --display-rate 0)")
+    print("  R - Reload config tanpa restart Kinect")
     print("  S - Emergency STOP")
     print()
 
 
-def main():
+def validate_config(config):
+    """
+    Validasi config hasil reload di thread loader: tabel rule dan threshold
+    perintah dikompilasi sekali tanpa menyentuh komponen yang sedang berjalan
+    
+    Args:
+        config (RuntimeConfig): Snapshot config baru
+        
+    Raises:
+        ValueError: Jika tabel rule atau command_thresholds tidak valid
+    """
+    GestureRuleSet(JOINT_INDEX, HAND_TRACKS, config.features, config.rules,
+                   config.gesture_params)
+    CommandStateMachine(config=config.gesture.to_dict(),
+                        gesture_commands=config.gesture_commands)
+
+
+def apply_config(config, args, recognizer, command_state, robot, throttle):
+    """
+    Terapkan snapshot config ke semua komponen di antara dua frame
+    
+    Args:
+        config (RuntimeConfig): Snapshot config (sudah divalidasi)
+        args (argparse.Namespace): Argumen program (override command line)
+        recognizer (MultiBodyGestureRecognizer): Gesture recognizer
+        command_state (CommandStateMachine): Hysteresis perintah
+        robot (RobotPool): Controller robot
+        throttle (DisplayThrottle): Penjadwal preview
+    """
+    recognizer.apply_config(config)
+    command_state.apply_config(config)
+    robot.apply_config(config)
+    throttle.apply_config(
+        config,
+        rate=args.display_rate,
+        adaptive=False if args.no_adaptive_display else None
+    )
+    
+    print(f"🔄 Config v{config.version} diterapkan dari {config.source}")
+    if config.restart_required:
+        print(f"⚠️  Hanya dibaca dari config/settings.py saat startup: "
+              f"{', '.join(config.restart_required)}")
+
+
+def handle_key(key, robot, visualizer=None, throttle=None, runtime=None):
+    """
+    Proses input kontrol
+    
+    Args:
+        key (int): Key code (-1 jika tidak ada input)
+        robot (RobotPool): Controller robot
+        visualizer (Visualizer, optional): Visualizer (None pada mode headless)
+        throttle (DisplayThrottle, optional): Penjadwal preview
+        runtime (ConfigReloader, optional): Reloader config
+        
+    Returns:
+        bool: False jika program harus berhenti
+    """
+    if key == ord('q') or key == ord('Q'):
+        # Quit
+        print("\n⏹️  Keluar dari program...")
+        return False
+        
+    elif key == ord('c') or key == ord('C'):
+        # Toggle koneksi robot (di background, frame loop tidak menunggu)
+        if robot.wants_connection:
+            robot.disconnect_async()
+        else:
+            print("🔌 Menghubungkan ke robot di background...")
+            robot.connect_async()
+            
+    elif key == ord('s') or key == ord('S'):
+        # Emergency STOP
+        robot.emergency_stop()
+        print("🛑 EMERGENCY STOP!")
+        
+    elif key == ord('r') or key == ord('R'):
+        # Reload di background, diterapkan di awal frame berikutnya
+        if runtime is not None:
+            print("🔄 Reload config...")
+            runtime.request()
+        
+    elif visualizer is None:
+        return True
+        
+    elif key == ord('d') or key == ord('D'):
+        # Toggle tampilan gesture
+        show = visualizer.toggle_gestures()
+        status = "ON" if show else "OFF"
+        print(f"👁️  Tampilan gesture: {status}")
+        
+    elif key == ord('f') or key == ord('F'):
+        # Toggle tampilan FPS
+        show = visualizer.toggle_fps()
+        status = "ON" if show else "OFF"
+        print(f"📊 Tampilan FPS: {status}")
+        
+    elif key == ord('p') or key == ord('P'):
+        # Toggle tampilan latency per stage
+        show = visualizer.toggle_profile()
+        status = "ON" if show else "OFF"
+        print(f"⏱️  Tampilan latency: {status}")
+        
+    elif key == ord('v') or key == ord('V'):
+        # Refresh preview
+        if throttle is not None:
+            throttle.request()
+    
+    return True
+
+
+def parse_args(argv=None):
+    """
+    Parse argumen command line
+    
+    Args:
+        argv (list, optional): Argumen. Default dari sys.argv.
+        
+    Returns:
+        argparse.Namespace: Argumen program
+    """
+    parser = argparse.ArgumentParser(
+        description="Kontrol robot dengan gesture recognition Azure Kinect"
+    )
+    parser.add_argument('--record', metavar='PATH',
+                        help="Rekam joint tubuh setiap frame ke file session")
+    parser.add_argument('--replay', metavar='PATH',
+                        help="Putar ulang file session sebagai pengganti Kinect")
+    parser.add_argument('--realtime', action='store_true',
+                        help="Putar session sesuai timestamp rekaman "
+                             "(default: secepat mungkin)")
+    parser.add_argument('--loop', action='store_true',
+                        help="Ulangi session dari awal saat habis")
+    parser.add_argument('--stats-out', metavar='PATH',
+                        help="Simpan statistik gesture/perintah session saat "
+                             "keluar (.json atau .csv)")
+    parser.add_argument('--headless', action='store_true',
+                        help="Tanpa tampilan: hanya skeleton, kontrol dari "
+                             "stdin/signal")
+    parser.add_argument('--profile', action='store_true',
+                        help="Ukur latency setiap tahap main loop "
+                             "(overlay + ringkasan saat keluar)")
+    parser.add_argument('--display-rate', type=float, metavar='HZ',
+                        help="Rate preview terpisah dari rate kontrol "
+                             "(0 = hanya atas permintaan dengan tombol V). "
+                             "Default dari DISPLAY_CONFIG")
+    parser.add_argument('--no-adaptive-display', action='store_true',
+                        help="Jangan turunkan rate preview saat budget "
+                             "frame terlampaui")
+    parser.add_argument('--config', metavar='PATH',
+                        help="File config yang di-reload dengan tombol R "
+                             "(format config/settings.py, boleh hanya "
+                             "sebagian section). Default: config/settings.py")
+    parser.add_argument('--watch-config', action='store_true',
+                        help="Reload otomatis saat file config berubah")
+    args = parser.parse_args(argv)
+    if args.stats_out and not args.stats_out.lower().endswith(('.json', '.csv')):
+        parser.error("--stats-out harus berakhiran .json atau .csv")
+    return args
+
+
+def main(argv=None):
     """Fungsi utama program"""
     
+    args = parse_args(argv)
+    
     # Print info program
     print_header()
     
+    # Config runtime divalidasi sebelum inisialisasi Kinect yang lama
+    runtime = ConfigReloader(args.config, watch=args.watch_config,
+                             validate=validate_config)
+    try:
+        config = runtime.load()
+    except ConfigError as e:
+        print(f"❌ Config tidak valid: {e}")
+        return
+    
     # Inisialisasi semua modul
     print("🔧 Inisialisasi sistem...")
     print()
     
-    # 1. Kinect Manager
-    kinect = KinectManager()
+    # 1. Kinect Manager (atau replay session)
+    if args.replay:
+        kinect = SessionReplay(args.replay, realtime=args.realtime, loop=args.loop)
+    else:
+        kinect = KinectManager()
     if not kinect.initialize():
         print("❌ Gagal inisialisasi Kinect. Program dihentikan.")
         return
     
+    recorder = None
+    if args.record:
+        recorder = SessionRecorder(args.record)
+        print(f"⏺️  Merekam session ke {args.record}")
+    
     print()
     
-    # 2. Robot Controller
-    robot = RobotController()
+    # 2. Robot Controller (satu atau beberapa robot dari ROBOT_CONFIG)
+    robot = RobotPool()
     print("🤖 Menghubungkan ke robot...")
     if not robot.connect():
         print("⚠️  Lanjut tanpa koneksi robot (mode simulasi)")
+        if robot.auto_reconnect:
+            print("🔁 Reconnect otomatis berjalan di background")
         print("    Edit config/settings.py untuk mengatur port robot yang benar")
     
     print()
     
     # 3. Gesture Recognizer
-    gesture_recognizer = GestureRecognizer()
+    gesture_recognizer = MultiBodyGestureRecognizer()
     print("👋 Gesture recognizer siap")
     
-    # 4. Visualizer
-    visualizer = Visualizer()
-    print("📺 Visualizer siap")
+    # Hysteresis antara gesture dan perintah (STOP tetap langsung)
+    command_state = CommandStateMachine()
+    
+    # Statistik body pengendali sepanjang session (memori tetap)
+    session_stats = GestureStatistics()
+    
+    # 4. Visualizer (mode headless: input dari stdin/signal)
+    visualizer = None
+    key_reader = None
+    if args.headless:
+        key_reader = StdinKeyReader()
+        key_reader.start()
+        print("🕶️  Mode headless: tanpa visualisasi")
+    else:
+        # OpenCV hanya dimuat jika ada preview
+        from modules import Visualizer
+        visualizer = Visualizer()
+        print("📺 Visualizer siap")
+    
+    # Rate preview terpisah dari rate recognition/kontrol
+    throttle = DisplayThrottle(
+        rate=args.display_rate,
+        adaptive=False if args.no_adaptive_display else None
+    )
+    
+    # File config selain settings.py diterapkan di atas nilai startup
+    if args.config:
+        apply_config(config, args, gesture_recognizer, command_state,
+                     robot, throttle)
+    runtime.start()
+    if args.watch_config:
+        print(f"👀 Memantau perubahan {runtime.path}")
     
     print()
-    print_controls()
+    print_controls(args.headless)
     print("=" * 70)
     print("▶️  Program dimulai. Tekan Q untuk keluar.")
     print("=" * 70)
     print()
     
+    # Profiler latency per stage (no-op jika tidak diaktifkan)
+    profiler = StageProfiler(enabled=args.profile)
+    
     # Main loop variables
     frame_number = 0
     running = True
     
     try:
         while running:
+            profiler.start_frame()
+            frame_start = time.perf_counter()
+            
+            # Config hasil reload diterapkan sebelum frame diproses
+            config = runtime.poll()
+            if config is not None:
+                apply_config(config, args, gesture_recognizer, command_state,
+                             robot, throttle)
+            
             # Update FPS
-            visualizer.update_fps()
+            if visualizer is not None:
+                visualizer.update_fps()
             
-            # Ambil frame dari Kinect
-            capture, body_frame = kinect.get_frame()
+            # Ambil frame dari Kinect (image diambil hanya jika diminta)
+            frame = kinect.get_frame_handle()
+            profiler.mark('capture')
             
-            if capture is None or body_frame is None:
+            if frame is None:
+                if kinect.is_finished():
+                    print("\n⏹️  Session replay selesai")
+                    running = False
                 continue
             
-            # Ambil depth dan body segmentation image
-            ret_depth, depth_image = kinect.get_depth_image(capture)
-            ret_body, body_image = kinect.get_body_segmentation(body_frame)
+            bodies = frame.bodies()
+            profiler.mark('bodies')
             
-            if not ret_depth or not ret_body:
-                continue
+            timestamp_usec = frame_timestamp_usec(frame.body_frame)
+            if recorder is not None:
+                recorder.record(bodies, timestamp_usec)
+                profiler.mark('record')
             
-            # Combine images
-            combined_image = visualizer.combine_images(depth_image, body_image)
+            # Frame preview: hanya frame terpilih yang di-render
+            render = visualizer is not None and throttle.should_render()
             
-            # Draw skeleton
-            try:
-                combined_image = body_frame.draw_bodies(combined_image)
-            except:
-                pass
+            if render:
+                # Ambil depth dan body index map raw (colorize di blend_raw)
+                ret_depth, depth_map = frame.raw_depth()
+                profiler.mark('depth')
+                ret_body, body_index = frame.body_index_map()
+                profiler.mark('segmentation')
+                
+                # Map yang gagal dilewati; recognition dan kontrol tetap jalan
+                combined_image = visualizer.blend_raw(
+                    depth_map if ret_depth else None,
+                    body_index if ret_body else None
+                )
+                profiler.mark('blend')
+                
+                # Draw skeleton
+                if combined_image is not None:
+                    try:
+                        combined_image = frame.body_frame.draw_bodies(combined_image)
+                    except:
+                        pass
+                profiler.mark('skeleton')
             
-            # Deteksi gesture dan kontrol robot
-            num_bodies = kinect.get_num_bodies(body_frame)
+            # Deteksi gesture semua body dalam satu pass
+            body_gestures = gesture_recognizer.recognize_bodies(bodies)
+            profiler.mark('recognition')
             current_command = 'S'  # Default: STOP
             
-            if num_bodies > 0:
-                # Ambil body pertama
-                body = kinect.get_body(body_frame, 0)
+            if body_gestures:
+                # Robot dikendalikan oleh body utama (ID tetap selama terlihat)
+                gestures = body_gestures[gesture_recognizer.primary_id]
                 
-                if body is not None:
-                    # Kenali gesture
-                    gestures = gesture_recognizer.recognize_gesture(body)
-                    
-                    # Konversi ke perintah robot
-                    current_command, sent = robot.send_gesture_command(gestures)
-                    
-                    if sent and robot.is_connected():
-                        print(f"📤 Frame {frame_number}: {COMMAND_NAMES[current_command]} ({current_command}) - Gestures: {', '.join(gestures)}")
-                    
-                    # Visualisasi gesture
-                    combined_image = visualizer.draw_gestures(
-                        combined_image, 
-                        gestures, 
-                        body_id=0
-                    )
+                # Konversi ke perintah robot, ditahan sampai stabil
+                current_command = command_state.update(
+                    robot.gesture_to_command(gestures), gestures
+                )
+                profiler.mark('command')
+                sent = robot.send_command(current_command)
+                profiler.mark('serial_write')
+                session_stats.update(gestures, current_command,
+                                     timestamp_usec / 1e6)
+                
+                if sent and robot.is_connected():
+                    print(f"📤 Frame {frame_number}: {COMMAND_NAMES[current_command]} ({current_command}) - Gestures: {', '.join(gestures)}")
+                profiler.lap()
+            
+            if render:
+                if body_gestures:
+                    # Visualisasi gesture setiap body
+                    for index, body_gesture in enumerate(body_gestures.values()):
+                        combined_image = visualizer.draw_gestures(
+                            combined_image, 
+                            body_gesture, 
+                            body_id=index
+                        )
                     
                     # Visualisasi perintah robot
                     combined_image = visualizer.draw_robot_command(
@@ -151,48 +427,40 @@ def main():
                         robot.is_connected(),
                         gestures
                     )
-            
-            # Draw status bar
-            combined_image = visualizer.draw_status(
-                combined_image,
-                frame_number,
-                robot.is_connected()
-            )
-            
-            # Tampilkan
-            visualizer.show(combined_image)
-            
-            # Handle keyboard input
-            key = visualizer.wait_key(1)
-            
-            if key == ord('q') or key == ord('Q'):
-                # Quit
-                print("\n⏹️  Keluar dari program...")
-                running = False
                 
-            elif key == ord('c') or key == ord('C'):
-                # Toggle koneksi robot
-                if robot.is_connected():
-                    robot.disconnect()
-                else:
-                    robot.connect()
-                    
-            elif key == ord('d') or key == ord('D'):
-                # Toggle tampilan gesture
-                show = visualizer.toggle_gestures()
-                status = "ON" if show else "OFF"
-                print(f"👁️  Tampilan gesture: {status}")
+                # Draw status bar
+                combined_image = visualizer.draw_status(
+                    combined_image,
+                    frame_number,
+                    robot.is_connected()
+                )
+                
+                # Overlay latency per stage
+                if profiler.enabled:
+                    combined_image = visualizer.draw_profile(
+                        combined_image,
+                        profiler.overlay_lines()
+                    )
+                profiler.mark('overlay')
                 
-            elif key == ord('f') or key == ord('F'):
-                # Toggle tampilan FPS
-                show = visualizer.toggle_fps()
-                status = "ON" if show else "OFF"
-                print(f"📊 Tampilan FPS: {status}")
+                # Tampilkan
+                visualizer.show(combined_image)
+                profiler.mark('imshow')
                 
-            elif key == ord('s') or key == ord('S'):
-                # Emergency STOP
-                robot.emergency_stop()
-                print("🛑 EMERGENCY STOP!")
+                # Handle keyboard input
+                key = visualizer.wait_key(1)
+                profiler.mark('waitkey')
+            elif visualizer is not None:
+                # Frame tanpa preview: tetap proses event window
+                key = visualizer.poll_key()
+                profiler.mark('key_input')
+            else:
+                key = key_reader.poll_key()
+                profiler.mark('key_input')
+            
+            running = handle_key(key, robot, visualizer, throttle,
+                                 runtime) and running
+            throttle.end_frame(time.perf_counter() - frame_start, render)
             
             frame_number += 1
     
@@ -214,14 +482,24 @@ def main():
             robot.emergency_stop()
             time.sleep(0.2)
         
+        runtime.stop()
         robot.disconnect()
         kinect.cleanup()
-        visualizer.cleanup()
+        if recorder is not None:
+            recorder.close()
+        if visualizer is not None:
+            visualizer.cleanup()
+        if key_reader is not None:
+            key_reader.cleanup()
         
         print()
         print("=" * 70)
         print("✅ Program selesai")
         print(f"📊 Total frame diproses: {frame_number}")
+        if visualizer is not None:
+            preview = throttle.get_stats()
+            print(f"🖼️  Frame preview: {preview['rendered_frames']} ditampilkan, "
+                  f"{preview['skipped_frames']} dilewati")
         
         # Tampilkan statistik gesture
         stats = gesture_recognizer.get_gesture_statistics()
@@ -230,6 +508,29 @@ def main():
             for gesture, percentage in sorted(stats.items(), key=lambda x: x[1], reverse=True):
                 print(f"  - {gesture}: {percentage:.1f}%")
         
+        session_stats.print_summary(COMMAND_NAMES)
+        if args.stats_out:
+            try:
+                session_stats.export(args.stats_out)
+                print(f"💾 Statistik session disimpan ke {args.stats_out}")
+            except (OSError, ValueError) as e:
+                print(f"❌ Gagal menyimpan statistik: {e}")
+        
+        commands = command_state.get_stats()
+        if commands['frames']:
+            print(f"\n🎛️  Perintah: {commands['transitions']} pergantian, "
+                  f"{commands['suppressed']} perubahan ditahan")
+        
+        if runtime.reloads or runtime.failures:
+            print(f"\n🔄 Config di-reload {runtime.reloads} kali "
+                  f"({runtime.failures} gagal)")
+        
+        # Tampilkan statistik link setiap robot
+        robot.print_link_stats()
+        
+        # Tampilkan ringkasan latency per stage
+        profiler.print_summary()
+        
         print("=" * 70)
 
 
@@ -1,15 +1,38 @@
 """
 Modules untuk Robot Gesture Control System
+
+Submodule di-import saat atributnya pertama kali diakses, sehingga
+`from modules import GestureRecognizer` tidak ikut memuat cv2, serial atau
+pykinect_azure.
 """
 
-from .gesture_recognizer import GestureRecognizer
-from .robot_controller import RobotController
-from .kinect_manager import KinectManager
-from .visualizer import Visualizer
-
-__all__ = [
-    'GestureRecognizer',
-    'RobotController',
-    'KinectManager',
-    'Visualizer',
-]
+import importlib
+
+# Nama publik -> submodule yang mendefinisikannya
+_EXPORTS = {
+    'GestureRecognizer': 'gesture_recognizer',
+    'MultiBodyGestureRecognizer': 'gesture_recognizer',
+    'RobotController': 'robot_controller',
+    'RobotPool': 'robot_pool',
+    'KinectManager': 'kinect_manager',
+    'Visualizer': 'visualizer',
+    'SessionRecorder': 'skeleton_session',
+    'SessionReplay': 'skeleton_session',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import submodule pemilik atribut saat pertama kali diakses (PEP 562)"""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Atribut modul termasuk nama yang belum di-import"""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,199 @@
+"""
+Command State Module
+Hysteresis dan dwell time antara hasil recognition dan perintah robot
+"""
+
+from config.settings import GESTURE_CONFIG, GESTURE_COMMANDS
+
+
+class CommandStateMachine:
+    """
+    State machine perintah robot dengan hysteresis per gesture
+
+    Perintah kandidat (hasil gesture_to_command setiap frame) baru menjadi
+    perintah aktif jika:
+      - kandidat muncul berturut-turut minimal 'enter' frame (milik gesture
+        kandidat),
+      - perintah aktif sudah hilang berturut-turut minimal 'exit' frame
+        (milik gesture perintah aktif), dan
+      - perintah aktif sudah ditahan minimal dwell_frames frame.
+    Perintah dari gesture passthrough (LAMBAI = STOP eksplisit) selalu
+    diteruskan langsung; STOP karena NETRAL atau tanpa gesture tetap melewati
+    hysteresis seperti perintah lain.
+
+    Threshold diatur per gesture dan dipetakan ke perintah lewat
+    GESTURE_COMMANDS; jika beberapa gesture menghasilkan perintah yang sama,
+    dipakai threshold terbesar. Setiap update O(1).
+
+    Attributes:
+        command (str): Perintah aktif
+        enter_frames (dict): Perintah -> frame berturut-turut untuk masuk
+        exit_frames (dict): Perintah -> frame berturut-turut untuk keluar
+        dwell_frames (int): Frame minimal sebuah perintah ditahan
+        passthrough (dict): Gesture passthrough -> perintah yang diteruskan
+            tanpa menunggu
+        frames (int): Jumlah update
+        transitions (int): Jumlah pergantian perintah aktif
+        suppressed (int): Jumlah perubahan kandidat yang ditahan dan tidak
+            pernah menjadi perintah aktif
+        delayed_frames (int): Jumlah frame dengan perintah aktif != kandidat
+    """
+
+    def __init__(self, initial='S', config=None, gesture_commands=None):
+        """
+        Inisialisasi CommandStateMachine
+
+        Args:
+            initial (str): Perintah awal
+            config (dict, optional): Parameter (key command_*). Default GESTURE_CONFIG.
+            gesture_commands (dict, optional): Gesture -> perintah.
+                Default GESTURE_COMMANDS.
+        """
+        self.configure(config, gesture_commands)
+        self._initial = initial
+        self.reset()
+
+    def configure(self, config=None, gesture_commands=None):
+        """
+        Ganti threshold tanpa mereset perintah aktif dan counter
+
+        Threshold baru berlaku mulai update berikutnya; kandidat yang sedang
+        dihitung tetap dilanjutkan.
+
+        Args:
+            config (dict, optional): Parameter (key command_*). Default GESTURE_CONFIG.
+            gesture_commands (dict, optional): Gesture -> perintah.
+                Default GESTURE_COMMANDS.
+
+        Raises:
+            ValueError: Jika command_thresholds atau command_passthrough
+                merujuk gesture yang tidak dikenal (threshold lama tetap dipakai)
+        """
+        if config is None:
+            config = GESTURE_CONFIG
+        if gesture_commands is None:
+            gesture_commands = GESTURE_COMMANDS
+
+        overrides = config.get('command_thresholds', {})
+        unknown = set(overrides) - set(gesture_commands)
+        if unknown:
+            raise ValueError(f"Gesture tidak dikenal di command_thresholds: "
+                             f"{sorted(unknown)}")
+        unknown = set(config['command_passthrough']) - set(gesture_commands)
+        if unknown:
+            raise ValueError(f"Gesture tidak dikenal di command_passthrough: "
+                             f"{sorted(unknown)}")
+
+        enter_frames = {}
+        exit_frames = {}
+        for gesture, command in gesture_commands.items():
+            override = overrides.get(gesture, {})
+            enter = override.get('enter', config['command_enter_frames'])
+            exit_ = override.get('exit', config['command_exit_frames'])
+            enter_frames[command] = max(enter, enter_frames.get(command, 0))
+            exit_frames[command] = max(exit_, exit_frames.get(command, 0))
+
+        self.enter_frames = enter_frames
+        self.exit_frames = exit_frames
+        self.dwell_frames = config['command_dwell_frames']
+        self.passthrough = {gesture: gesture_commands[gesture]
+                            for gesture in config['command_passthrough']}
+
+    def apply_config(self, config):
+        """
+        Terapkan RuntimeConfig hasil reload (lihat config.runtime)
+
+        Args:
+            config (RuntimeConfig): Snapshot config baru
+        """
+        self.configure(config.gesture.to_dict(), config.gesture_commands)
+
+    def reset(self):
+        """Kembali ke perintah awal dan kosongkan counter"""
+        self.command = self._initial
+        self.frames = 0
+        self.transitions = 0
+        self.suppressed = 0
+        self.delayed_frames = 0
+
+        self._held = 0              # Frame sejak transisi terakhir
+        self._absent = 0            # Frame berturut-turut tanpa perintah aktif
+        self._pending = None        # Kandidat yang sedang dihitung
+        self._pending_count = 0
+
+    def update(self, candidate, gestures=()):
+        """
+        Proses kandidat satu frame
+
+        Args:
+            candidate (str): Perintah hasil gesture_to_command
+            gestures (list, optional): Gesture frame ini; kandidat diteruskan
+                langsung jika berasal dari gesture passthrough
+
+        Returns:
+            str: Perintah aktif
+        """
+        self.frames += 1
+        self._held += 1
+
+        if candidate == self.command:
+            self._drop_pending()
+            self._absent = 0
+            return self.command
+
+        if self._is_passthrough(candidate, gestures):
+            self._drop_pending()
+            self._switch(candidate)
+            return self.command
+
+        self._absent += 1
+        if candidate != self._pending:
+            self._drop_pending()
+            self._pending = candidate
+        self._pending_count += 1
+
+        if (self._pending_count >= self.enter_frames.get(candidate, 1) and
+                self._absent >= self.exit_frames.get(self.command, 1) and
+                self._held >= self.dwell_frames):
+            self._pending = None
+            self._pending_count = 0
+            self._switch(candidate)
+        else:
+            self.delayed_frames += 1
+
+        return self.command
+
+    def _is_passthrough(self, candidate, gestures):
+        """Cek apakah kandidat berasal dari gesture passthrough"""
+        for gesture in gestures:
+            if self.passthrough.get(gesture) == candidate:
+                return True
+        return False
+
+    def _drop_pending(self):
+        """Buang kandidat yang tidak jadi dipakai"""
+        if self._pending is not None:
+            self.suppressed += 1
+            self._pending = None
+            self._pending_count = 0
+
+    def _switch(self, command):
+        """Ganti perintah aktif"""
+        self.command = command
+        self.transitions += 1
+        self._held = 0
+        self._absent = 0
+
+    def get_stats(self):
+        """
+        Statistik state machine
+
+        Returns:
+            dict: frames, transitions, suppressed, delayed_frames
+        """
+        return {
+            'frames': self.frames,
+            'transitions': self.transitions,
+            'suppressed': self.suppressed,
+            'delayed_frames': self.delayed_frames,
+        }
@@ -0,0 +1,188 @@
+"""
+Depth Preview Module
+Colorize depth + body index map dan blend dalam satu kernel lookup table
+"""
+
+import sys
+
+import cv2
+import numpy as np
+
+from config.settings import DISPLAY_CONFIG, BODY_INDEX_COLORS
+from .kinect_manager import BODY_INDEX_BACKGROUND
+
+
+def colorize_depth(depth, scale=None):
+    """
+    Colorize depth 16-bit seperti pykinect (convertScaleAbs + COLORMAP_JET)
+
+    Args:
+        depth (np.ndarray): Depth map uint16 (mm)
+        scale (float, optional): Skala depth ke 8-bit. Default dari config.
+
+    Returns:
+        np.ndarray: Depth color image (H, W, 3) uint8
+    """
+    if scale is None:
+        scale = DISPLAY_CONFIG['depth_scale']
+    return cv2.applyColorMap(cv2.convertScaleAbs(depth, alpha=scale),
+                             cv2.COLORMAP_JET)
+
+
+def body_index_palette(colors=None, background=None):
+    """
+    Palet warna (256, 3) untuk body index map
+
+    Args:
+        colors (list, optional): Warna BGR per body index; index di luar
+            list memakai warna background. Default BODY_INDEX_COLORS.
+        background (tuple, optional): Warna piksel tanpa body. Default dari config.
+
+    Returns:
+        np.ndarray: Palet uint8 (256, 3)
+    """
+    if colors is None:
+        colors = BODY_INDEX_COLORS
+    if background is None:
+        background = DISPLAY_CONFIG['body_background_color']
+
+    palette = np.empty((256, 3), dtype=np.uint8)
+    palette[:] = background
+    palette[:len(colors)] = colors
+    return palette
+
+
+def colorize_body_index(body_index, palette=None):
+    """
+    Colorize body index map dengan palet
+
+    Args:
+        body_index (np.ndarray): Body index map uint8
+        palette (np.ndarray, optional): Palet (256, 3). Default body_index_palette().
+
+    Returns:
+        np.ndarray: Body segmentation image (H, W, 3) uint8
+    """
+    if palette is None:
+        palette = body_index_palette()
+    return np.dstack([cv2.LUT(body_index, palette[:, i]) for i in range(3)])
+
+
+class PreviewBlender:
+    """
+    Kernel colorize-and-blend depth + body index dengan buffer reusable
+
+    Hasil colorize depth (256 level setelah skala) dan colorize body index
+    (256 index) di-blend sekali ke tabel 256 x 256 warna. Per frame cukup:
+    skala depth ke 8-bit, gabungkan dengan body index menjadi kode 16-bit,
+    lalu satu lookup tabel. Semua buffer dialokasikan sekali per resolusi,
+    dan hasilnya identik dengan colorize_depth + colorize_body_index +
+    cv2.addWeighted.
+
+    Image hasil blend() adalah buffer yang dipakai ulang pada frame
+    berikutnya; salin jika perlu disimpan.
+
+    Attributes:
+        depth_scale (float): Skala depth ke 8-bit
+        depth_weight (float): Weight depth image
+        body_weight (float): Weight body image
+        lut (np.ndarray): Tabel warna hasil blend (256, 256, 3) [depth, index]
+    """
+
+    def __init__(self, depth_scale=None, depth_weight=None, body_weight=None,
+                 palette=None):
+        """
+        Inisialisasi PreviewBlender
+
+        Args:
+            depth_scale (float, optional): Skala depth. Default dari config.
+            depth_weight (float, optional): Weight depth. Default dari config.
+            body_weight (float, optional): Weight body. Default dari config.
+            palette (np.ndarray, optional): Palet body index (256, 3)
+        """
+        if depth_scale is None:
+            depth_scale = DISPLAY_CONFIG['depth_scale']
+        if depth_weight is None:
+            depth_weight = DISPLAY_CONFIG['depth_weight']
+        if body_weight is None:
+            body_weight = DISPLAY_CONFIG['body_weight']
+        if palette is None:
+            palette = body_index_palette()
+
+        self.depth_scale = depth_scale
+        self.depth_weight = depth_weight
+        self.body_weight = body_weight
+
+        # Blend semua kombinasi (level depth, body index) dengan operasi yang
+        # sama seperti jalur per frame agar hasilnya bit-exact
+        levels = np.arange(256, dtype=np.uint8).reshape(1, 256)
+        depth_colors = cv2.applyColorMap(levels, cv2.COLORMAP_JET)[0]
+        self.lut = cv2.addWeighted(
+            np.repeat(depth_colors[:, np.newaxis], 256, axis=1), depth_weight,
+            np.repeat(palette[np.newaxis], 256, axis=0), body_weight,
+            0
+        )
+
+        # Tabel dipak BGRA uint32 agar lookup per piksel satu elemen
+        packed = np.zeros((256 * 256, 4), dtype=np.uint8)
+        packed[:, :3] = self.lut.reshape(-1, 3)
+        self._packed = packed.view(np.uint32).ravel()
+
+        self._shape = None
+
+    def _allocate(self, shape):
+        """Alokasikan buffer kerja untuk resolusi baru"""
+        height, width = shape
+        self._level = np.empty((height, width), dtype=np.uint8)
+        self._code = np.empty((height, width), dtype=np.uint16)
+        self._index = np.empty((height, width), dtype=np.intp)
+        self._packed_out = np.empty((height, width), dtype=np.uint32)
+        self._output = np.empty((height, width, 3), dtype=np.uint8)
+        self._background = np.full((height, width), BODY_INDEX_BACKGROUND,
+                                   dtype=np.uint8)
+
+        # Kode = level << 8 | index; urutan byte mengikuti endianness
+        self._code_bytes = self._code.view(np.uint8).reshape(height, width, 2)
+        self._little_endian = sys.byteorder == 'little'
+        self._shape = shape
+
+    def blend(self, depth, body_index):
+        """
+        Colorize dan blend depth map dengan body index map
+
+        Map yang None diganti map kosong (depth 0 / tanpa body).
+
+        Args:
+            depth (np.ndarray): Depth map uint16 (H, W), atau None
+            body_index (np.ndarray): Body index map uint8 (H, W), atau None
+
+        Returns:
+            np.ndarray: Preview BGR (H, W, 3) uint8 (buffer reusable),
+                None jika kedua map None
+        """
+        if depth is None and body_index is None:
+            return None
+
+        shape = (depth if depth is not None else body_index).shape[:2]
+        if shape != self._shape:
+            self._allocate(shape)
+
+        if depth is None:
+            self._level.fill(0)
+        else:
+            cv2.convertScaleAbs(depth, self._level, self.depth_scale)
+        if body_index is None:
+            body_index = self._background
+
+        if self._little_endian:
+            cv2.merge([body_index, self._level], self._code_bytes)
+        else:
+            cv2.merge([self._level, body_index], self._code_bytes)
+
+        # np.take mengonversi index non-intp ke array sementara; salin ke
+        # buffer intp agar tidak ada alokasi per frame
+        np.copyto(self._index, self._code)
+        np.take(self._packed, self._index, out=self._packed_out, mode='clip')
+        bgra = self._packed_out.view(np.uint8).reshape(shape + (4,))
+        cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=self._output)
+        return self._output
@@ -0,0 +1,182 @@
+"""
+Display Throttle Module
+Mengatur rate preview terpisah dari rate recognition/kontrol
+"""
+
+import time
+
+from config.settings import DISPLAY_CONFIG
+
+
+class DisplayThrottle:
+    """
+    Penjadwal frame preview
+
+    Main loop tetap memproses setiap frame untuk recognition dan kontrol
+    robot, tetapi blend, skeleton, overlay dan imshow hanya dijalankan pada
+    frame yang dipilih throttle (display_rate Hz, atau atas permintaan jika
+    display_rate = 0).
+
+    Mode adaptive menurunkan rate preview (multiplicative decrease) saat
+    frame yang di-render melewati frame_budget_ms, dan menaikkannya kembali
+    perlahan (additive increase) sampai target saat waktu frame kembali
+    di bawah budget.
+
+    Attributes:
+        target_rate (float): Rate preview yang diminta (Hz), None = setiap frame
+        rate (float): Rate preview saat ini (Hz)
+        adaptive (bool): Aktifkan penyesuaian rate otomatis
+        frame_budget (float): Budget waktu per frame (detik)
+        rendered_frames (int): Jumlah frame yang di-render
+        skipped_frames (int): Jumlah frame yang tidak di-render
+    """
+
+    # Faktor penyesuaian rate adaptive
+    DECREASE_FACTOR = 0.7
+    INCREASE_STEP = 0.5
+    HEADROOM = 0.8
+
+    def __init__(self, rate=None, adaptive=None, frame_budget_ms=None,
+                 min_rate=None, clock=time.perf_counter):
+        """
+        Inisialisasi DisplayThrottle
+
+        Args:
+            rate (float, optional): Rate preview (Hz). 0 = hanya atas
+                permintaan, None = dari config (None di config = setiap frame).
+            adaptive (bool, optional): Mode adaptive. Default dari config.
+            frame_budget_ms (float, optional): Budget per frame. Default dari config.
+            min_rate (float, optional): Rate minimal mode adaptive. Default dari config.
+            clock (callable): Sumber waktu monotonic (detik)
+        """
+        self.rendered_frames = 0
+        self.skipped_frames = 0
+
+        self._clock = clock
+        self._next = None
+        self._last_call = None
+        self._frame_interval = 0.0
+
+        self.configure(rate, adaptive, frame_budget_ms, min_rate)
+
+    def configure(self, rate=None, adaptive=None, frame_budget_ms=None,
+                  min_rate=None, config=None):
+        """
+        Ganti rate dan parameter adaptive (frame berikutnya selalu
+        ditampilkan lalu dijadwalkan ulang dengan rate baru)
+
+        Args:
+            rate (float, optional): Rate preview (Hz), lihat __init__
+            adaptive (bool, optional): Mode adaptive
+            frame_budget_ms (float, optional): Budget per frame
+            min_rate (float, optional): Rate minimal mode adaptive
+            config (dict, optional): Sumber nilai yang tidak diisi.
+                Default DISPLAY_CONFIG.
+        """
+        if config is None:
+            config = DISPLAY_CONFIG
+        if rate is None:
+            rate = config['display_rate']
+        if adaptive is None:
+            adaptive = config['adaptive_display']
+        if frame_budget_ms is None:
+            frame_budget_ms = config['frame_budget_ms']
+        if min_rate is None:
+            min_rate = config['min_display_rate']
+
+        self.target_rate = rate
+        self.rate = rate
+        self.adaptive = adaptive and bool(rate)
+        self.frame_budget = frame_budget_ms / 1000.0
+        self.min_rate = min(min_rate, rate) if rate else min_rate
+        self._requested = True          # Frame pertama selalu ditampilkan
+
+    def apply_config(self, config, rate=None, adaptive=None):
+        """
+        Terapkan DISPLAY_CONFIG dari RuntimeConfig hasil reload
+
+        Args:
+            config (RuntimeConfig): Snapshot config baru
+            rate (float, optional): Override rate (mis. dari command line)
+            adaptive (bool, optional): Override mode adaptive
+        """
+        self.configure(rate, adaptive, config=config.display.to_dict())
+
+    def request(self):
+        """Minta frame berikutnya ditampilkan (mode on-demand / refresh)"""
+        self._requested = True
+
+    def should_render(self):
+        """
+        Tentukan apakah frame saat ini perlu di-render
+
+        Returns:
+            bool: True jika frame harus di-render dan ditampilkan
+        """
+        now = self._clock()
+
+        # Estimasi interval frame untuk toleransi jadwal
+        if self._last_call is not None:
+            interval = now - self._last_call
+            self._frame_interval += 0.1 * (interval - self._frame_interval)
+        self._last_call = now
+
+        if self._requested:
+            self._requested = False
+            self._schedule(now)
+            return self._rendered()
+
+        if self.rate is None:
+            return self._rendered()
+
+        if not self.rate or now + 0.5 * self._frame_interval < self._next:
+            self.skipped_frames += 1
+            return False
+
+        self._schedule(now)
+        return self._rendered()
+
+    def _schedule(self, now):
+        """Jadwalkan frame preview berikutnya"""
+        if not self.rate:
+            return
+        period = 1.0 / self.rate
+        if self._next is None or self._next + period <= now:
+            self._next = now + period
+        else:
+            self._next += period
+
+    def _rendered(self):
+        """Catat frame yang di-render"""
+        self.rendered_frames += 1
+        return True
+
+    def end_frame(self, elapsed, rendered):
+        """
+        Laporkan durasi satu iterasi main loop (untuk mode adaptive)
+
+        Args:
+            elapsed (float): Durasi iterasi (detik)
+            rendered (bool): Apakah frame ini di-render
+        """
+        if not self.adaptive or not rendered:
+            return
+
+        if elapsed > self.frame_budget:
+            self.rate = max(self.min_rate, self.rate * self.DECREASE_FACTOR)
+        elif elapsed < self.frame_budget * self.HEADROOM:
+            self.rate = min(self.target_rate, self.rate + self.INCREASE_STEP)
+
+    def get_stats(self):
+        """
+        Statistik throttle
+
+        Returns:
+            dict: rate, target_rate, rendered_frames, skipped_frames
+        """
+        return {
+            'rate': self.rate,
+            'target_rate': self.target_rate,
+            'rendered_frames': self.rendered_frames,
+            'skipped_frames': self.skipped_frames,
+        }
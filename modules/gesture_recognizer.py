@@ -5,198 +5,282 @@ Mendeteksi gerakan tubuh dari keypoints Azure Kinect
 
 from collections import deque
 import numpy as np
-import sys
-sys.path.insert(1, '../../pyKinectAzure')
 
-from config.settings import GESTURE_CONFIG, JOINT_MAP
+from config.settings import GESTURE_CONFIG, JOINT_FILTER_CONFIG, JOINT_MAP
+from .gesture_rules import GestureRuleSet
+from .gesture_statistics import GestureStatistics
+from .joint_filter import JointFilter
+from .kinect_manager import body_id
+from .wave_buffer import WaveBuffer
+
+
+# Kolom pada array keypoints (num_joints, 4)
+KP_X, KP_Y, KP_Z, KP_CONF = 0, 1, 2, 3
+
+# Track trajectory pergelangan tangan di WaveBuffer
+HAND_TRACKS = {'right': 0, 'left': 1}
+
+# Urutan joint pada array keypoints mengikuti urutan JOINT_MAP
+JOINT_NAMES = tuple(JOINT_MAP)
+JOINT_INDEX = {name: i for i, name in enumerate(JOINT_NAMES)}
 
 
 class GestureRecognizer:
     """
     Class untuk mengenali gerakan berdasarkan keypoints tubuh
     
+    Keypoints disimpan sebagai array float32 berukuran (num_joints, 4)
+    berisi kolom x, y, z dan confidence. Baris ke-i adalah joint
+    JOINT_NAMES[i]; joint yang tidak tersedia bernilai NaN. Jika
+    JOINT_FILTER_CONFIG['enabled'], posisi difilter JointFilter (One-Euro)
+    sebelum masuk wave buffer dan rule.
+    
     Attributes:
         buffer_size (int): Ukuran buffer untuk analisis temporal
-        keypoints_buffer (deque): Buffer untuk menyimpan keypoints
-        gesture_history (deque): History gesture yang terdeteksi
+        wave_buffer (WaveBuffer): Ring buffer posisi x pergelangan tangan
+        joint_filter (JointFilter): Filter posisi joint (None jika nonaktif)
+        rules (GestureRuleSet): Evaluator rule dari GESTURE_FEATURES/GESTURE_RULES
+        gesture_history (deque): History gesture terakhir yang terdeteksi
+        statistics (GestureStatistics): Jumlah frame per gesture sepanjang session
     """
     
-    def __init__(self, buffer_size=None):
+    def __init__(self, buffer_size=None, smoothing=None):
         """
         Inisialisasi GestureRecognizer
         
         Args:
             buffer_size (int, optional): Ukuran buffer. Default dari config.
+            smoothing (bool, optional): Filter posisi joint.
+                Default JOINT_FILTER_CONFIG['enabled'].
         """
         if buffer_size is None:
             buffer_size = GESTURE_CONFIG['buffer_size']
+        if smoothing is None:
+            smoothing = JOINT_FILTER_CONFIG['enabled']
             
         self.buffer_size = buffer_size
-        self.keypoints_buffer = deque(maxlen=buffer_size)
         self.gesture_history = deque(maxlen=30)
+        self.statistics = GestureStatistics()
+        
+        # Index joint di-resolve sekali dari JOINT_MAP
+        self.num_joints = len(JOINT_NAMES)
+        self._joint_ids = tuple(JOINT_MAP[name] for name in JOINT_NAMES)
+        self._joint_index = np.array(self._joint_ids, dtype=np.intp)
+        self._wrists = [JOINT_INDEX[f'{hand}_wrist'] for hand in HAND_TRACKS]
+        
+        # Buffer keypoints frame terakhir dan trajectory pergelangan tangan
+        # (dialokasikan sekali)
+        self.keypoints = np.full((self.num_joints, 4), np.nan, dtype=np.float32)
+        self.wave_buffer = WaveBuffer(len(HAND_TRACKS), buffer_size)
+        self.joint_filter = JointFilter(JOINT_NAMES) if smoothing else None
         
         # Load threshold dari config
         self.raise_threshold = GESTURE_CONFIG['raise_threshold']
         self.wave_threshold = GESTURE_CONFIG['wave_threshold']
         self.face_distance_threshold = GESTURE_CONFIG['face_distance_threshold']
         self.confidence_threshold = GESTURE_CONFIG['confidence_threshold']
+        
+        # Tabel rule gesture dikompilasi sekali menjadi evaluator vectorized
+        self.rules = GestureRuleSet(JOINT_INDEX, HAND_TRACKS)
+        
+        # (rules, keypoints, features) evaluasi terakhir predicate is_*
+        self._feature_cache = None
+    
+    def apply_config(self, config):
+        """
+        Terapkan RuntimeConfig hasil reload (dipanggil di antara dua frame)
+        
+        Rule dikompilasi ulang dengan threshold baru dan parameter filter
+        joint diganti tanpa mereset state filter. Trajectory lambaian hanya
+        dikosongkan jika buffer_size berubah. max_bodies hanya dibaca saat
+        startup.
+        
+        Args:
+            config (RuntimeConfig): Snapshot config baru
+        
+        Raises:
+            ValueError: Jika tabel rule tidak valid (config lama tetap dipakai)
+        """
+        rules = GestureRuleSet(JOINT_INDEX, HAND_TRACKS, config.features,
+                               config.rules, config.gesture_params)
+        gesture = config.gesture
+        
+        self.rules = rules
+        self.raise_threshold = gesture.raise_threshold
+        self.wave_threshold = gesture.wave_threshold
+        self.face_distance_threshold = gesture.face_distance_threshold
+        self.confidence_threshold = gesture.confidence_threshold
+        
+        if gesture.buffer_size != self.buffer_size:
+            self.buffer_size = gesture.buffer_size
+            self.wave_buffer = WaveBuffer(self.wave_buffer.num_tracks,
+                                          self.buffer_size)
+        
+        filter_config = config.joint_filter.to_dict()
+        if not filter_config['enabled']:
+            self.joint_filter = None
+        elif self.joint_filter is None:
+            num_tracks = self.wave_buffer.num_tracks // len(HAND_TRACKS)
+            self.joint_filter = JointFilter(JOINT_NAMES, num_tracks, filter_config)
+        else:
+            self.joint_filter.configure(filter_config)
     
-    def extract_keypoints(self, body):
+    def extract_keypoints(self, body, out=None):
         """
         Ekstrak keypoints penting dari body object
         
         Args:
             body: Body object dari Azure Kinect
+            out (np.ndarray, optional): Array (num_joints, 4) tujuan.
+                Jika None, array baru dialokasikan.
             
         Returns:
-            dict: Dictionary berisi keypoints dengan struktur:
-                  {'joint_name': {'x': float, 'y': float, 'z': float, 'confidence': int}}
+            np.ndarray: Array float32 (num_joints, 4) berisi x, y, z, confidence
+                        dengan urutan baris sesuai JOINT_NAMES
         """
+        if out is None:
+            out = np.empty((self.num_joints, 4), dtype=np.float32)
+        
+        # Body dari replay session sudah berupa array joint
+        positions = getattr(body, 'positions', None)
+        if positions is not None:
+            out[:, :KP_CONF] = positions[self._joint_index]
+            out[:, KP_CONF] = body.confidences[self._joint_index]
+            return out
+        
         joints = body.joints
-        keypoints = {}
-        
-        for name, joint_id in JOINT_MAP.items():
-            if joints[joint_id] is not None:
-                pos = joints[joint_id].position
-                conf = joints[joint_id].confidence_level
-                keypoints[name] = {
-                    'x': pos.x,
-                    'y': pos.y,
-                    'z': pos.z,
-                    'confidence': conf
-                }
+        
+        for row, joint_id in enumerate(self._joint_ids):
+            joint = joints[joint_id]
+            if joint is not None:
+                pos = joint.position
+                out[row] = (pos.x, pos.y, pos.z, joint.confidence_level)
             else:
-                keypoints[name] = None
+                out[row] = np.nan
+        
+        return out
+    
+    def _features(self, keypoints):
+        """
+        Evaluasi semua feature rule untuk keypoints satu body
+        
+        Hasil di-cache per isi keypoints (dan tabel rule), sehingga beberapa
+        predicate is_* untuk body yang sama hanya mengevaluasi rule sekali.
+        
+        Args:
+            keypoints (np.ndarray): Array keypoints (num_joints, 4)
+            
+        Returns:
+            np.ndarray: Boolean (num_features,) sesuai urutan rules.features
+        """
+        cache = self._feature_cache
+        if (cache is not None and cache[0] is self.rules and
+                np.array_equal(cache[1], keypoints, equal_nan=True)):
+            return cache[2]
+        
+        features = self.rules.evaluate_features(keypoints[np.newaxis])[0]
+        self._feature_cache = (self.rules, keypoints.copy(), features)
+        return features
+    
+    def _feature(self, keypoints, name):
+        """
+        Nilai satu feature rule untuk keypoints satu body
         
-        return keypoints
+        Args:
+            keypoints (np.ndarray): Array keypoints (num_joints, 4)
+            name (str): Nama feature di GESTURE_FEATURES
+            
+        Returns:
+            bool: Nilai feature
+        """
+        return bool(self._features(keypoints)[self.rules.feature_index(name)])
     
     def is_right_hand_raised(self, keypoints):
         """
         Deteksi apakah tangan kanan terangkat
         
         Args:
-            keypoints (dict): Dictionary keypoints
+            keypoints (np.ndarray): Array keypoints (num_joints, 4)
             
         Returns:
             bool: True jika tangan kanan terangkat
         """
-        if (keypoints['right_wrist'] is None or 
-            keypoints['right_shoulder'] is None or
-            keypoints['nose'] is None):
-            return False
-        
-        if keypoints['right_wrist']['confidence'] < self.confidence_threshold:
-            return False
-        
-        wrist_y = keypoints['right_wrist']['y']
-        shoulder_y = keypoints['right_shoulder']['y']
-        nose_y = keypoints['nose']['y']
-        
-        # Tangan dianggap terangkat jika pergelangan tangan
-        # lebih tinggi dari bahu dan mendekati hidung
-        return (wrist_y < shoulder_y - self.raise_threshold and 
-                wrist_y < nose_y + 50)
+        return self._feature(keypoints, 'right_raised')
     
     def is_left_hand_raised(self, keypoints):
         """
         Deteksi apakah tangan kiri terangkat
         
         Args:
-            keypoints (dict): Dictionary keypoints
+            keypoints (np.ndarray): Array keypoints (num_joints, 4)
             
         Returns:
             bool: True jika tangan kiri terangkat
         """
-        if (keypoints['left_wrist'] is None or 
-            keypoints['left_shoulder'] is None or
-            keypoints['nose'] is None):
-            return False
-        
-        if keypoints['left_wrist']['confidence'] < self.confidence_threshold:
-            return False
-        
-        wrist_y = keypoints['left_wrist']['y']
-        shoulder_y = keypoints['left_shoulder']['y']
-        nose_y = keypoints['nose']['y']
-        
-        return (wrist_y < shoulder_y - self.raise_threshold and 
-                wrist_y < nose_y + 50)
+        return self._feature(keypoints, 'left_raised')
     
     def is_both_hands_raised(self, keypoints):
         """
         Deteksi apakah kedua tangan terangkat
         
         Args:
-            keypoints (dict): Dictionary keypoints
+            keypoints (np.ndarray): Array keypoints (num_joints, 4)
             
         Returns:
             bool: True jika kedua tangan terangkat
         """
-        return (self.is_right_hand_raised(keypoints) and 
-                self.is_left_hand_raised(keypoints))
+        features = self._features(keypoints)
+        return bool(features[self.rules.feature_index('right_raised')] and
+                    features[self.rules.feature_index('left_raised')])
     
     def detect_waving(self, hand='right'):
         """
         Deteksi lambaian tangan (memerlukan data temporal)
         
+        Statistik diambil dari WaveBuffer yang di-update O(1) per frame.
+        
         Args:
             hand (str): 'right' atau 'left'
             
         Returns:
             bool: True jika terdeteksi lambaian
         """
-        if len(self.keypoints_buffer) < 10:
-            return False
-        
-        wrist_key = f'{hand}_wrist'
-        
-        # Ambil posisi x pergelangan tangan dari buffer
-        x_positions = []
-        for kp in self.keypoints_buffer:
-            if kp[wrist_key] is not None:
-                x_positions.append(kp[wrist_key]['x'])
-        
-        if len(x_positions) < 10:
-            return False
-        
-        # Hitung variasi posisi (standar deviasi)
-        std_x = np.std(x_positions)
-        
-        # Deteksi perubahan arah (zero-crossing)
-        differences = np.diff(x_positions)
-        sign_changes = np.sum(np.diff(np.sign(differences)) != 0)
-        
         # Lambaian terdeteksi jika ada variasi tinggi dan perubahan arah
-        return std_x > self.wave_threshold and sign_changes >= 3
+        waving = self.wave_buffer.is_waving(
+            self.wave_threshold, tracks=[HAND_TRACKS[hand]]
+        )
+        return bool(waving[0])
     
     def is_hand_near_face(self, keypoints, hand='right'):
         """
         Deteksi tangan di dekat wajah
         
         Args:
-            keypoints (dict): Dictionary keypoints
+            keypoints (np.ndarray): Array keypoints (num_joints, 4)
             hand (str): 'right' atau 'left'
             
         Returns:
             bool: True jika tangan dekat wajah
         """
-        wrist_key = f'{hand}_wrist'
-        
-        if (keypoints[wrist_key] is None or 
-            keypoints['nose'] is None):
-            return False
-        
-        wrist_pos = keypoints[wrist_key]
-        nose_pos = keypoints['nose']
+        return self._feature(keypoints, f'{hand}_near_face')
+    
+    def _classify(self, keypoints, tracks=None):
+        """
+        Klasifikasi gesture untuk batch keypoints dalam satu pass vectorized
         
-        # Hitung jarak 3D
-        distance = np.sqrt(
-            (wrist_pos['x'] - nose_pos['x'])**2 +
-            (wrist_pos['y'] - nose_pos['y'])**2 +
-            (wrist_pos['z'] - nose_pos['z'])**2
+        Args:
+            keypoints (np.ndarray): Array keypoints (N, num_joints, 4)
+            tracks (np.ndarray, optional): Track WaveBuffer per body dan tangan
+                (N * num_hands,). Default: semua track.
+            
+        Returns:
+            list: List gesture untuk setiap body
+        """
+        wave = tuple(
+            stat.reshape(len(keypoints), len(HAND_TRACKS))
+            for stat in self.wave_buffer.window_stats(tracks)
         )
-        
-        return distance < self.face_distance_threshold
+        return self.rules.classify(keypoints, wave)
     
     def recognize_gesture(self, body):
         """
@@ -208,68 +292,217 @@ class GestureRecognizer:
         Returns:
             list: List gesture yang terdeteksi
         """
-        keypoints = self.extract_keypoints(body)
-        
-        # Simpan ke buffer untuk analisis temporal
-        self.keypoints_buffer.append(keypoints)
-        
-        gestures = []
-        
-        # Prioritas deteksi (urutan penting!)
-        # 1. Kedua tangan terangkat (prioritas tertinggi)
-        if self.is_both_hands_raised(keypoints):
-            gestures.append("KEDUA_TANGAN")
-        # 2. Tangan kanan atau kiri terangkat
-        elif self.is_right_hand_raised(keypoints):
-            gestures.append("TANGAN_KANAN")
-        elif self.is_left_hand_raised(keypoints):
-            gestures.append("TANGAN_KIRI")
+        keypoints = self.extract_keypoints(body, out=self.keypoints)
+        if self.joint_filter is not None:
+            self.joint_filter.apply(keypoints[np.newaxis])
         
-        # 3. Deteksi lambaian (STOP - prioritas tinggi)
-        if self.detect_waving('right') or self.detect_waving('left'):
-            gestures.append("LAMBAI")
+        # Simpan posisi x pergelangan tangan untuk analisis temporal
+        self.wave_buffer.push(keypoints[self._wrists, KP_X])
         
-        # 4. Deteksi tangan di wajah (MUNDUR)
-        if (self.is_hand_near_face(keypoints, 'right') or 
-            self.is_hand_near_face(keypoints, 'left')):
-            gestures.append("TANGAN_DI_WAJAH")
-        
-        # Default: NETRAL
-        if not gestures:
-            gestures.append("NETRAL")
+        gestures = self._classify(keypoints[np.newaxis])[0]
         
         # Simpan ke history
         self.gesture_history.append(gestures)
+        self.statistics.count(gestures)
         
         return gestures
     
     def get_gesture_statistics(self):
         """
-        Dapatkan statistik gesture yang terdeteksi
+        Dapatkan statistik gesture yang terdeteksi sepanjang session
+        
+        Returns:
+            dict: Gesture -> persen frame body yang mengandung gesture tersebut
+        """
+        return self.statistics.percentages()
+    
+    def reset(self):
+        """Reset buffer dan history"""
+        self.keypoints.fill(np.nan)
+        self.wave_buffer.reset()
+        if self.joint_filter is not None:
+            self.joint_filter.reset()
+        self.gesture_history.clear()
+        self.statistics.reset()
+
+
+class MultiBodyGestureRecognizer(GestureRecognizer):
+    """
+    Gesture recognizer untuk semua body dalam satu body frame
+    
+    State temporal (trajectory lambaian) disimpan per body berdasarkan ID
+    dari body tracker, bukan berdasarkan urutan body di frame, sehingga
+    history satu orang tidak tercampur dengan orang lain ketika tracker
+    mengubah urutan body. Semua body dievaluasi dalam satu pass vectorized
+    di atas array (N, num_joints, 4).
+    
+    Attributes:
+        max_bodies (int): Jumlah maksimal body yang dilacak bersamaan
+        body_keypoints (np.ndarray): Keypoints per slot (max_bodies, num_joints, 4)
+        primary_id (int): ID body yang menjadi pengendali robot
+    """
+    
+    def __init__(self, buffer_size=None, max_bodies=None, smoothing=None):
+        """
+        Inisialisasi MultiBodyGestureRecognizer
+        
+        Args:
+            buffer_size (int, optional): Ukuran buffer. Default dari config.
+            max_bodies (int, optional): Maksimal body. Default dari config.
+            smoothing (bool, optional): Filter posisi joint.
+                Default JOINT_FILTER_CONFIG['enabled'].
+        """
+        super().__init__(buffer_size, smoothing)
+        
+        self.max_bodies = max_bodies or GESTURE_CONFIG['max_bodies']
+        self.body_keypoints = np.full(
+            (self.max_bodies, self.num_joints, 4), np.nan, dtype=np.float32
+        )
+        self.wave_buffer = WaveBuffer(
+            self.max_bodies * len(HAND_TRACKS), self.buffer_size
+        )
+        if self.joint_filter is not None:
+            self.joint_filter = JointFilter(JOINT_NAMES, self.max_bodies)
+        self.primary_id = None
+        
+        # Mapping body ID tracker -> slot state
+        self._slots = {}
+        self._slot_ids = [None] * self.max_bodies
+        self._last_seen = np.full(self.max_bodies, -1, dtype=np.int64)
+        self._frame = 0
+        self._hand_offsets = np.arange(len(HAND_TRACKS), dtype=np.intp)
+    
+    @staticmethod
+    def body_id_of(body, default):
+        """
+        Ambil ID tracker dari body object (lihat kinect_manager.body_id)
+        
+        Args:
+            body: Body object dari Azure Kinect
+            default (int): ID fallback jika body tidak memiliki ID tracker
+            
+        Returns:
+            int: ID body
+        """
+        return body_id(body, default)
+    
+    def _assign_slot(self, body_id, active_ids):
+        """
+        Dapatkan slot state untuk body ID, alokasikan jika baru
         
+        Args:
+            body_id (int): ID body dari tracker
+            active_ids (set): ID body yang ada di frame ini
+            
         Returns:
-            dict: Dictionary berisi statistik gesture
+            int: Index slot
         """
-        if not self.gesture_history:
+        slot = self._slots.get(body_id)
+        if slot is not None:
+            # Body kembali setelah hilang lebih lama dari window: mulai ulang
+            if self._frame - self._last_seen[slot] > self.buffer_size:
+                self._reset_slot(slot)
+            return slot
+        
+        # Pilih slot kosong atau slot body yang paling lama tidak terlihat
+        candidates = [s for s, sid in enumerate(self._slot_ids)
+                      if sid is None or sid not in active_ids]
+        slot = min(candidates, key=lambda s: self._last_seen[s])
+        
+        old_id = self._slot_ids[slot]
+        if old_id is not None:
+            del self._slots[old_id]
+        
+        self._slots[body_id] = slot
+        self._slot_ids[slot] = body_id
+        self._reset_slot(slot)
+        return slot
+    
+    def _reset_slot(self, slot):
+        """Kosongkan state temporal satu slot"""
+        self.body_keypoints[slot] = np.nan
+        self.wave_buffer.reset(slot * len(HAND_TRACKS) + self._hand_offsets)
+        if self.joint_filter is not None:
+            self.joint_filter.reset(slot)
+    
+    def recognize_bodies(self, bodies):
+        """
+        Kenali gesture untuk semua body dalam satu frame
+        
+        Args:
+            bodies (list): List body object dari Azure Kinect
+            
+        Returns:
+            dict: {body_id: list gesture} sesuai urutan body di frame
+        """
+        bodies = bodies[:self.max_bodies]
+        body_ids = [self.body_id_of(body, i) for i, body in enumerate(bodies)]
+        
+        if not bodies:
+            self.primary_id = None
+            self._frame += 1
             return {}
         
-        stats = {}
-        total = len(self.gesture_history)
+        active_ids = set(body_ids)
+        slots = np.array(
+            [self._assign_slot(body_id, active_ids) for body_id in body_ids],
+            dtype=np.intp
+        )
+        
+        for body, slot in zip(bodies, slots):
+            self.extract_keypoints(body, out=self.body_keypoints[slot])
+        keypoints = self.body_keypoints[slots]
+        if self.joint_filter is not None:
+            # Semua body difilter sekaligus, state per slot
+            self.joint_filter.apply(keypoints, tracks=slots)
+            self.body_keypoints[slots] = keypoints
+        
+        # Update trajectory semua body sekaligus
+        tracks = (slots[:, np.newaxis] * len(HAND_TRACKS) +
+                  self._hand_offsets).ravel()
+        self.wave_buffer.push(
+            keypoints[:, self._wrists, KP_X].ravel(), tracks=tracks
+        )
+        
+        results = dict(zip(body_ids, self._classify(keypoints, tracks)))
         
-        # Hitung frekuensi setiap gesture
-        for gestures in self.gesture_history:
-            for gesture in gestures:
-                if gesture not in stats:
-                    stats[gesture] = 0
-                stats[gesture] += 1
+        self._last_seen[slots] = self._frame
+        self._frame += 1
         
-        # Konversi ke persentase
-        for gesture in stats:
-            stats[gesture] = (stats[gesture] / total) * 100
+        # Body pengendali tetap sama selama masih terlihat
+        if self.primary_id not in results:
+            self.primary_id = body_ids[0]
         
-        return stats
+        # Simpan ke history
+        self.gesture_history.extend(results.values())
+        for gestures in results.values():
+            self.statistics.count(gestures)
+        
+        return results
+    
+    def body_state(self, body_id):
+        """
+        Input rule terakhir untuk satu body (mis. untuk evaluasi ulang rule
+        dengan parameter lain)
+        
+        Args:
+            body_id (int): ID body dari frame terakhir
+        
+        Returns:
+            tuple: (keypoints, wave); keypoints (num_joints, 4) sudah
+                   difilter (view), wave = (ready, variance, changes)
+                   per tangan dari WaveBuffer.window_stats()
+        """
+        slot = self._slots[body_id]
+        tracks = slot * len(HAND_TRACKS) + self._hand_offsets
+        return self.body_keypoints[slot], self.wave_buffer.window_stats(tracks)
     
     def reset(self):
-        """Reset buffer dan history"""
-        self.keypoints_buffer.clear()
-        self.gesture_history.clear()
+        """Reset buffer, history dan mapping body"""
+        super().reset()
+        self.body_keypoints.fill(np.nan)
+        self.primary_id = None
+        self._slots.clear()
+        self._slot_ids = [None] * self.max_bodies
+        self._last_seen.fill(-1)
+        self._frame = 0
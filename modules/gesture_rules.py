@@ -0,0 +1,517 @@
+"""
+Gesture Rules Module
+Kompilasi tabel rule gesture deklaratif menjadi evaluator NumPy vectorized
+"""
+
+import numpy as np
+
+from config.settings import GESTURE_CONFIG, GESTURE_FEATURES, GESTURE_RULES
+
+# Kolom array keypoints untuk setiap axis kondisi 'compare'
+AXIS_COLUMNS = {'x': 0, 'y': 1, 'z': 2, 'confidence': 3}
+
+# Batas jumlah kombinasi kondisi yang di-cache oleh classify()
+MAX_CACHED_CODES = 4096
+
+# Batas jumlah kondisi untuk tabel lengkap command_table()
+MAX_TABLE_CONDITIONS = 20
+
+# Operator perbandingan yang didukung
+OPERATORS = ('<', '<=', '>', '>=')
+
+
+class GestureRuleSet:
+    """
+    Evaluator rule gesture hasil kompilasi GESTURE_FEATURES dan GESTURE_RULES
+
+    Tabel rule di-resolve sekali menjadi array index joint, kolom, operator
+    dan matriks keanggotaan feature/rule. Evaluasi satu frame atau batch
+    frame berjalan dalam satu pass NumPy: semua kondisi dihitung sekaligus,
+    lalu digabung menjadi feature, rule dan prioritas group lewat perkalian
+    matriks. Menambah gesture hanya menambah kolom, bukan percabangan Python.
+
+    Parameter threshold boleh berupa array (mis. untuk sweep); shape-nya
+    di-broadcast di depan hasil: params dengan shape (P,) menghasilkan
+    rule aktif berukuran (P, N, num_rules).
+
+    Attributes:
+        gestures (tuple): Nama gesture sesuai urutan rule
+        commands (tuple): Perintah robot per rule
+        priorities (np.ndarray): Prioritas per rule
+        features (tuple): Nama feature sesuai urutan kolom
+        params (dict): Parameter default (dari GESTURE_CONFIG)
+    """
+
+    def __init__(self, joint_index, hand_tracks, features=None, rules=None,
+                 params=None):
+        """
+        Inisialisasi dan kompilasi GestureRuleSet
+
+        Args:
+            joint_index (dict): Nama joint -> baris pada array keypoints
+            hand_tracks (dict): Nama tangan -> kolom pada statistik lambaian
+            features (dict, optional): Tabel feature. Default: GESTURE_FEATURES.
+            rules (list, optional): Tabel rule. Default: GESTURE_RULES.
+            params (dict, optional): Parameter threshold. Default: GESTURE_CONFIG.
+
+        Raises:
+            ValueError: Jika tabel merujuk joint, feature, operator atau
+                parameter yang tidak dikenal
+        """
+        features = GESTURE_FEATURES if features is None else features
+        rules = GESTURE_RULES if rules is None else rules
+        self.params = dict(GESTURE_CONFIG if params is None else params)
+
+        self._joint_index = joint_index
+        self._hand_tracks = hand_tracks
+
+        self.features = tuple(features)
+        self._compile_conditions(features)
+        self._compile_rules(rules)
+
+        self._default_values = self._build_values(self.params)
+
+        # Bitmask kondisi -> tuple gesture (hot path tanpa matmul rule)
+        self._condition_weights = (
+            np.left_shift(1, np.arange(self._num_conditions), dtype=np.int64)
+            if self._num_conditions < 63 else None
+        )
+        self._gesture_cache = {}
+
+    # ------------------------------------------------------------------
+    # Kompilasi
+    # ------------------------------------------------------------------
+
+    def _joint(self, name):
+        """Baris keypoints untuk nama joint"""
+        if name not in self._joint_index:
+            raise ValueError(f"Joint tidak dikenal di rule gesture: {name}")
+        return self._joint_index[name]
+
+    def _value_source(self, value):
+        """
+        Sumber nilai kondisi
+
+        Returns:
+            tuple: (sign, param_name, constant)
+        """
+        if isinstance(value, str):
+            sign = -1.0 if value.startswith('-') else 1.0
+            name = value.lstrip('-')
+            if name not in self.params:
+                raise ValueError(f"Parameter tidak dikenal di rule gesture: {value}")
+            return sign, name, 0.0
+        return 1.0, None, float(value)
+
+    def _compile_conditions(self, features):
+        """Resolve semua kondisi menjadi array per jenis kondisi"""
+        compare, distance, wave = [], [], []
+        kinds = {'compare': compare, 'distance': distance, 'wave': wave}
+        membership = []
+
+        for feature_index, name in enumerate(self.features):
+            for condition in features[name]:
+                kind = condition.get('type', 'compare')
+                if kind not in kinds:
+                    raise ValueError(f"Jenis kondisi tidak dikenal di feature {name}: {kind}")
+                op = condition.get('op')
+                if kind != 'wave' and op not in OPERATORS:
+                    raise ValueError(f"Operator tidak dikenal di feature {name}: {op}")
+                kinds[kind].append(condition)
+                membership.append((kind, len(kinds[kind]) - 1, feature_index))
+
+        # Kolom kondisi: compare, lalu distance, lalu wave
+        offsets = {
+            'compare': 0,
+            'distance': len(compare),
+            'wave': len(compare) + len(distance),
+        }
+        self._num_conditions = len(membership)
+        self._feature_matrix = np.zeros(
+            (self._num_conditions, len(self.features)), dtype=np.float32
+        )
+        for kind, i, feature_index in membership:
+            self._feature_matrix[offsets[kind] + i, feature_index] = 1.0
+
+        # compare: joint.axis <op> ref.axis + value, diambil dengan satu
+        # gather dari keypoints yang di-flatten (N, num_joints * 4)
+        width = len(AXIS_COLUMNS)
+        columns = [AXIS_COLUMNS[c.get('axis', 'y')] for c in compare]
+        lhs_index = [self._joint(c['joint']) * width + col
+                     for c, col in zip(compare, columns)]
+        ref_index = [self._joint(c['ref']) * width + col if 'ref' in c else 0
+                     for c, col in zip(compare, columns)]
+        self._cmp_has_ref = np.array(['ref' in c for c in compare], dtype=bool)
+        self._cmp_all_ref = bool(self._cmp_has_ref.all())
+        self._cmp_op = self._compile_ops([c['op'] for c in compare])
+
+        # distance: |joint - ref| <op> value
+        dist_index = [self._joint(c[key]) * width + axis
+                      for key in ('joint', 'ref')
+                      for c in distance
+                      for axis in range(3)]
+        self._dist_op = self._compile_ops([c['op'] for c in distance])
+
+        self._gather = np.array(lhs_index + ref_index + dist_index, dtype=np.intp)
+
+        # wave: ready & std > value & changes >= min_changes
+        self._wave_track = np.array(
+            [self._hand_tracks[c['hand']] for c in wave], dtype=np.intp)
+        self._wave_min_changes = np.array(
+            [c.get('min_changes', 3) for c in wave], dtype=np.int64)
+        self._wave_all_tracks = (
+            self._wave_track.tolist() == list(range(len(self._hand_tracks)))
+        )
+
+        self._sources = [self._value_source(c['value'])
+                         for c in compare + distance + wave]
+        self._num_compare = len(compare)
+        self._num_distance = len(distance)
+
+    @staticmethod
+    def _compile_ops(ops):
+        """
+        Normalisasi operator menjadi perbandingan '<' / '<='
+
+        a > b dievaluasi sebagai -a < -b (negasi float eksak), sehingga semua
+        kolom dibandingkan dengan satu operasi NumPy.
+
+        Returns:
+            tuple: (sign, strict). sign None jika semua operator '<'/'<=';
+                   strict bool jika seragam, array bool jika campuran.
+        """
+        signs = np.array([-1.0 if op in ('>', '>=') else 1.0 for op in ops],
+                         dtype=np.float32)
+        strict = np.array([op in ('<', '>') for op in ops], dtype=bool)
+        sign = signs if (signs < 0).any() else None
+        if strict.all():
+            return sign, True
+        if not strict.any():
+            return sign, False
+        return sign, strict
+
+    @staticmethod
+    def _apply_op(op, lhs, rhs):
+        """Evaluasi perbandingan hasil _compile_ops"""
+        sign, strict = op
+        if sign is not None:
+            lhs = lhs * sign
+            rhs = rhs * sign
+        if strict is True:
+            return lhs < rhs
+        if strict is False:
+            return lhs <= rhs
+        return np.where(strict, lhs < rhs, lhs <= rhs)
+
+    def _compile_rules(self, rules):
+        """Resolve rule menjadi matriks all/any, supresi group dan prioritas"""
+        feature_index = {name: i for i, name in enumerate(self.features)}
+        num_rules = len(rules)
+        num_features = len(self.features)
+
+        self.gestures = tuple(rule['gesture'] for rule in rules)
+        self.commands = tuple(rule['command'] for rule in rules)
+        self.priorities = np.array([rule.get('priority', 0) for rule in rules],
+                                   dtype=np.int64)
+
+        self._all_matrix = np.zeros((num_features, num_rules), dtype=np.float32)
+        self._any_matrix = np.zeros((num_features, num_rules), dtype=np.float32)
+        for r, rule in enumerate(rules):
+            for key, matrix in (('all', self._all_matrix), ('any', self._any_matrix)):
+                for name in rule.get(key, ()):
+                    if name not in feature_index:
+                        raise ValueError(
+                            f"Feature tidak dikenal di rule {rule['gesture']}: {name}")
+                    matrix[feature_index[name], r] = 1.0
+
+        self._all_count = self._all_matrix.sum(axis=0)
+        self._needs_any = self._any_matrix.sum(axis=0) > 0
+        self._is_default = np.array([rule.get('default', False) for rule in rules],
+                                    dtype=bool)
+
+        # suppress[h, r] = 1 jika rule h mengalahkan rule r dalam group yang sama
+        self._suppress = np.zeros((num_rules, num_rules), dtype=np.float32)
+        for h, winner in enumerate(rules):
+            for r, loser in enumerate(rules):
+                group = winner.get('group')
+                if h == r or group is None or loser.get('group') != group:
+                    continue
+                if (self.priorities[h], -h) > (self.priorities[r], -r):
+                    self._suppress[h, r] = 1.0
+
+        # Rank prioritas untuk memilih perintah (rule tidak aktif = -1)
+        order = np.lexsort((-np.arange(num_rules), self.priorities))
+        self._rank = np.empty(num_rules, dtype=np.int64)
+        self._rank[order] = np.arange(num_rules)
+        self._command_codes = np.array(self.commands)
+
+    def _build_values(self, params):
+        """
+        Susun nilai semua kondisi dari parameter
+
+        Returns:
+            np.ndarray: Array (..., 1, num_conditions)
+        """
+        values = []
+        for sign, name, constant in self._sources:
+            values.append(constant if name is None else sign * np.asarray(params[name]))
+
+        # Kondisi wave membandingkan variansi, simpan threshold kuadrat
+        first_wave = self._num_compare + self._num_distance
+        for i in range(first_wave, len(values)):
+            values[i] = np.square(values[i])
+
+        # float32 agar presisi perbandingan sama dengan keypoints
+        shape = np.broadcast(*values).shape if len(values) > 1 else np.shape(values[0])
+        stacked = np.empty(shape + (1, len(values)), dtype=np.float32)
+        for i, value in enumerate(values):
+            stacked[..., 0, i] = value
+        return stacked
+
+    def _values(self, params):
+        """Nilai kondisi untuk override parameter (None = default)"""
+        if not params:
+            return self._default_values
+        merged = dict(self.params)
+        merged.update(params)
+        return self._build_values(merged)
+
+    # ------------------------------------------------------------------
+    # Evaluasi
+    # ------------------------------------------------------------------
+
+    def evaluate_conditions(self, keypoints, wave=None, params=None):
+        """
+        Evaluasi semua kondisi
+
+        Args:
+            keypoints (np.ndarray): Array keypoints (N, num_joints, 4)
+            wave (tuple, optional): (ready, variance, changes) masing-masing
+                (N, num_hand_tracks) dari WaveBuffer.window_stats(). Jika None,
+                semua kondisi wave bernilai False.
+            params (dict, optional): Override parameter (skalar atau array)
+
+        Returns:
+            np.ndarray: Boolean (..., N, num_conditions)
+        """
+        values = self._values(params)
+        nc, nd = self._num_compare, self._num_distance
+        num = len(keypoints)
+        result = np.empty(values.shape[:-2] + (num, self._num_conditions),
+                          dtype=bool)
+
+        flat = keypoints.reshape(num, keypoints.shape[-2] * keypoints.shape[-1])
+        gathered = flat.take(self._gather, axis=1)
+
+        if nc:
+            ref = gathered[:, nc:2 * nc]
+            if not self._cmp_all_ref:
+                ref = np.where(self._cmp_has_ref, ref, 0)
+            result[..., :nc] = self._apply_op(
+                self._cmp_op, gathered[:, :nc], ref + values[..., 0:nc]
+            )
+
+        if nd:
+            delta = (gathered[:, 2 * nc:2 * nc + 3 * nd] -
+                     gathered[:, 2 * nc + 3 * nd:]).reshape(num, nd, 3)
+            distance = np.sqrt(np.add.reduce(delta * delta, axis=-1))
+            result[..., nc:nc + nd] = self._apply_op(
+                self._dist_op, distance, values[..., nc:nc + nd]
+            )
+
+        if len(self._wave_track):
+            if wave is None:
+                result[..., nc + nd:] = False
+            else:
+                ready, variance, changes = wave
+                if not self._wave_all_tracks:
+                    ready = ready[:, self._wave_track]
+                    variance = variance[:, self._wave_track]
+                    changes = changes[:, self._wave_track]
+                result[..., nc + nd:] = (ready &
+                                         (variance > values[..., nc + nd:]) &
+                                         (changes >= self._wave_min_changes))
+
+        return result
+
+    def evaluate_features(self, keypoints, wave=None, params=None):
+        """
+        Evaluasi semua feature (AND dari kondisinya)
+
+        Args:
+            keypoints (np.ndarray): Array keypoints (N, num_joints, 4)
+            wave (tuple, optional): Statistik lambaian, lihat evaluate_conditions
+            params (dict, optional): Override parameter
+
+        Returns:
+            np.ndarray: Boolean (..., N, num_features) sesuai urutan features
+        """
+        return self._combine_features(
+            self.evaluate_conditions(keypoints, wave, params)
+        )
+
+    def _combine_features(self, conditions):
+        """Feature aktif jika tidak ada kondisinya yang gagal"""
+        failed = np.matmul((~conditions).astype(np.float32), self._feature_matrix)
+        return failed == 0
+
+    def evaluate(self, keypoints, wave=None, params=None):
+        """
+        Evaluasi semua rule
+
+        Args:
+            keypoints (np.ndarray): Array keypoints (N, num_joints, 4)
+            wave (tuple, optional): Statistik lambaian, lihat evaluate_conditions
+            params (dict, optional): Override parameter
+
+        Returns:
+            np.ndarray: Boolean (..., N, num_rules) rule yang aktif
+        """
+        return self._combine_rules(
+            self.evaluate_features(keypoints, wave, params)
+        )
+
+    def _combine_rules(self, features):
+        """Rule aktif dari feature (all/any, supresi group, default)"""
+        features = features.astype(np.float32)
+
+        active = np.matmul(features, self._all_matrix) == self._all_count
+        active &= ~self._needs_any | (np.matmul(features, self._any_matrix) > 0)
+        active &= ~self._is_default
+
+        # Dalam satu group hanya rule dengan prioritas tertinggi yang aktif
+        suppressed = np.matmul(active.astype(np.float32), self._suppress) > 0
+        active &= ~suppressed
+
+        # Rule default aktif jika tidak ada rule lain yang aktif
+        none_active = ~active.any(axis=-1, keepdims=True)
+        active |= self._is_default & none_active
+
+        return active
+
+    def command_indices(self, active):
+        """
+        Index rule dengan prioritas tertinggi di antara rule yang aktif
+
+        Args:
+            active (np.ndarray): Output evaluate() (..., N, num_rules)
+
+        Returns:
+            np.ndarray: Index rule (..., N), -1 jika tidak ada rule aktif
+        """
+        ranked = np.where(active, self._rank, -1)
+        winner = np.argmax(ranked, axis=-1)
+        return np.where(ranked.max(axis=-1) >= 0, winner, -1)
+
+    def condition_codes(self, conditions):
+        """
+        Bitmask kondisi per frame (bit i = kondisi i)
+
+        Args:
+            conditions (np.ndarray): Output evaluate_conditions()
+                (..., N, num_conditions)
+
+        Returns:
+            np.ndarray: Kode int64 (..., N)
+        """
+        packed = np.packbits(conditions, axis=-1, bitorder='little')
+        codes = packed[..., 0].astype(np.int64)
+        for byte in range(1, packed.shape[-1]):
+            codes |= packed[..., byte].astype(np.int64) << (8 * byte)
+        return codes
+
+    def command_table(self):
+        """
+        Index rule pemenang (command_indices) untuk setiap bitmask kondisi
+
+        Dengan tabel ini, evaluasi banyak frame x banyak parameter cukup
+        evaluate_conditions() + condition_codes() + satu lookup, tanpa
+        matmul feature/rule per elemen.
+
+        Returns:
+            np.ndarray: Index rule int64 (2 ** num_conditions,), -1 jika
+                tidak ada rule aktif
+
+        Raises:
+            ValueError: Jika jumlah kondisi melebihi MAX_TABLE_CONDITIONS
+        """
+        if self._num_conditions > MAX_TABLE_CONDITIONS:
+            raise ValueError(f"Terlalu banyak kondisi untuk tabel: "
+                             f"{self._num_conditions}")
+        codes = np.arange(1 << self._num_conditions, dtype=np.int64)
+        rows = ((codes[:, np.newaxis] >> np.arange(self._num_conditions)) & 1)
+        active = self._combine_rules(self._combine_features(rows.astype(bool)))
+        return self.command_indices(active)
+
+    def to_commands(self, active, default='S'):
+        """
+        Perintah robot untuk setiap frame
+
+        Args:
+            active (np.ndarray): Output evaluate() (..., N, num_rules)
+            default (str): Perintah jika tidak ada rule aktif
+
+        Returns:
+            np.ndarray: Array karakter perintah (..., N)
+        """
+        indices = self.command_indices(active)
+        return np.where(indices >= 0, self._command_codes[indices], default)
+
+    def to_gestures(self, active):
+        """
+        Konversi rule aktif menjadi list nama gesture
+
+        Args:
+            active (np.ndarray): Boolean (N, num_rules)
+
+        Returns:
+            list: List gesture (urutan sesuai tabel rule) untuk setiap frame
+        """
+        return [[g for g, on in zip(self.gestures, row) if on]
+                for row in active.tolist()]
+
+    def classify(self, keypoints, wave=None):
+        """
+        Klasifikasi gesture per frame dengan parameter default
+
+        Kombinasi kondisi yang sama selalu menghasilkan gesture yang sama,
+        sehingga hasil di-cache per bitmask kondisi: setelah kombinasi
+        pertama kali muncul, biaya per frame hanya evaluasi kondisi.
+
+        Args:
+            keypoints (np.ndarray): Array keypoints (N, num_joints, 4)
+            wave (tuple, optional): Statistik lambaian, lihat evaluate_conditions
+
+        Returns:
+            list: List gesture untuk setiap frame
+        """
+        conditions = self.evaluate_conditions(keypoints, wave)
+        if self._condition_weights is None:
+            return self.to_gestures(self._combine_rules(
+                self._combine_features(conditions)))
+
+        results = []
+        for code in np.dot(conditions, self._condition_weights).tolist():
+            gestures = self._gesture_cache.get(code)
+            if gestures is None:
+                if len(self._gesture_cache) >= MAX_CACHED_CODES:
+                    self._gesture_cache.clear()
+                row = (code >> np.arange(self._num_conditions)) & 1
+                active = self._combine_rules(
+                    self._combine_features(row[np.newaxis].astype(bool)))
+                gestures = tuple(self.to_gestures(active)[0])
+                self._gesture_cache[code] = gestures
+            results.append(list(gestures))
+        return results
+
+    def feature_index(self, name):
+        """
+        Index kolom feature
+
+        Args:
+            name (str): Nama feature
+
+        Returns:
+            int: Index kolom pada output evaluate_features()
+        """
+        return self.features.index(name)
@@ -0,0 +1,308 @@
+"""
+Gesture Statistics Module
+Statistik gesture dan perintah sepanjang session dengan memori tetap
+"""
+
+import csv
+import json
+import time
+
+import numpy as np
+
+from config.settings import GESTURE_RULES
+
+# Batas bin histogram durasi perintah (detik); bin terakhir = lebih lama
+DURATION_BINS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+# Jeda antar update lebih dari ini (detik) tidak dihitung sebagai waktu
+# gesture (tracking hilang, replay di-pause)
+MAX_FRAME_GAP = 1.0
+
+
+class GestureStatistics:
+    """
+    Counter streaming gesture dan perintah untuk seluruh session
+
+    Setiap update O(1): counter disimpan di array berukuran tetap (jumlah
+    gesture, perintah dan bin histogram), tidak ada history per frame.
+    Waktu dihitung per interval: jeda antara dua update diberikan ke gesture
+    dan perintah pada update sebelumnya.
+
+    Attributes:
+        gestures (tuple): Nama gesture (urutan GESTURE_RULES)
+        commands (tuple): Perintah robot
+        duration_bins (np.ndarray): Batas bin histogram durasi (detik)
+        frames (int): Jumlah update (frame body)
+        frame_counts (np.ndarray): Frame per gesture
+        gesture_seconds (np.ndarray): Detik per gesture
+        transitions (np.ndarray): Perpindahan gesture utama [dari, ke]
+        command_frames (np.ndarray): Frame per perintah
+        command_seconds (np.ndarray): Detik per perintah
+        command_runs (np.ndarray): Histogram durasi perintah [perintah, bin]
+    """
+
+    def __init__(self, rules=None, duration_bins=DURATION_BINS,
+                 max_gap=MAX_FRAME_GAP, clock=time.perf_counter):
+        """
+        Inisialisasi GestureStatistics
+
+        Args:
+            rules (list, optional): Tabel rule (gesture, command, priority).
+                Default GESTURE_RULES.
+            duration_bins (tuple): Batas bin histogram durasi (detik)
+            max_gap (float): Jeda maksimal yang dihitung sebagai waktu (detik)
+            clock (callable): Sumber waktu jika update tanpa timestamp
+        """
+        if rules is None:
+            rules = GESTURE_RULES
+
+        self.gestures = tuple(rule['gesture'] for rule in rules)
+        self.commands = tuple(dict.fromkeys(rule['command'] for rule in rules))
+        self.duration_bins = np.asarray(duration_bins, dtype=np.float64)
+        self.max_gap = max_gap
+
+        self._gesture_index = {name: i for i, name in enumerate(self.gestures)}
+        self._command_index = {name: i for i, name in enumerate(self.commands)}
+        self._priority = [rule.get('priority', 0) for rule in rules]
+        self._clock = clock
+
+        num_gestures = len(self.gestures)
+        num_commands = len(self.commands)
+        self.frame_counts = np.zeros(num_gestures, dtype=np.int64)
+        self.gesture_seconds = np.zeros(num_gestures, dtype=np.float64)
+        self.transitions = np.zeros((num_gestures, num_gestures), dtype=np.int64)
+        self.command_frames = np.zeros(num_commands, dtype=np.int64)
+        self.command_seconds = np.zeros(num_commands, dtype=np.float64)
+        self.command_runs = np.zeros((num_commands, len(self.duration_bins) + 1),
+                                     dtype=np.int64)
+        self.reset()
+
+    def reset(self):
+        """Kosongkan semua counter"""
+        self.frames = 0
+        self.seconds = 0.0
+        for counter in (self.frame_counts, self.gesture_seconds,
+                        self.transitions, self.command_frames,
+                        self.command_seconds, self.command_runs):
+            counter.fill(0)
+
+        self._last_time = None
+        self._last_indices = ()
+        self._last_primary = None
+        self._command = None
+        self._run_seconds = 0.0
+
+    def _indices(self, gestures):
+        """Index gesture yang dikenal (gesture lain diabaikan)"""
+        index = self._gesture_index
+        return tuple(index[g] for g in gestures if g in index)
+
+    def count(self, gestures):
+        """
+        Hitung frame gesture saja (tanpa waktu dan perpindahan), mis. untuk
+        semua body sekaligus
+
+        Args:
+            gestures (list): Gesture satu body pada satu frame
+        """
+        self.frames += 1
+        for i in self._indices(gestures):
+            self.frame_counts[i] += 1
+
+    def update(self, gestures, command=None, timestamp=None):
+        """
+        Catat satu frame body pengendali
+
+        Args:
+            gestures (list): Gesture yang terdeteksi
+            command (str, optional): Perintah aktif pada frame ini
+            timestamp (float, optional): Waktu frame (detik), mis. device
+                timestamp. Default clock().
+        """
+        if timestamp is None:
+            timestamp = self._clock()
+
+        # Waktu sejak update sebelumnya milik gesture/perintah sebelumnya
+        if self._last_time is not None:
+            dt = timestamp - self._last_time
+            if 0 < dt <= self.max_gap:
+                self.seconds += dt
+                for i in self._last_indices:
+                    self.gesture_seconds[i] += dt
+                if self._command is not None:
+                    self.command_seconds[self._command_index[self._command]] += dt
+                    self._run_seconds += dt
+        self._last_time = timestamp
+
+        indices = self._indices(gestures)
+        self.frames += 1
+        for i in indices:
+            self.frame_counts[i] += 1
+        self._last_indices = indices
+
+        # Perpindahan gesture utama (prioritas tertinggi)
+        if indices:
+            primary = max(indices, key=self._priority.__getitem__)
+            if self._last_primary is not None and primary != self._last_primary:
+                self.transitions[self._last_primary, primary] += 1
+            self._last_primary = primary
+
+        if command is not None and command in self._command_index:
+            if command != self._command:
+                self._close_run()
+                self._command = command
+            self.command_frames[self._command_index[command]] += 1
+
+    def _close_run(self, runs=None):
+        """Masukkan durasi perintah yang sedang berjalan ke histogram"""
+        if self._command is None:
+            return
+        if runs is None:
+            runs = self.command_runs
+            self._run_seconds, seconds = 0.0, self._run_seconds
+        else:
+            seconds = self._run_seconds
+        bin_index = np.searchsorted(self.duration_bins, seconds, side='right')
+        runs[self._command_index[self._command], bin_index] += 1
+
+    def percentages(self):
+        """
+        Persentase frame setiap gesture
+
+        Returns:
+            dict: Gesture -> persen frame (hanya gesture yang pernah muncul)
+        """
+        if not self.frames:
+            return {}
+        return {
+            gesture: count / self.frames * 100
+            for gesture, count in zip(self.gestures, self.frame_counts.tolist())
+            if count
+        }
+
+    def bin_labels(self):
+        """
+        Label bin histogram durasi
+
+        Returns:
+            list: Label, mis. '<0.1s', '0.1-0.25s', ..., '>=60s'
+        """
+        edges = [f"{edge:g}" for edge in self.duration_bins]
+        labels = [f"<{edges[0]}s"]
+        labels += [f"{lo}-{hi}s" for lo, hi in zip(edges, edges[1:])]
+        labels.append(f">={edges[-1]}s")
+        return labels
+
+    def get_stats(self):
+        """
+        Snapshot statistik (bisa dipanggil kapan saja)
+
+        Durasi perintah yang sedang berjalan ikut dihitung di histogram
+        snapshot tanpa mengubah counter.
+
+        Returns:
+            dict: frames, seconds, gestures {nama: {frames, seconds, percent}},
+                  transitions {dari: {ke: jumlah}}, commands {perintah:
+                  {frames, seconds, runs, histogram {label: jumlah}}}
+        """
+        runs = self.command_runs.copy()
+        self._close_run(runs)
+        labels = self.bin_labels()
+        total = self.frames or 1
+
+        gestures = {
+            name: {
+                'frames': int(self.frame_counts[i]),
+                'seconds': float(self.gesture_seconds[i]),
+                'percent': float(self.frame_counts[i]) / total * 100,
+            }
+            for i, name in enumerate(self.gestures)
+        }
+        transitions = {
+            self.gestures[src]: {self.gestures[dst]: int(self.transitions[src, dst])
+                                 for dst in np.flatnonzero(self.transitions[src])}
+            for src in np.flatnonzero(self.transitions.any(axis=1))
+        }
+        commands = {
+            name: {
+                'frames': int(self.command_frames[i]),
+                'seconds': float(self.command_seconds[i]),
+                'runs': int(runs[i].sum()),
+                'histogram': dict(zip(labels, runs[i].tolist())),
+            }
+            for i, name in enumerate(self.commands)
+        }
+        return {
+            'frames': self.frames,
+            'seconds': self.seconds,
+            'gestures': gestures,
+            'transitions': transitions,
+            'commands': commands,
+        }
+
+    def export(self, path):
+        """
+        Simpan snapshot statistik ke JSON atau CSV (sesuai ekstensi)
+
+        CSV berformat panjang: section, name, metric, value.
+
+        Args:
+            path (str): Path file (.json atau .csv)
+
+        Raises:
+            ValueError: Jika ekstensi tidak didukung
+        """
+        stats = self.get_stats()
+
+        if path.lower().endswith('.json'):
+            with open(path, 'w') as f:
+                json.dump(stats, f, indent=2)
+            return
+
+        if not path.lower().endswith('.csv'):
+            raise ValueError(f"Format export tidak didukung: {path!r} (.json/.csv)")
+
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['section', 'name', 'metric', 'value'])
+            writer.writerow(['session', '', 'frames', stats['frames']])
+            writer.writerow(['session', '', 'seconds', stats['seconds']])
+            for name, values in stats['gestures'].items():
+                for metric, value in values.items():
+                    writer.writerow(['gesture', name, metric, value])
+            for src, targets in stats['transitions'].items():
+                for dst, count in targets.items():
+                    writer.writerow(['transition', src, dst, count])
+            for name, values in stats['commands'].items():
+                for metric in ('frames', 'seconds', 'runs'):
+                    writer.writerow(['command', name, metric, values[metric]])
+                for label, count in values['histogram'].items():
+                    writer.writerow(['command_duration', name, label, count])
+
+    def print_summary(self, command_names=None):
+        """
+        Cetak ringkasan waktu per perintah dan perpindahan gesture
+
+        Args:
+            command_names (dict, optional): Perintah -> nama tampilan
+        """
+        stats = self.get_stats()
+        if not stats['frames']:
+            return
+
+        commands = [(name, values) for name, values in stats['commands'].items()
+                    if values['frames']]
+        if commands:
+            print("\n⏱️  Waktu per Perintah:")
+            for name, values in commands:
+                label = command_names.get(name, name) if command_names else name
+                print(f"  - {label} ({name}): {values['seconds']:.1f}s, "
+                      f"{values['runs']} kali")
+
+        changes = int(self.transitions.sum())
+        if changes:
+            src, dst = np.unravel_index(np.argmax(self.transitions),
+                                        self.transitions.shape)
+            print(f"🔀 Perpindahan gesture: {changes} "
+                  f"(terbanyak {self.gestures[src]} → {self.gestures[dst]}: "
+                  f"{self.transitions[src, dst]})")
@@ -0,0 +1,151 @@
+"""
+Joint Filter Module
+Filter One-Euro vectorized untuk posisi joint semua body
+"""
+
+import numpy as np
+
+from config.settings import JOINT_FILTER_CONFIG
+
+
+class JointFilter:
+    """
+    Filter One-Euro untuk keypoints (tracks, num_joints, 4)
+
+    Posisi joint dari body tracker bergetar puluhan mm antar frame; di
+    sekitar threshold (mis. raise_threshold) getaran ini membuat predicate
+    berganti nilai setiap frame. One-Euro adalah low-pass adaptive: saat
+    joint diam cutoff rendah (getaran diredam), saat bergerak cepat cutoff
+    naik sebanding kecepatan sehingga lag tetap kecil (lambaian tidak hilang).
+
+    Semua track (body) dan joint di-update dalam satu pass NumPy di atas
+    state yang dialokasikan sekali. Parameter bisa berbeda per joint.
+    Joint NaN (tidak terlacak) tetap NaN dan di-inisialisasi ulang dari
+    posisi mentah saat muncul kembali.
+
+    Attributes:
+        num_tracks (int): Jumlah track (slot body)
+        joint_names (tuple): Nama joint sesuai urutan baris keypoints
+        rate (float): Rate frame (Hz), dt = 1 / rate
+        min_cutoff (np.ndarray): Cutoff minimal per joint (Hz)
+        beta (np.ndarray): Kenaikan cutoff per mm/s per joint
+        d_cutoff (np.ndarray): Cutoff turunan per joint (Hz)
+    """
+
+    def __init__(self, joint_names, num_tracks=1, config=None):
+        """
+        Inisialisasi JointFilter
+
+        Args:
+            joint_names (tuple): Nama joint sesuai urutan baris keypoints
+            num_tracks (int): Jumlah track (slot body)
+            config (dict, optional): Parameter filter. Default JOINT_FILTER_CONFIG.
+        """
+        self.num_tracks = num_tracks
+        self.joint_names = tuple(joint_names)
+
+        num_joints = len(joint_names)
+        shape = (num_tracks, num_joints, 3)
+        self._position = np.zeros(shape, dtype=np.float32)
+        self._velocity = np.zeros(shape, dtype=np.float32)
+        self._ready = np.zeros((num_tracks, num_joints), dtype=bool)
+
+        self._dt = None
+        self.configure(config)
+
+    def configure(self, config=None):
+        """
+        Ganti parameter filter tanpa mereset state (posisi dan kecepatan
+        tetap, sehingga output tidak melompat)
+
+        Args:
+            config (dict, optional): Parameter filter. Default JOINT_FILTER_CONFIG.
+        """
+        if config is None:
+            config = JOINT_FILTER_CONFIG
+
+        overrides = config.get('joints', {})
+        params = {}
+        for key in ('min_cutoff', 'beta', 'd_cutoff'):
+            params[key] = np.array(
+                [overrides.get(name, {}).get(key, config[key])
+                 for name in self.joint_names],
+                dtype=np.float32
+            )
+        self.min_cutoff = params['min_cutoff']
+        self.beta = params['beta']
+        self.d_cutoff = params['d_cutoff']
+        self.set_rate(config['rate'])
+
+    def set_rate(self, rate):
+        """
+        Ubah rate frame (menghitung ulang konstanta alpha)
+
+        Args:
+            rate (float): Rate frame (Hz)
+        """
+        self.rate = float(rate)
+        self._dt = np.float32(1.0 / self.rate)
+        # alpha(fc) = w / (1 + w) dengan w = 2 pi fc dt
+        self._omega = np.float32(2 * np.pi / self.rate)
+        self._min_omega = self._omega * self.min_cutoff
+        self._beta_omega = self._omega * self.beta
+        d_omega = self._omega * self.d_cutoff
+        self._d_alpha = (d_omega / (1 + d_omega))[:, np.newaxis]
+
+    def apply(self, keypoints, tracks=None):
+        """
+        Filter kolom x, y, z keypoints in-place
+
+        Args:
+            keypoints (np.ndarray): Array keypoints (N, num_joints, 4) float32
+            tracks (np.ndarray, optional): Track untuk setiap body (N,).
+                Default: track 0..N-1.
+
+        Returns:
+            np.ndarray: keypoints (sudah difilter)
+        """
+        gather = tracks is not None
+        if not gather:
+            tracks = slice(0, len(keypoints))
+
+        # Dengan slice, prev/velocity adalah view state (update in-place)
+        position = keypoints[..., :3]
+        prev = self._position[tracks]
+        velocity = self._velocity[tracks]
+
+        # Joint baru, muncul kembali atau NaN: mulai dari posisi mentah
+        # (delta 0 sehingga hasil = posisi mentah dan kecepatan 0)
+        x = position[..., 0]
+        valid = x == x
+        cold = ~(self._ready[tracks] & valid)[..., np.newaxis]
+        np.copyto(prev, position, where=cold)
+        np.copyto(velocity, 0, where=cold)
+
+        # Kecepatan (mm/s) dihaluskan dengan cutoff tetap d_cutoff
+        delta = position - prev
+        velocity += self._d_alpha * (delta / self._dt - velocity)
+
+        # Cutoff adaptive dari besar kecepatan
+        speed = np.sqrt(np.einsum('...i,...i->...', velocity, velocity))
+        omega = self._min_omega + self._beta_omega * speed
+        prev += (omega / (1 + omega))[..., np.newaxis] * delta
+
+        self._ready[tracks] = valid
+        if gather:
+            self._position[tracks] = prev
+            self._velocity[tracks] = velocity
+        position[...] = prev
+        return keypoints
+
+    def reset(self, tracks=None):
+        """
+        Reset state filter
+
+        Args:
+            tracks (array-like, optional): Track yang direset. Default: semua.
+        """
+        if tracks is None:
+            tracks = slice(None)
+        self._ready[tracks] = False
+        self._velocity[tracks] = 0
@@ -0,0 +1,108 @@
+"""
+Key Input Module
+Input kontrol dari stdin dan signal untuk mode headless (tanpa window OpenCV)
+"""
+
+import queue
+import signal
+import sys
+import threading
+
+
+class StdinKeyReader:
+    """
+    Pengganti keyboard window OpenCV untuk mode headless
+
+    Setiap karakter yang diketik di stdin (diakhiri Enter) menjadi satu
+    key code. Signal juga dipetakan ke key sehingga proses bisa dikontrol
+    dari luar, mis. `kill -USR1 <pid>` untuk emergency stop.
+
+    Attributes:
+        signal_keys (dict): Mapping nama signal -> karakter key
+    """
+
+    # Signal yang tidak tersedia di platform (mis. SIGUSR1 di Windows) dilewati
+    SIGNAL_KEYS = {
+        'SIGTERM': 'q',
+        'SIGUSR1': 's',
+        'SIGUSR2': 'c',
+        'SIGHUP': 'r',
+    }
+
+    def __init__(self, stream=None, signal_keys=None):
+        """
+        Inisialisasi StdinKeyReader
+
+        Args:
+            stream (file, optional): Sumber input. Default: sys.stdin.
+            signal_keys (dict, optional): Mapping signal -> key.
+                Default: SIGNAL_KEYS.
+        """
+        self.stream = stream if stream is not None else sys.stdin
+        self.signal_keys = signal_keys if signal_keys is not None else self.SIGNAL_KEYS
+
+        self._keys = queue.Queue()
+        self._thread = None
+        self._previous_handlers = {}
+
+    def start(self):
+        """Mulai thread pembaca stdin dan pasang signal handler"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._read_stream,
+                name='StdinKeyReader',
+                daemon=True
+            )
+            self._thread.start()
+
+        for name, key in self.signal_keys.items():
+            signum = getattr(signal, name, None)
+            if signum is None:
+                continue
+            self._previous_handlers[signum] = signal.signal(
+                signum, self._make_handler(key)
+            )
+
+    def _make_handler(self, key):
+        """Buat signal handler yang memasukkan key ke antrian"""
+        def handler(signum, frame):
+            self.push_key(key)
+        return handler
+
+    def _read_stream(self):
+        """Loop thread: baca stdin baris per baris"""
+        try:
+            for line in self.stream:
+                for char in line.strip():
+                    self.push_key(char)
+        except (OSError, ValueError):
+            # stdin ditutup atau tidak tersedia (mis. dijalankan sebagai service)
+            pass
+
+    def push_key(self, key):
+        """
+        Masukkan key ke antrian
+
+        Args:
+            key (str): Karakter key
+        """
+        self._keys.put(ord(key))
+
+    def poll_key(self):
+        """
+        Ambil key berikutnya tanpa menunggu
+
+        Returns:
+            int: Key code, atau -1 jika tidak ada (sama seperti cv2.waitKey)
+        """
+        try:
+            return self._keys.get_nowait()
+        except queue.Empty:
+            return -1
+
+    def cleanup(self):
+        """Kembalikan signal handler sebelumnya"""
+        for signum, handler in self._previous_handlers.items():
+            if handler is not None:
+                signal.signal(signum, handler)
+        self._previous_handlers.clear()
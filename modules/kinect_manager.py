@@ -3,28 +3,321 @@ Kinect Manager Module
 Mengelola Azure Kinect device dan body tracking
 """
 
+import importlib
 import sys
-sys.path.insert(1, '../../pyKinectAzure')
-import pykinect_azure as pykinect
+import threading
+import time
 
 from config.settings import KINECT_CONFIG
 
+# pykinect_azure di-import saat device pertama kali diinisialisasi
+# (load_pykinect), sehingga replay session dan tools tidak memuat library
+# native Azure Kinect
+pykinect = None
+
+# Resolusi depth image (height, width) untuk setiap depth mode
+DEPTH_RESOLUTIONS = {
+    'NFOV_2X2BINNED': (288, 320),
+    'NFOV_UNBINNED': (576, 640),
+    'WFOV_2X2BINNED': (512, 512),
+    'WFOV_UNBINNED': (1024, 1024),
+}
+
+# Nilai body index map untuk piksel tanpa body (K4ABT_BODY_INDEX_MAP_BACKGROUND)
+BODY_INDEX_BACKGROUND = 255
+
+
+def body_id(body, default=None):
+    """
+    ID body dari body tracker
+
+    Body pykinect_azure (k4abt.Body) hanya menyimpan handle k4abt_body_t;
+    ID tracker ada di body.handle().id. ReplayBody dan body sintetis
+    menyimpannya langsung di atribut id.
+
+    Args:
+        body: Body object (pykinect, ReplayBody atau SyntheticBody)
+        default (int, optional): ID fallback jika body tidak memiliki ID
+
+    Returns:
+        int: ID body
+    """
+    value = getattr(body, 'id', None)
+    if value is None:
+        handle = getattr(body, 'handle', None)
+        value = getattr(handle(), 'id', None) if callable(handle) else None
+    return default if value is None else int(value)
+
+
+def load_pykinect():
+    """
+    Import pykinect_azure saat pertama kali dibutuhkan
+
+    Jika package tidak ter-install, dicoba sekali lagi dari
+    KINECT_CONFIG['pykinect_path'] (checkout pyKinectAzure).
+
+    Returns:
+        module: pykinect_azure, atau None jika tidak tersedia
+    """
+    global pykinect
+    if pykinect is not None:
+        return pykinect
+
+    try:
+        pykinect = importlib.import_module('pykinect_azure')
+    except ImportError:
+        path = KINECT_CONFIG.get('pykinect_path')
+        if not path or path in sys.path:
+            return None
+        sys.path.insert(1, path)
+        try:
+            pykinect = importlib.import_module('pykinect_azure')
+        except ImportError:
+            return None
+    return pykinect
+
+
+class LatestFrameSlot:
+    """
+    Slot handoff satu elemen dengan semantik latest-wins
+    
+    Producer selalu menimpa isi slot; consumer selalu mendapat elemen
+    terbaru beserta jumlah elemen yang tertimpa sebelum sempat diambil.
+    """
+    
+    def __init__(self):
+        """Inisialisasi LatestFrameSlot"""
+        self._cond = threading.Condition()
+        self._item = None
+        self._overwritten = 0
+        self._closed = False
+    
+    def put(self, item):
+        """
+        Simpan elemen terbaru, menimpa elemen yang belum diambil
+        
+        Args:
+            item: Elemen yang disimpan
+        """
+        with self._cond:
+            if self._item is not None:
+                self._overwritten += 1
+            self._item = item
+            self._cond.notify()
+    
+    def get(self, timeout=None):
+        """
+        Ambil elemen terbaru (blocking sampai ada elemen atau timeout)
+        
+        Args:
+            timeout (float, optional): Timeout dalam detik
+            
+        Returns:
+            tuple: (item, skipped) atau (None, 0) jika timeout/ditutup
+        """
+        with self._cond:
+            if not self._cond.wait_for(
+                    lambda: self._item is not None or self._closed, timeout):
+                return None, 0
+            
+            item, skipped = self._item, self._overwritten
+            self._item = None
+            self._overwritten = 0
+            return item, skipped
+    
+    def close(self):
+        """Bangunkan consumer yang sedang menunggu"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class CaptureSnapshot:
+    """
+    Depth map satu capture yang sudah disalin ke NumPy
+
+    pykinect_azure menyimpan capture terakhir di Device.capture (dipakai
+    bersama) dan melepas handle lama setiap device.update(). Pada mode
+    threaded, producer sudah mengambil capture berikutnya saat main loop
+    masih membaca frame sebelumnya, sehingga depth disalin di thread
+    producer sebelum frame diserahkan. Interface sama dengan Capture pykinect.
+
+    Attributes:
+        depth (np.ndarray): Depth map uint16, None jika gagal diambil
+    """
+
+    __slots__ = ('depth',)
+
+    def __init__(self, capture):
+        """
+        Salin depth map dari capture
+
+        Args:
+            capture: Capture object dari Kinect (masih valid)
+        """
+        ret, depth = capture.get_depth_image()
+        self.depth = depth.copy() if ret and depth is not None else None
+
+    def get_depth_image(self):
+        """
+        Depth map hasil salinan
+
+        Returns:
+            tuple: (success, depth_image uint16)
+        """
+        return self.depth is not None, self.depth
+
+    def get_colored_depth_image(self):
+        """
+        Depth map di-colorize seperti Capture.get_colored_depth_image()
+
+        Returns:
+            tuple: (success, depth_color_image)
+        """
+        if self.depth is None:
+            return False, None
+        import cv2
+        scaled = cv2.convertScaleAbs(self.depth, alpha=0.05)
+        return True, cv2.applyColorMap(scaled, cv2.COLORMAP_JET)
+
+
+class KinectFrame:
+    """
+    Handle ringan untuk satu frame Kinect
+    
+    Image tidak diambil saat frame dibuat. Depth (raw atau color), body
+    index map, body segmentation dan list body baru di-materialize saat
+    diminta consumer,
+    lalu di-cache sehingga permintaan kedua pada frame yang sama gratis.
+    Kegagalan juga di-cache agar tidak dicoba ulang dalam frame yang sama.
+    
+    Attributes:
+        capture: Capture object dari Kinect
+        body_frame: Body frame object
+    """
+    
+    __slots__ = ('capture', 'body_frame', '_source', '_depth',
+                 '_segmentation', '_raw_depth', '_body_index', '_bodies')
+    
+    def __init__(self, source, capture, body_frame):
+        """
+        Inisialisasi KinectFrame
+        
+        Args:
+            source (KinectManager): Manager yang menghasilkan frame
+            capture: Capture object dari Kinect
+            body_frame: Body frame object
+        """
+        self.capture = capture
+        self.body_frame = body_frame
+        self._source = source
+        self._depth = None
+        self._segmentation = None
+        self._raw_depth = None
+        self._body_index = None
+        self._bodies = None
+    
+    def depth_image(self):
+        """
+        Depth color image (di-materialize saat pertama diminta)
+        
+        Returns:
+            tuple: (success, depth_color_image)
+        """
+        if self._depth is None:
+            self._depth = self._source.get_depth_image(self.capture)
+        return self._depth
+    
+    def segmentation_image(self):
+        """
+        Body segmentation image (di-materialize saat pertama diminta)
+        
+        Returns:
+            tuple: (success, body_image_color)
+        """
+        if self._segmentation is None:
+            self._segmentation = self._source.get_body_segmentation(self.body_frame)
+        return self._segmentation
+    
+    def raw_depth(self):
+        """
+        Depth map 16-bit (di-materialize saat pertama diminta)
+        
+        Returns:
+            tuple: (success, depth_image uint16)
+        """
+        if self._raw_depth is None:
+            self._raw_depth = self._source.get_raw_depth(self.capture)
+        return self._raw_depth
+    
+    def body_index_map(self):
+        """
+        Body index map 8-bit (di-materialize saat pertama diminta)
+        
+        Returns:
+            tuple: (success, body_index_map uint8)
+        """
+        if self._body_index is None:
+            self._body_index = self._source.get_body_index_map(self.body_frame)
+        return self._body_index
+    
+    def bodies(self):
+        """
+        Semua body object dalam frame (di-cache)
+        
+        Returns:
+            list: List body object
+        """
+        if self._bodies is None:
+            self._bodies = self._source.get_bodies(self.body_frame)
+        return self._bodies
+
 
 class KinectManager:
     """
     Class untuk mengelola Azure Kinect device
     
+    Pada mode threaded, thread producer terus mengambil capture dan body
+    frame ke LatestFrameSlot sehingga get_frame() selalu mendapat frame
+    terbaru tanpa menunggu device. Capture diserahkan sebagai
+    CaptureSnapshot karena handle capture pykinect dilepas pada update()
+    berikutnya.
+    
     Attributes:
         device: Kinect device object
         body_tracker: Body tracker object
         is_initialized (bool): Status inisialisasi
+        threaded (bool): Mode capture di background thread
+        frames_skipped (int): Frame yang terlewat sejak get_frame() terakhir
+        total_frames_skipped (int): Total frame yang terlewat
     """
     
-    def __init__(self):
-        """Inisialisasi KinectManager"""
-        self.device = None
-        self.body_tracker = None
+    def __init__(self, threaded=None, device=None, body_tracker=None):
+        """
+        Inisialisasi KinectManager
+        
+        Args:
+            threaded (bool, optional): Capture di background thread.
+                Default dari config.
+            device (optional): Device object yang sudah dibuka (mis. fake device
+                untuk testing). Jika diisi, pykinect tidak diinisialisasi.
+            body_tracker (optional): Body tracker yang sudah berjalan
+        """
+        if threaded is None:
+            threaded = KINECT_CONFIG['threaded_capture']
+        
+        self.device = device
+        self.body_tracker = body_tracker
         self.is_initialized = False
+        
+        self.threaded = threaded
+        self.capture_timeout = KINECT_CONFIG['capture_timeout']
+        self.frames_skipped = 0
+        self.total_frames_skipped = 0
+        
+        self._slot = None
+        self._capture_thread = None
+        self._stop_event = threading.Event()
     
     def initialize(self):
         """
@@ -33,6 +326,18 @@ class KinectManager:
         Returns:
             bool: True jika berhasil
         """
+        if self.device is not None and self.body_tracker is not None:
+            # Device dan tracker sudah disediakan dari luar
+            self.is_initialized = True
+            if self.threaded:
+                self._start_capture_thread()
+            return True
+        
+        pykinect = load_pykinect()
+        if pykinect is None:
+            print("❌ pykinect_azure tidak tersedia")
+            return False
+        
         try:
             print("🔧 Inisialisasi Azure Kinect libraries...")
             pykinect.initialize_libraries(track_body=True)
@@ -68,6 +373,10 @@ class KinectManager:
             print("✅ Body tracker started")
             
             self.is_initialized = True
+            
+            if self.threaded:
+                self._start_capture_thread()
+            
             return True
             
         except Exception as e:
@@ -75,24 +384,106 @@ class KinectManager:
             self.is_initialized = False
             return False
     
+    def _read_frame(self):
+        """
+        Ambil satu capture dan body frame langsung dari device
+        
+        Returns:
+            tuple: (capture, body_frame)
+        """
+        capture = self.device.update()
+        body_frame = self.body_tracker.update()
+        return capture, body_frame
+    
+    def _start_capture_thread(self):
+        """Mulai thread producer capture"""
+        self._slot = LatestFrameSlot()
+        self._stop_event.clear()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop,
+            name='KinectCapture',
+            daemon=True
+        )
+        self._capture_thread.start()
+        print("🧵 Capture thread berjalan")
+    
+    def _capture_loop(self):
+        """Loop producer: ambil frame terus-menerus ke slot latest-wins"""
+        while not self._stop_event.is_set():
+            try:
+                capture, body_frame = self._read_frame()
+                if capture is None or body_frame is None:
+                    continue
+                # Salin depth sebelum update() berikutnya melepas capture
+                frame = (CaptureSnapshot(capture), body_frame)
+            except Exception as e:
+                print(f"❌ Error capture thread: {e}")
+                time.sleep(0.01)
+                continue
+            
+            self._slot.put(frame)
+    
+    def _stop_capture_thread(self):
+        """
+        Hentikan thread producer capture
+        
+        Returns:
+            bool: True jika thread sudah berhenti (device aman ditutup)
+        """
+        if self._capture_thread is None:
+            return True
+        
+        self._stop_event.set()
+        self._slot.close()
+        self._capture_thread.join(timeout=self.capture_timeout)
+        if self._capture_thread.is_alive():
+            return False
+        self._capture_thread = None
+        return True
+    
     def get_frame(self):
         """
         Ambil frame dari Kinect
         
+        Pada mode threaded, frame diambil dari slot latest-wins dan jumlah
+        frame yang terlewat disimpan di `frames_skipped`.
+        
         Returns:
             tuple: (capture, body_frame) atau (None, None) jika gagal
         """
         if not self.is_initialized:
             return None, None
         
+        if self._capture_thread is not None:
+            frame, skipped = self._slot.get(timeout=self.capture_timeout)
+            self.frames_skipped = skipped
+            self.total_frames_skipped += skipped
+            if frame is None:
+                return None, None
+            return frame
+        
         try:
-            capture = self.device.update()
-            body_frame = self.body_tracker.update()
-            return capture, body_frame
+            return self._read_frame()
         except Exception as e:
             print(f"❌ Error mendapatkan frame: {e}")
             return None, None
     
+    def get_frame_handle(self):
+        """
+        Ambil frame berikutnya sebagai handle lazy
+        
+        Depth dan segmentation image hanya diambil jika handle diminta,
+        sehingga recognition yang hanya butuh joint tidak membayar biaya
+        image dan tidak ikut gagal saat image gagal diambil.
+        
+        Returns:
+            KinectFrame: Handle frame, atau None jika gagal
+        """
+        capture, body_frame = self.get_frame()
+        if capture is None or body_frame is None:
+            return None
+        return KinectFrame(self, capture, body_frame)
+    
     def get_depth_image(self, capture):
         """
         Ambil depth image dari capture
@@ -133,6 +524,46 @@ class KinectManager:
             print(f"❌ Error mendapatkan body segmentation: {e}")
             return False, None
     
+    def get_raw_depth(self, capture):
+        """
+        Ambil depth map 16-bit (tanpa colorize) dari capture
+        
+        Args:
+            capture: Capture object dari Kinect
+            
+        Returns:
+            tuple: (success, depth_image uint16)
+        """
+        if capture is None:
+            return False, None
+        
+        try:
+            ret, depth_image = capture.get_depth_image()
+            return ret, depth_image
+        except Exception as e:
+            print(f"❌ Error mendapatkan depth image: {e}")
+            return False, None
+    
+    def get_body_index_map(self, body_frame):
+        """
+        Ambil body index map 8-bit (tanpa colorize) dari body frame
+        
+        Args:
+            body_frame: Body frame object
+            
+        Returns:
+            tuple: (success, body_index_map uint8)
+        """
+        if body_frame is None:
+            return False, None
+        
+        try:
+            ret, body_index_map = body_frame.get_body_index_map_image()
+            return ret, body_index_map
+        except Exception as e:
+            print(f"❌ Error mendapatkan body index map: {e}")
+            return False, None
+    
     def get_num_bodies(self, body_frame):
         """
         Dapatkan jumlah body yang terdeteksi
@@ -174,10 +605,46 @@ class KinectManager:
         
         return None
     
+    def get_bodies(self, body_frame):
+        """
+        Dapatkan semua body object dalam body frame
+        
+        Args:
+            body_frame: Body frame object
+            
+        Returns:
+            list: List body object (kosong jika gagal)
+        """
+        if body_frame is None:
+            return []
+        
+        try:
+            num_bodies = self.get_num_bodies(body_frame)
+            return [body_frame.get_body(i) for i in range(num_bodies)]
+        except Exception as e:
+            print(f"❌ Error mendapatkan bodies: {e}")
+        
+        return []
+    
+    def is_finished(self):
+        """
+        Cek apakah sumber frame sudah habis
+        
+        Returns:
+            bool: Selalu False untuk device live
+        """
+        return False
+    
     def cleanup(self):
         """Bersihkan resources Kinect"""
         print("🧹 Membersihkan Kinect resources...")
         
+        if not self._stop_capture_thread():
+            # Thread masih di dalam update(): menutup device sekarang
+            # membebaskan handle yang sedang dipakai
+            print("⚠️  Capture thread belum berhenti, device tidak ditutup")
+            return
+        
         try:
             if self.body_tracker:
                 self.body_tracker.destroy()
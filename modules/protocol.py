@@ -0,0 +1,323 @@
+"""
+Protocol Module
+Protocol biner ringkas untuk perintah robot: frame dengan sequence number,
+checksum, heartbeat dan echo untuk mengukur round-trip latency dan loss
+"""
+
+import threading
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+
+# Layout frame (3 byte, 4 byte jika ada speed):
+#   header : 1 0 T T P C C C   (marker '10', tipe, flag speed, kode perintah)
+#   seq    : sequence number 0-255 (berputar)
+#   speed  : opsional, 0-255
+#   crc    : CRC-8 (poly 0x07) atas semua byte sebelumnya
+HEADER_MARKER = 0x80
+HEADER_MARKER_MASK = 0xC0
+HEADER_SPEED_FLAG = 0x08
+
+MSG_COMMAND = 0
+MSG_HEARTBEAT = 1
+
+FRAME_SIZE = 3
+FRAME_SIZE_SPEED = 4
+
+COMMAND_CODES = {'S': 0, 'F': 1, 'B': 2, 'L': 3, 'R': 4}
+CODE_COMMANDS = {code: command for command, code in COMMAND_CODES.items()}
+
+Frame = namedtuple('Frame', ['msg_type', 'command', 'seq', 'speed'])
+
+
+def _build_crc8_table(poly=0x07):
+    """Tabel CRC-8 per byte"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table.append(crc)
+    return table
+
+
+_CRC8_TABLE = _build_crc8_table()
+
+
+def crc8(data):
+    """
+    Hitung CRC-8 (poly 0x07, init 0)
+
+    Args:
+        data (bytes): Data
+
+    Returns:
+        int: Checksum 0-255
+    """
+    crc = 0
+    for byte in data:
+        crc = _CRC8_TABLE[crc ^ byte]
+    return crc
+
+
+def encode_frame(msg_type, command, seq, speed=None):
+    """
+    Encode satu frame
+
+    Args:
+        msg_type (int): MSG_COMMAND atau MSG_HEARTBEAT
+        command (str): Perintah (F, B, L, R, S)
+        seq (int): Sequence number (dipotong ke 0-255)
+        speed (int, optional): Kecepatan 0-255
+
+    Returns:
+        bytes: Frame siap kirim
+
+    Raises:
+        ValueError: Jika perintah tidak dikenal
+    """
+    if command not in COMMAND_CODES:
+        raise ValueError(f"Perintah tidak dikenal: {command!r}")
+
+    header = HEADER_MARKER | (msg_type & 0x03) << 4 | COMMAND_CODES[command]
+    body = [header, seq & 0xFF]
+    if speed is not None:
+        body[0] |= HEADER_SPEED_FLAG
+        body.append(int(speed) & 0xFF)
+    body.append(crc8(body))
+    return bytes(body)
+
+
+class FrameDecoder:
+    """
+    Decoder stream byte menjadi frame
+
+    Byte yang tidak membentuk frame valid (header salah atau checksum
+    gagal) dibuang satu per satu sampai decoder kembali sinkron.
+
+    Attributes:
+        bad_bytes (int): Jumlah byte yang dibuang
+    """
+
+    def __init__(self):
+        """Inisialisasi FrameDecoder"""
+        self._buffer = bytearray()
+        self.bad_bytes = 0
+
+    def feed(self, data):
+        """
+        Tambahkan data dan ambil semua frame yang lengkap
+
+        Args:
+            data (bytes): Data yang diterima
+
+        Returns:
+            list: List Frame
+        """
+        buffer = self._buffer
+        buffer.extend(data)
+        frames = []
+
+        while buffer:
+            header = buffer[0]
+            if header & HEADER_MARKER_MASK != HEADER_MARKER:
+                del buffer[0]
+                self.bad_bytes += 1
+                continue
+
+            size = FRAME_SIZE_SPEED if header & HEADER_SPEED_FLAG else FRAME_SIZE
+            if len(buffer) < size:
+                break
+
+            command = CODE_COMMANDS.get(header & 0x07)
+            if command is None or crc8(buffer[:size - 1]) != buffer[size - 1]:
+                del buffer[0]
+                self.bad_bytes += 1
+                continue
+
+            speed = buffer[2] if size == FRAME_SIZE_SPEED else None
+            frames.append(Frame((header >> 4) & 0x03, command, buffer[1], speed))
+            del buffer[:size]
+
+        return frames
+
+
+class ProtocolLink:
+    """
+    State protocol biner di sisi host
+
+    Frame diberi sequence number saat benar-benar ditulis ke link. Robot
+    meng-echo setiap frame valid apa adanya; echo dicocokkan dengan frame
+    yang menunggu untuk menghitung round-trip latency, dan frame tanpa echo
+    setelah ack_timeout dihitung hilang. Heartbeat membawa perintah terakhir
+    sehingga perubahan yang hilang diperbaiki pada heartbeat berikutnya dan
+    robot bisa membedakan link putus dari perintah yang ditahan.
+
+    Attributes:
+        heartbeat_interval (float): Jeda heartbeat saat link diam (detik)
+        ack_timeout (float): Batas waktu echo sebelum frame dihitung hilang
+        speed (int): Byte speed default (None = tanpa speed)
+        command (str): Perintah terakhir yang dikirim
+        sent (int): Jumlah frame terkirim
+        acked (int): Jumlah frame yang di-echo
+        lost (int): Jumlah frame tanpa echo
+        bytes_sent (int): Jumlah byte terkirim
+    """
+
+    def __init__(self, heartbeat_interval=1.0, ack_timeout=1.0, speed=None,
+                 rtt_window=256):
+        """
+        Inisialisasi ProtocolLink
+
+        Args:
+            heartbeat_interval (float): Jeda heartbeat (detik)
+            ack_timeout (float): Batas waktu echo (detik)
+            speed (int, optional): Byte speed default
+            rtt_window (int): Jumlah sample RTT untuk persentil
+        """
+        self.heartbeat_interval = heartbeat_interval
+        self.ack_timeout = ack_timeout
+        self.speed = speed
+
+        self.command = 'S'
+        self.sent = 0
+        self.acked = 0
+        self.lost = 0
+        self.bytes_sent = 0
+
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._last_write = None
+        self._inflight = {}
+        self._decoder = FrameDecoder()
+        self._rtts = deque(maxlen=rtt_window)
+
+    def encode_command(self, command, speed=None):
+        """
+        Buat frame perintah dengan sequence number berikutnya
+
+        Args:
+            command (str): Perintah (F, B, L, R, S)
+            speed (int, optional): Kecepatan. Default self.speed.
+
+        Returns:
+            bytes: Frame
+        """
+        self.command = command
+        return self._encode(MSG_COMMAND, command, speed)
+
+    def encode_heartbeat(self):
+        """
+        Buat frame heartbeat yang membawa perintah terakhir
+
+        Returns:
+            bytes: Frame
+        """
+        return self._encode(MSG_HEARTBEAT, self.command, None)
+
+    def _encode(self, msg_type, command, speed):
+        """Encode frame dan catat sebagai menunggu echo"""
+        if speed is None:
+            speed = self.speed
+
+        with self._lock:
+            now = time.perf_counter()
+            self._expire(now)
+
+            seq = self._seq
+            self._seq = (seq + 1) & 0xFF
+            frame = encode_frame(msg_type, command, seq, speed)
+
+            # Seq yang sama masih menunggu setelah 256 frame: anggap hilang
+            if self._inflight.pop(seq, None) is not None:
+                self.lost += 1
+            self._inflight[seq] = now
+
+            self.sent += 1
+            self.bytes_sent += len(frame)
+            self._last_write = now
+        return frame
+
+    def heartbeat_due(self, now=None):
+        """
+        Detik sampai heartbeat berikutnya
+
+        Args:
+            now (float, optional): Waktu perf_counter saat ini
+
+        Returns:
+            float: Sisa waktu (<= 0 jika heartbeat harus dikirim)
+        """
+        if now is None:
+            now = time.perf_counter()
+        if self._last_write is None:
+            return 0.0
+        return self._last_write + self.heartbeat_interval - now
+
+    def receive(self, data):
+        """
+        Proses data dari robot (echo frame)
+
+        Args:
+            data (bytes): Data yang diterima
+
+        Returns:
+            list: Frame yang di-decode
+        """
+        frames = self._decoder.feed(data)
+        now = time.perf_counter()
+
+        with self._lock:
+            for frame in frames:
+                sent_time = self._inflight.pop(frame.seq, None)
+                if sent_time is None:
+                    continue
+                self.acked += 1
+                self._rtts.append(now - sent_time)
+            self._expire(now)
+
+        return frames
+
+    def _expire(self, now):
+        """Hitung frame yang melewati ack_timeout sebagai hilang (dengan lock)"""
+        if not self._inflight:
+            return
+        expired = [seq for seq, sent_time in self._inflight.items()
+                   if now - sent_time > self.ack_timeout]
+        for seq in expired:
+            del self._inflight[seq]
+        self.lost += len(expired)
+
+    def get_stats(self):
+        """
+        Statistik link
+
+        Returns:
+            dict: sent, acked, lost, loss_rate, inflight, bytes_sent,
+                  bad_bytes dan RTT (ms): rtt_last_ms, rtt_avg_ms,
+                  rtt_p95_ms, rtt_max_ms
+        """
+        with self._lock:
+            self._expire(time.perf_counter())
+            rtts = np.array(self._rtts, dtype=np.float64) * 1000
+            resolved = self.acked + self.lost
+            stats = {
+                'sent': self.sent,
+                'acked': self.acked,
+                'lost': self.lost,
+                'loss_rate': self.lost / resolved if resolved else 0.0,
+                'inflight': len(self._inflight),
+                'bytes_sent': self.bytes_sent,
+                'bad_bytes': self._decoder.bad_bytes,
+            }
+
+        if len(rtts):
+            stats.update({
+                'rtt_last_ms': float(rtts[-1]),
+                'rtt_avg_ms': float(rtts.mean()),
+                'rtt_p95_ms': float(np.percentile(rtts, 95)),
+                'rtt_max_ms': float(rtts.max()),
+            })
+
+        return stats
@@ -5,40 +5,128 @@ Mengontrol robot melalui komunikasi serial/Bluetooth
 
 import serial
 import serial.tools.list_ports
+import threading
 import time
 
-from config.settings import ROBOT_CONFIG, GESTURE_COMMANDS
+from config.settings import ROBOT_CONFIG, GESTURE_COMMANDS, GESTURE_RULES
+from .protocol import ProtocolLink
+from .serial_writer import SerialWriter
 
 
 class RobotController:
     """
     Class untuk mengontrol robot via serial/Bluetooth
     
+    Pada mode async_write, port dimiliki oleh SerialWriter (thread terpisah)
+    sehingga frame loop tidak pernah menunggu penulisan serial.
+    
+    Dengan protocol 'binary', perintah dikirim sebagai frame ProtocolLink
+    (sequence number + checksum) hanya saat berubah; link diam dijaga
+    heartbeat (mode async_write) dan echo robot dipakai untuk mengukur
+    round-trip latency dan loss.
+    
+    Jika port_match diisi, port dicari dari HWID/description di
+    list_available_ports() dan hasilnya di-cache. connect_async(),
+    disconnect_async() dan kegagalan tulis ditangani thread supervisor
+    (reconnect dengan backoff) sehingga frame loop tidak pernah menunggu
+    perubahan status link.
+    
     Attributes:
-        port (str): Serial port untuk koneksi
+        port (str): Serial port, URL pyserial (mis. 'loop://') atau
+            'udp://host:port' / 'tcp://host:port' (lihat open_transport)
+        port_match (str): Teks yang dicari di HWID/description port
+        auto_reconnect (bool): Reconnect di background saat link gagal
+        reconnect_attempts (int): Jumlah percobaan reconnect yang gagal
         baud_rate (int): Baud rate komunikasi
-        ser (serial.Serial): Object serial connection
+        ser (serial.Serial): Object serial connection (atau NetworkTransport)
         connected (bool): Status koneksi
+        writer (SerialWriter): Thread penulis (None pada mode sinkron)
+        protocol (str): 'ascii' (satu huruf) atau 'binary' (ProtocolLink)
+        link (ProtocolLink): State protocol biner (None pada mode ascii)
+        config (dict): ROBOT_CONFIG dengan override link ini
     """
     
-    def __init__(self, port=None, baud_rate=None, timeout=None):
+    def __init__(self, port=None, baud_rate=None, timeout=None, async_write=None,
+                 protocol=None, port_match=None, auto_reconnect=None, config=None):
         """
         Inisialisasi RobotController
         
         Args:
-            port (str, optional): Serial port. Default dari config.
+            port (str, optional): Serial port atau URL transport. Default dari config.
             baud_rate (int, optional): Baud rate. Default dari config.
             timeout (int, optional): Timeout. Default dari config.
+            async_write (bool, optional): Tulis via thread SerialWriter.
+                Default dari config.
+            protocol (str, optional): 'ascii' atau 'binary'. Default dari config.
+            port_match (str, optional): Teks HWID/description port robot
+                (mis. 'VID:PID=1A86:7523'). Default dari config.
+            auto_reconnect (bool, optional): Reconnect di background.
+                Default dari config.
+            config (dict, optional): Key ROBOT_CONFIG yang ditimpa untuk robot
+                ini (mis. settle_time, heartbeat_interval, reconnect_*).
+                Argumen di atas tetap didahulukan.
+                
+        Raises:
+            ValueError: Jika protocol tidak dikenal
         """
-        self.port = port or ROBOT_CONFIG['port']
-        self.baud_rate = baud_rate or ROBOT_CONFIG['baud_rate']
-        self.timeout = timeout or ROBOT_CONFIG['timeout']
+        self.config = dict(ROBOT_CONFIG)
+        self.config.update(config or {})
+        
+        self.port = port or self.config['port']
+        self.baud_rate = baud_rate or self.config['baud_rate']
+        self.timeout = timeout or self.config['timeout']
+        if async_write is None:
+            async_write = self.config['async_write']
+        self.async_write = async_write
+        self.protocol = protocol or self.config['protocol']
         
         self.ser = None
+        self.writer = None
+        self._writer_stats = {}     # Statistik writer terakhir setelah ditutup
+        self.link = None
         self.connected = False
         self.last_command = None
+        self.last_speed = None
         self.last_command_time = 0
-        self.command_delay = ROBOT_CONFIG['command_delay']
+        self.command_delay = self.config['command_delay']
+        
+        # Discovery port dan reconnect di background
+        self.port_match = port_match or self.config['port_match']
+        if auto_reconnect is None:
+            auto_reconnect = self.config['auto_reconnect']
+        self.auto_reconnect = auto_reconnect
+        self.reconnect_attempts = 0
+        self._matched_port = None
+        self._link_lock = threading.RLock()
+        self._cond = threading.Condition()
+        self._want_connected = False
+        self._link_failed = False
+        self._supervisor = None
+        
+        # Prioritas gesture -> perintah dari tabel rule
+        self._gesture_priority = {
+            rule['gesture']: rule.get('priority', 0) for rule in GESTURE_RULES
+        }
+        self._gesture_commands = GESTURE_COMMANDS
+        
+        # Divalidasi setelah semua state ada agar __del__ tetap aman
+        if self.protocol not in ('ascii', 'binary'):
+            raise ValueError(f"Protocol tidak dikenal: {self.protocol!r}")
+    
+    def apply_config(self, config):
+        """
+        Terapkan mapping gesture -> perintah dari RuntimeConfig hasil reload
+        
+        Hanya prioritas dan perintah per gesture yang diganti; port, protocol
+        dan parameter link (ROBOT_CONFIG) tetap sampai restart.
+        
+        Args:
+            config (RuntimeConfig): Snapshot config baru
+        """
+        self._gesture_priority = {
+            rule['gesture']: rule.get('priority', 0) for rule in config.rules
+        }
+        self._gesture_commands = config.gesture_commands
     
     @staticmethod
     def list_available_ports():
@@ -60,54 +148,281 @@ class RobotController:
         
         return available_ports
     
+    def find_port(self, match=None, refresh=False):
+        """
+        Cari port robot berdasarkan HWID atau description
+        
+        Hasil di-cache; list_available_ports() hanya dipanggil ulang jika
+        cache kosong, refresh=True, atau koneksi ke port cache gagal.
+        
+        Args:
+            match (str, optional): Teks yang dicari (case-insensitive).
+                Default self.port_match.
+            refresh (bool): Abaikan cache
+            
+        Returns:
+            str: Device port, atau None jika tidak ditemukan
+        """
+        match = match or self.port_match
+        if not match:
+            return None
+        if self._matched_port is not None and not refresh:
+            return self._matched_port
+        
+        needle = match.lower()
+        self._matched_port = None
+        for port in self.list_available_ports():
+            if (needle in port['hwid'].lower() or
+                    needle in port['description'].lower()):
+                self._matched_port = port['device']
+                print(f"🔍 Port robot ditemukan: {port['device']} ({port['description']})")
+                break
+        return self._matched_port
+    
+    def _resolve_port(self):
+        """
+        Port yang dipakai untuk koneksi berikutnya
+        
+        Returns:
+            str: Port hasil discovery, atau self.port jika tidak ada match
+        """
+        return self.find_port() or self.port
+    
     def connect(self):
         """
-        Koneksi ke robot
+        Koneksi ke robot (blocking)
+        
+        Jika gagal dan auto_reconnect aktif, percobaan berikutnya
+        dijalankan di background dengan backoff.
         
         Returns:
             bool: True jika berhasil connect
         """
-        try:
-            self.ser = serial.Serial(
-                self.port, 
-                self.baud_rate, 
-                timeout=self.timeout
-            )
-            self.connected = True
-            print(f"✅ Terhubung ke robot di {self.port}")
+        with self._cond:
+            self._want_connected = True
+        
+        if self._open_link():
+            return True
+        
+        if self.auto_reconnect:
+            self._ensure_supervisor()
+        else:
+            with self._cond:
+                self._want_connected = False
+        return False
+    
+    def connect_async(self):
+        """Koneksi ke robot di background (tidak memblokir)"""
+        with self._cond:
+            self._want_connected = True
+            self._cond.notify_all()
+        self._ensure_supervisor()
+    
+    def disconnect_async(self):
+        """Putuskan koneksi di background (tidak memblokir)"""
+        with self._cond:
+            self._want_connected = False
+            self._cond.notify_all()
+        self._ensure_supervisor()
+    
+    @property
+    def wants_connection(self):
+        """bool: True jika koneksi diminta (terhubung atau sedang reconnect)"""
+        return self._want_connected
+    
+    def _open_link(self):
+        """
+        Buka port, link protocol dan writer
+        
+        Returns:
+            bool: True jika berhasil
+        """
+        with self._link_lock:
+            if self.is_connected():
+                return True
+            
+            # Backend asyncio (UDP/TCP) baru dimuat saat link pertama dibuka
+            from .transport import open_transport
+            
+            port = self._resolve_port()
+            try:
+                ser = open_transport(port, self.baud_rate, self.timeout)
+            except Exception as e:
+                print(f"❌ Gagal koneksi ke {port}: {e}")
+                # Port hasil discovery mungkin berubah (re-enumerasi USB)
+                self._matched_port = None
+                return False
+            
+            self.ser = ser
+            self.link = None
+            if self.protocol == 'binary':
+                self.link = ProtocolLink(
+                    heartbeat_interval=self.config['heartbeat_interval'],
+                    ack_timeout=self.config['ack_timeout'],
+                    speed=self.config['speed']
+                )
             
             # Kirim perintah STOP sebagai inisialisasi
-            time.sleep(0.5)  # Tunggu serial ready
+            if self.async_write:
+                # Jeda serial ready dijalankan di thread writer
+                self.writer = SerialWriter(
+                    self.ser,
+                    settle_time=self.config['settle_time'],
+                    link=self.link,
+                    on_error=self._on_link_error
+                )
+                self.writer.start()
+            else:
+                time.sleep(self.config['settle_time'])  # Tunggu serial ready
+            
+            self.connected = True
+            print(f"✅ Terhubung ke robot di {port}")
+            
+            self.last_command = None
             self.send_command('S')
             
             return True
-        except Exception as e:
-            print(f"❌ Gagal koneksi ke {self.port}: {e}")
-            self.connected = False
-            return False
+    
+    def _on_link_error(self, error):
+        """
+        Tandai link gagal (dipanggil dari writer atau send_command)
+        
+        Args:
+            error (Exception): Error tulis/baca
+        """
+        if not self.auto_reconnect:
+            return
+        with self._cond:
+            if not self._want_connected or self._link_failed:
+                return
+            self._link_failed = True
+            self._cond.notify_all()
+        self._ensure_supervisor()
+    
+    def _ensure_supervisor(self):
+        """Jalankan thread supervisor jika belum berjalan"""
+        with self._cond:
+            if self._supervisor is not None and self._supervisor.is_alive():
+                return
+            self._supervisor = threading.Thread(
+                target=self._supervise,
+                name='RobotLinkSupervisor',
+                daemon=True
+            )
+            self._supervisor.start()
+    
+    def _supervise(self):
+        """Loop supervisor: samakan status link dengan permintaan, dengan backoff"""
+        delay = self.config['reconnect_min_delay']
+        
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: (self._link_failed or
+                             self._want_connected != bool(self.is_connected()))
+                )
+                want = self._want_connected
+                failed, self._link_failed = self._link_failed, False
+            
+            if failed and self.is_connected():
+                print("⚠️  Link robot gagal, reconnect di background...")
+                self._close_link()
+            
+            if not want:
+                self._close_link()
+                delay = self.config['reconnect_min_delay']
+                continue
+            
+            if self._open_link():
+                self.reconnect_attempts = 0
+                delay = self.config['reconnect_min_delay']
+                continue
+            
+            # Backoff eksponensial, dibatalkan jika koneksi tidak lagi diminta
+            self.reconnect_attempts += 1
+            print(f"🔁 Reconnect robot dalam {delay:.1f} detik...")
+            with self._cond:
+                self._cond.wait_for(lambda: not self._want_connected, delay)
+            delay = min(delay * 2, self.config['reconnect_max_delay'])
     
     def disconnect(self):
         """
-        Putuskan koneksi ke robot
+        Putuskan koneksi ke robot (blocking) dan hentikan reconnect
         """
-        if self.ser and self.ser.is_open:
+        with self._cond:
+            self._want_connected = False
+            self._cond.notify_all()
+        self._close_link()
+    
+    def _close_link(self):
+        """Kirim STOP, hentikan writer dan tutup port"""
+        with self._link_lock:
+            is_open = self.ser is not None and self.ser.is_open
+            
             # Kirim STOP sebelum disconnect
-            try:
-                self.send_command('S')
-                time.sleep(0.2)
-            except:
-                pass
+            if self.writer is not None:
+                if is_open:
+                    self.writer.post_urgent(self._payload('S'))
+                self.writer.stop()
+                self._writer_stats = self.writer.get_stats()
+                self.writer = None
+            elif is_open:
+                try:
+                    self.send_command('S')
+                    time.sleep(0.2)
+                except:
+                    pass
             
-            self.ser.close()
             self.connected = False
-            print("🔌 Koneksi terputus")
+            if is_open:
+                try:
+                    self.ser.close()
+                except:
+                    pass
+                print("🔌 Koneksi terputus")
+    
+    def _payload(self, command, speed=None):
+        """
+        Payload untuk SerialWriter sesuai protocol
+        
+        Args:
+            command (str): Perintah (F, B, L, R, S)
+            speed (int, optional): Kecepatan (protocol binary)
+            
+        Returns:
+            bytes atau tuple: Huruf ASCII, atau (command, speed) untuk
+                di-encode writer saat ditulis
+        """
+        if self.link is None:
+            return command.encode()
+        return (command, speed)
+    
+    def _encode(self, command, speed=None):
+        """
+        Byte yang ditulis langsung pada mode sinkron
+        
+        Args:
+            command (str): Perintah (F, B, L, R, S)
+            speed (int, optional): Kecepatan (protocol binary)
+            
+        Returns:
+            bytes: Data untuk ditulis
+        """
+        if self.link is None:
+            return command.encode()
+        
+        # Tanpa thread pembaca: proses echo yang sudah masuk
+        if self.ser.in_waiting:
+            self.link.receive(self.ser.read(self.ser.in_waiting))
+        return self.link.encode_command(command, speed)
     
-    def send_command(self, command):
+    def send_command(self, command, speed=None):
         """
         Kirim perintah ke robot
         
         Args:
             command (str): Perintah yang akan dikirim (F, B, L, R, S)
+            speed (int, optional): Kecepatan 0-255 (hanya protocol binary)
             
         Returns:
             bool: True jika berhasil mengirim
@@ -115,19 +430,34 @@ class RobotController:
         if not self.connected or not self.ser or not self.ser.is_open:
             return False
         
-        # Hindari spam command yang sama dalam waktu singkat
         current_time = time.time()
-        if (self.last_command == command and 
-            current_time - self.last_command_time < self.command_delay):
+        if self.link is not None:
+            # Protocol binary hanya mengirim perubahan; heartbeat menjaga link
+            if self.last_command == command and self.last_speed == speed:
+                return False
+        elif (self.last_command == command and 
+              current_time - self.last_command_time < self.command_delay):
+            # Hindari spam command yang sama dalam waktu singkat
             return False
         
+        writer = self.writer
+        if writer is not None:
+            # Tidak memblokir: perintah lama yang belum terkirim diganti
+            writer.post(self._payload(command, speed))
+            self.last_command = command
+            self.last_speed = speed
+            self.last_command_time = current_time
+            return True
+        
         try:
-            self.ser.write(command.encode())
+            self.ser.write(self._encode(command, speed))
             self.last_command = command
+            self.last_speed = speed
             self.last_command_time = current_time
             return True
         except Exception as e:
             print(f"❌ Error kirim perintah: {e}")
+            self._on_link_error(e)
             return False
     
     def gesture_to_command(self, gestures):
@@ -140,21 +470,13 @@ class RobotController:
         Returns:
             str: Perintah robot (F, B, L, R, S)
         """
-        # Prioritas perintah (urutan penting!)
-        priority_order = [
-            'LAMBAI',           # STOP (prioritas tertinggi)
-            'TANGAN_DI_WAJAH',  # MUNDUR
-            'KEDUA_TANGAN',     # MAJU
-            'TANGAN_KANAN',     # KANAN
-            'TANGAN_KIRI',      # KIRI
-            'NETRAL'            # STOP (default)
-        ]
-        
-        for gesture in priority_order:
-            if gesture in gestures:
-                return GESTURE_COMMANDS.get(gesture, 'S')
+        # Gesture dengan priority tertinggi di GESTURE_RULES menentukan perintah
+        known = [g for g in gestures if g in self._gesture_priority]
+        if not known:
+            return 'S'  # Default: STOP
         
-        return 'S'  # Default: STOP
+        best = max(known, key=self._gesture_priority.__getitem__)
+        return self._gesture_commands[best]
     
     def send_gesture_command(self, gestures):
         """
@@ -178,13 +500,40 @@ class RobotController:
             bool: True jika berhasil
         """
         if self.connected and self.ser and self.ser.is_open:
+            writer = self.writer
+            if writer is not None:
+                writer.post_urgent(self._payload('S'))
+                self.last_command = 'S'
+                self.last_speed = None
+                return True
             try:
-                self.ser.write(b'S')
+                self.ser.write(self._encode('S'))
+                self.last_command = 'S'
+                self.last_speed = None
                 return True
             except:
                 return False
         return False
     
+    def get_link_stats(self):
+        """
+        Dapatkan statistik link serial
+        
+        Returns:
+            dict: Statistik SerialWriter (writes, drops, queue_depth,
+                  latency) dan ProtocolLink (sent, acked, lost, loss_rate,
+                  rtt) jika aktif. Setelah disconnect berisi statistik
+                  writer terakhir; dict kosong jika link belum pernah aktif
+        """
+        stats = {}
+        if self.writer is not None:
+            stats.update(self.writer.get_stats())
+        else:
+            stats.update(self._writer_stats)
+        if self.link is not None:
+            stats.update(self.link.get_stats())
+        return stats
+    
     def is_connected(self):
         """
         Cek status koneksi
@@ -196,4 +545,6 @@ class RobotController:
     
     def __del__(self):
         """Destructor - pastikan koneksi ditutup"""
-        self.disconnect()
+        # __init__ bisa gagal sebelum state koneksi dibuat
+        if getattr(self, '_cond', None) is not None:
+            self.disconnect()
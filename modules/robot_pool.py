@@ -0,0 +1,259 @@
+"""
+Robot Pool Module
+Fan-out satu hasil recognition ke beberapa robot sekaligus
+"""
+
+import threading
+
+from config.settings import ROBOT_CONFIG
+from .robot_controller import RobotController
+
+# Key yang boleh ditimpa per entry ROBOT_CONFIG['robots'] (selain 'name')
+LINK_KEYS = frozenset(ROBOT_CONFIG) - {'robots'}
+
+
+class RobotPool:
+    """
+    Kumpulan RobotController yang menerima perintah yang sama
+
+    Setiap link punya RobotController sendiri (port, SerialWriter, rate
+    limit command_delay, status koneksi dan reconnect) dengan ROBOT_CONFIG
+    yang ditimpa entry link tersebut. Dengan lebih dari satu link, setiap
+    link wajib async_write sehingga penulisan berjalan paralel dan link
+    Bluetooth yang lambat tidak menahan link lain. Interface mengikuti
+    RobotController agar main loop tidak perlu tahu jumlah robot.
+
+    Attributes:
+        links (dict): Nama link -> RobotController (urutan sesuai config)
+    """
+
+    def __init__(self, links=None):
+        """
+        Inisialisasi RobotPool
+
+        Args:
+            links (list, optional): List dict per robot (key 'name' dan key
+                ROBOT_CONFIG yang ingin ditimpa, mis. 'port', 'port_match',
+                'protocol', 'command_delay', 'settle_time'). Default
+                ROBOT_CONFIG['robots']; kosong = satu robot dari ROBOT_CONFIG.
+
+        Raises:
+            ValueError: Jika nama duplikat, key link tidak dikenal, atau
+                async_write=False dengan lebih dari satu robot
+        """
+        if links is None:
+            links = ROBOT_CONFIG['robots']
+        if not links:
+            links = [{}]
+
+        self.links = {}
+        for index, link in enumerate(links):
+            name = link.get('name') or f"robot{index}"
+            if name in self.links:
+                raise ValueError(f"Nama robot duplikat: {name!r}")
+
+            overrides = {key: value for key, value in link.items()
+                         if key != 'name'}
+            unknown = set(overrides) - LINK_KEYS
+            if unknown:
+                raise ValueError(f"Key tidak dikenal untuk robot {name!r}: "
+                                 f"{sorted(unknown)}")
+
+            robot = RobotController(config=overrides)
+            if len(links) > 1 and not robot.async_write:
+                # Tulis sinkron satu link akan menahan link berikutnya
+                raise ValueError(f"Robot {name!r}: async_write=False tidak "
+                                 "didukung untuk lebih dari satu robot")
+            self.links[name] = robot
+
+        # Prioritas gesture sama untuk semua link
+        self._mapper = next(iter(self.links.values()))
+
+    def __len__(self):
+        return len(self.links)
+
+    def _each(self, method, *args):
+        """
+        Panggil method setiap link secara paralel (untuk operasi blocking)
+
+        Returns:
+            dict: Nama link -> hasil
+        """
+        if len(self.links) == 1:
+            name, robot = next(iter(self.links.items()))
+            return {name: getattr(robot, method)(*args)}
+
+        results = {}
+
+        def call(name, robot):
+            results[name] = getattr(robot, method)(*args)
+
+        threads = [threading.Thread(target=call, args=item, daemon=True)
+                   for item in self.links.items()]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def connect(self):
+        """
+        Koneksi ke semua robot (paralel, blocking)
+
+        Returns:
+            bool: True jika minimal satu robot terhubung
+        """
+        results = self._each('connect')
+        if len(self.links) > 1:
+            connected = sum(results.values())
+            print(f"🤖 {connected}/{len(self.links)} robot terhubung")
+        return any(results.values())
+
+    def disconnect(self):
+        """Putuskan semua koneksi (paralel, blocking)"""
+        self._each('disconnect')
+
+    def connect_async(self):
+        """Koneksi ke semua robot di background"""
+        for robot in self.links.values():
+            robot.connect_async()
+
+    def disconnect_async(self):
+        """Putuskan semua koneksi di background"""
+        for robot in self.links.values():
+            robot.disconnect_async()
+
+    @property
+    def wants_connection(self):
+        """bool: True jika koneksi diminta untuk minimal satu robot"""
+        return any(robot.wants_connection for robot in self.links.values())
+
+    @property
+    def auto_reconnect(self):
+        """bool: True jika minimal satu robot reconnect otomatis"""
+        return any(robot.auto_reconnect for robot in self.links.values())
+
+    def gesture_to_command(self, gestures):
+        """
+        Konversi gesture ke perintah robot (lihat RobotController)
+
+        Args:
+            gestures (list): List gesture yang terdeteksi
+
+        Returns:
+            str: Perintah robot (F, B, L, R, S)
+        """
+        return self._mapper.gesture_to_command(gestures)
+
+    def apply_config(self, config):
+        """
+        Terapkan mapping gesture -> perintah baru ke semua robot
+
+        Args:
+            config (RuntimeConfig): Snapshot config baru
+        """
+        for robot in self.links.values():
+            robot.apply_config(config)
+
+    def send_command(self, command, speed=None):
+        """
+        Kirim perintah ke semua robot
+
+        Setiap link menerapkan rate limit sendiri; dengan lebih dari satu
+        link pemanggilan hanya memposting ke writer masing-masing (async_write
+        wajib) sehingga tidak ada link yang menunggu link lain.
+
+        Args:
+            command (str): Perintah (F, B, L, R, S)
+            speed (int, optional): Kecepatan (protocol binary)
+
+        Returns:
+            bool: True jika terkirim ke minimal satu robot
+        """
+        sent = False
+        for robot in self.links.values():
+            sent = robot.send_command(command, speed) or sent
+        return sent
+
+    def send_gesture_command(self, gestures):
+        """
+        Konversi gesture dan kirim perintah ke semua robot
+
+        Args:
+            gestures (list): List gesture yang terdeteksi
+
+        Returns:
+            tuple: (command, success)
+        """
+        command = self.gesture_to_command(gestures)
+        return command, self.send_command(command)
+
+    def emergency_stop(self):
+        """
+        Kirim STOP darurat ke semua robot
+
+        Returns:
+            bool: True jika terkirim ke minimal satu robot
+        """
+        stopped = False
+        for robot in self.links.values():
+            stopped = robot.emergency_stop() or stopped
+        return stopped
+
+    def is_connected(self):
+        """
+        Cek status koneksi
+
+        Returns:
+            bool: True jika minimal satu robot terhubung
+        """
+        return any(robot.is_connected() for robot in self.links.values())
+
+    def get_health(self):
+        """
+        Status setiap link
+
+        Returns:
+            dict: Nama link -> {connected, wants_connection,
+                reconnect_attempts, last_command}
+        """
+        return {
+            name: {
+                'connected': bool(robot.is_connected()),
+                'wants_connection': robot.wants_connection,
+                'reconnect_attempts': robot.reconnect_attempts,
+                'last_command': robot.last_command,
+            }
+            for name, robot in self.links.items()
+        }
+
+    def get_link_stats(self):
+        """
+        Statistik link per robot
+
+        Returns:
+            dict: Nama link -> RobotController.get_link_stats()
+        """
+        return {name: robot.get_link_stats()
+                for name, robot in self.links.items()}
+
+    def print_link_stats(self):
+        """Cetak ringkasan latency dan drop setiap link"""
+        stats = self.get_link_stats()
+        if not any(stats.values()):
+            return
+
+        print("\n📡 Statistik Link Robot:")
+        for name, link in stats.items():
+            if not link:
+                print(f"  - {name}: -")
+                continue
+            line = (f"  - {name}: {link.get('writes', 0)} tulis, "
+                    f"{link.get('drops', 0)} drop, {link.get('errors', 0)} error")
+            if 'latency_avg_ms' in link:
+                line += (f", latency avg {link['latency_avg_ms']:.2f}ms "
+                         f"p95 {link['latency_p95_ms']:.2f}ms")
+            if 'rtt_avg_ms' in link:
+                line += (f", RTT avg {link['rtt_avg_ms']:.1f}ms "
+                         f"loss {link['loss_rate']:.1%}")
+            print(line)
@@ -0,0 +1,305 @@
+"""
+Serial Writer Module
+Thread penulis serial non-blocking dengan coalescing perintah terbaru
+"""
+
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+
+class SerialWriter:
+    """
+    Thread yang memiliki port serial dan menulis perintah di background
+
+    Frame loop hanya memposting perintah yang diinginkan. Jika link masih
+    sibuk, perintah lama yang belum terkirim dibuang dan diganti perintah
+    terbaru. Perintah urgent (emergency stop) selalu dikirim lebih dulu dan
+    membuang perintah normal yang masih menunggu.
+
+    Dengan ProtocolLink, payload yang diposting adalah (command, speed) dan
+    baru di-encode menjadi frame saat ditulis, sehingga perintah yang
+    tertimpa tidak memakai sequence number. Saat link diam, writer mengirim
+    heartbeat setiap heartbeat_interval, dan thread pembaca meneruskan echo
+    dari robot ke link.
+
+    Attributes:
+        ser: Object serial (serial.Serial atau hasil serial_for_url)
+        settle_time (float): Jeda setelah port dibuka sebelum menulis (detik),
+            tidak dihitung dalam latency
+        link (ProtocolLink): State protocol biner (None = payload mentah)
+        writes (int): Jumlah perintah yang berhasil ditulis
+        heartbeats (int): Jumlah heartbeat yang ditulis
+        drops (int): Jumlah perintah yang dibuang karena tertimpa
+        errors (int): Jumlah error saat menulis
+    """
+
+    def __init__(self, ser, settle_time=0.0, latency_window=256, link=None,
+                 on_error=None):
+        """
+        Inisialisasi SerialWriter
+
+        Args:
+            ser: Object serial yang sudah terbuka
+            settle_time (float): Jeda sebelum penulisan pertama (detik)
+            latency_window (int): Jumlah sample latency untuk persentil
+            link (ProtocolLink, optional): Protocol biner dengan heartbeat
+            on_error (callable, optional): Dipanggil dengan exception saat
+                tulis/baca gagal (mis. untuk reconnect)
+        """
+        self.ser = ser
+        self.settle_time = settle_time
+        self.link = link
+        self.on_error = on_error
+
+        self.writes = 0
+        self.heartbeats = 0
+        self.drops = 0
+        self.errors = 0
+        self.max_queue_depth = 0
+
+        self._cond = threading.Condition()
+        self._pending = None
+        self._urgent = None
+        self._running = False
+        self._thread = None
+        self._reader = None
+
+        self._latencies = deque(maxlen=latency_window)
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+
+    def start(self):
+        """Mulai thread penulis"""
+        if self._thread is not None:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name='SerialWriter',
+            daemon=True
+        )
+        self._thread.start()
+
+        if self.link is not None:
+            self._reader = threading.Thread(
+                target=self._read_loop,
+                name='SerialReader',
+                daemon=True
+            )
+            self._reader.start()
+
+    def post(self, payload):
+        """
+        Posting perintah normal (latest-wins)
+
+        Args:
+            payload: Data yang akan ditulis (bytes), atau (command, speed)
+                jika memakai ProtocolLink
+        """
+        with self._cond:
+            if self._pending is not None:
+                self.drops += 1
+            self._pending = (payload, time.perf_counter())
+            self._update_depth()
+            self._cond.notify()
+
+    def post_urgent(self, payload):
+        """
+        Posting perintah urgent yang melompati antrian
+
+        Perintah normal yang belum terkirim dibuang agar tidak menimpa
+        perintah urgent setelah dikirim.
+
+        Args:
+            payload: Data yang akan ditulis (lihat post())
+        """
+        with self._cond:
+            if self._pending is not None:
+                self.drops += 1
+                self._pending = None
+            self._urgent = (payload, time.perf_counter())
+            self._update_depth()
+            self._cond.notify()
+
+    def _update_depth(self):
+        """Catat kedalaman antrian maksimal (dipanggil dengan lock)"""
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+    @property
+    def queue_depth(self):
+        """int: Jumlah perintah yang menunggu dikirim"""
+        return (self._pending is not None) + (self._urgent is not None)
+
+    def is_alive(self):
+        """
+        Cek apakah thread penulis masih berjalan
+
+        Returns:
+            bool: True jika thread berjalan
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def _next_item(self):
+        """
+        Tunggu perintah berikutnya, urgent lebih dulu
+
+        Returns:
+            tuple: (payload, post_time), (None, None) untuk heartbeat,
+                atau None jika writer dihentikan
+        """
+        with self._cond:
+            while (self._urgent is None and self._pending is None and
+                   self._running):
+                if self.link is None:
+                    self._cond.wait()
+                    continue
+
+                # Link diam: kirim heartbeat saat jatuh tempo
+                timeout = self.link.heartbeat_due()
+                if timeout <= 0:
+                    return None, None
+                self._cond.wait(timeout)
+
+            if self._urgent is not None:
+                item, self._urgent = self._urgent, None
+            elif self._pending is not None:
+                item, self._pending = self._pending, None
+            else:
+                item = None
+            return item
+
+    def _run(self):
+        """Loop thread penulis"""
+        # Tunggu serial siap tanpa memblokir frame loop
+        if self.settle_time > 0:
+            with self._cond:
+                self._cond.wait_for(lambda: not self._running,
+                                    self.settle_time)
+
+        # Latency dihitung sejak port siap: perintah yang diposting selama
+        # settle tidak ikut menghitung jeda settle
+        ready_time = time.perf_counter()
+
+        while True:
+            item = self._next_item()
+            if item is None:
+                break
+
+            payload, post_time = item
+            try:
+                self.ser.write(self._encode(payload))
+                self.ser.flush()
+            except Exception as e:
+                self.errors += 1
+                print(f"❌ Error kirim perintah: {e}")
+                self._report_error(e)
+                continue
+
+            if post_time is None:
+                self.heartbeats += 1
+                continue
+
+            latency = time.perf_counter() - max(post_time, ready_time)
+            self.writes += 1
+            self._latencies.append(latency)
+            self._latency_sum += latency
+            self._latency_max = max(self._latency_max, latency)
+
+    def _encode(self, payload):
+        """
+        Ubah payload menjadi byte yang ditulis
+
+        Args:
+            payload: bytes, (command, speed), atau None untuk heartbeat
+
+        Returns:
+            bytes: Data untuk ditulis
+        """
+        if self.link is None:
+            return payload
+        if payload is None:
+            return self.link.encode_heartbeat()
+        return self.link.encode_command(*payload)
+
+    def _report_error(self, error):
+        """Teruskan error ke callback on_error"""
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def _read_loop(self):
+        """Loop thread pembaca: teruskan echo dari robot ke link"""
+        while self._running:
+            try:
+                data = self.ser.read(max(1, self.ser.in_waiting))
+            except Exception as e:
+                if self._running:
+                    self.errors += 1
+                    print(f"❌ Error baca serial: {e}")
+                    self._report_error(e)
+                    time.sleep(0.1)
+                continue
+
+            if data:
+                self.link.receive(data)
+
+    def stop(self, timeout=1.0):
+        """
+        Hentikan thread setelah perintah yang menunggu terkirim
+
+        Args:
+            timeout (float): Waktu tunggu maksimal (detik)
+        """
+        if self._thread is None:
+            return
+
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+        if self._reader is not None:
+            # Bangunkan read() yang sedang menunggu (jika didukung port)
+            cancel_read = getattr(self.ser, 'cancel_read', None)
+            if cancel_read is not None:
+                try:
+                    cancel_read()
+                except Exception:
+                    pass
+            self._reader.join(timeout=timeout)
+            self._reader = None
+
+    def get_stats(self):
+        """
+        Dapatkan statistik penulisan
+
+        Returns:
+            dict: writes, heartbeats, drops, errors, queue_depth,
+                  max_queue_depth dan latency (ms): latency_last_ms,
+                  latency_avg_ms, latency_p95_ms, latency_max_ms
+        """
+        with self._cond:
+            latencies = np.array(self._latencies, dtype=np.float64) * 1000
+            stats = {
+                'writes': self.writes,
+                'heartbeats': self.heartbeats,
+                'drops': self.drops,
+                'errors': self.errors,
+                'queue_depth': self.queue_depth,
+                'max_queue_depth': self.max_queue_depth,
+            }
+
+        if self.writes:
+            stats.update({
+                'latency_last_ms': float(latencies[-1]),
+                'latency_avg_ms': self._latency_sum / self.writes * 1000,
+                'latency_p95_ms': float(np.percentile(latencies, 95)),
+                'latency_max_ms': self._latency_max * 1000,
+            })
+
+        return stats
@@ -0,0 +1,480 @@
+"""
+Skeleton Session Module
+Rekam joint tubuh per frame ke file biner dan putar ulang tanpa Azure Kinect
+"""
+
+import os
+import time
+
+import numpy as np
+
+from config.settings import KINECT_CONFIG
+from .kinect_manager import (
+    KinectManager, DEPTH_RESOLUTIONS, BODY_INDEX_BACKGROUND, body_id
+)
+
+# Jumlah joint Azure Kinect Body Tracking (K4ABT_JOINT_COUNT)
+JOINT_COUNT = 32
+
+# Header file: magic, versi, jumlah joint, ukuran record (little-endian)
+SESSION_MAGIC = b'RGC-SKEL'
+SESSION_VERSION = 1
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u2'),
+    ('joint_count', '<u2'),
+    ('record_size', '<u4'),
+])
+
+
+def record_dtype(joint_count=JOINT_COUNT):
+    """
+    Dtype satu record (satu body pada satu frame)
+
+    Frame tanpa body disimpan sebagai satu record dengan num_bodies = 0
+    sehingga timestamp setiap frame tetap tercatat.
+
+    Args:
+        joint_count (int): Jumlah joint per body
+
+    Returns:
+        np.dtype: Structured dtype (packed) untuk np.memmap
+    """
+    return np.dtype([
+        ('frame', '<u4'),
+        ('num_bodies', '<u2'),
+        ('body_index', '<u2'),
+        ('timestamp_usec', '<u8'),
+        ('body_id', '<u4'),
+        ('positions', '<f4', (joint_count, 3)),
+        ('confidence', 'u1', (joint_count,)),
+    ])
+
+
+def frame_timestamp_usec(body_frame):
+    """
+    Ambil device timestamp dari body frame
+
+    Args:
+        body_frame: Body frame object
+
+    Returns:
+        int: Timestamp dalam mikrodetik (monotonic clock jika tidak tersedia)
+    """
+    try:
+        return int(body_frame.get_device_timestamp_usec())
+    except Exception:
+        return time.monotonic_ns() // 1000
+
+
+class SessionRecorder:
+    """
+    Perekam joint tubuh ke file biner yang bisa di-memory-map
+
+    Record ditampung di buffer preallocated dan ditulis per blok.
+
+    Attributes:
+        path (str): Path file session
+        frames (int): Jumlah frame yang sudah direkam
+    """
+
+    def __init__(self, path, flush_records=256):
+        """
+        Inisialisasi SessionRecorder dan tulis header file
+
+        Args:
+            path (str): Path file session
+            flush_records (int): Jumlah record per blok penulisan
+        """
+        self.path = path
+        self.frames = 0
+        self.dtype = record_dtype()
+
+        self._buffer = np.zeros(flush_records, dtype=self.dtype)
+        self._count = 0
+
+        header = np.array(
+            [(SESSION_MAGIC, SESSION_VERSION, JOINT_COUNT, self.dtype.itemsize)],
+            dtype=HEADER_DTYPE
+        )
+        self._file = open(path, 'wb')
+        self._file.write(header.tobytes())
+
+    def _next_record(self):
+        """Ambil record kosong berikutnya dari buffer"""
+        if self._count == len(self._buffer):
+            self.flush()
+        record = self._buffer[self._count]
+        self._count += 1
+        return record
+
+    @staticmethod
+    def _fill_joints(record, body):
+        """
+        Salin posisi dan confidence semua joint body ke record
+
+        Args:
+            record: Record numpy tujuan
+            body: Body object (pykinect atau ReplayBody)
+        """
+        positions = getattr(body, 'positions', None)
+        if positions is not None:
+            record['positions'] = positions
+            record['confidence'] = body.confidences
+            return
+
+        for i, joint in enumerate(body.joints[:JOINT_COUNT]):
+            if joint is None:
+                record['positions'][i] = np.nan
+                record['confidence'][i] = 0
+                continue
+            pos = joint.position
+            record['positions'][i] = (pos.x, pos.y, pos.z)
+            record['confidence'][i] = joint.confidence_level
+
+    def record(self, bodies, timestamp_usec):
+        """
+        Rekam semua body pada satu frame
+
+        Args:
+            bodies (list): List body object
+            timestamp_usec (int): Device timestamp frame (mikrodetik)
+        """
+        num_bodies = len(bodies)
+
+        for index in range(max(num_bodies, 1)):
+            record = self._next_record()
+            record['frame'] = self.frames
+            record['num_bodies'] = num_bodies
+            record['body_index'] = index
+            record['timestamp_usec'] = timestamp_usec
+
+            if num_bodies:
+                body = bodies[index]
+                record['body_id'] = body_id(body, index)
+                self._fill_joints(record, body)
+            else:
+                record['body_id'] = 0
+
+        self.frames += 1
+
+    def flush(self):
+        """Tulis record yang masih di buffer ke file"""
+        if self._count:
+            self._file.write(self._buffer[:self._count].tobytes())
+            self._count = 0
+        self._file.flush()
+
+    def close(self):
+        """Flush dan tutup file"""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+        print(f"💾 Session tersimpan: {self.path} ({self.frames} frame)")
+
+
+_BLANK_IMAGES = {}
+
+
+def _blank_image(channels=(3,), dtype=np.uint8, fill=0):
+    """
+    Image konstan seukuran depth mode di config (dibuat sekali per jenis)
+
+    Args:
+        channels (tuple): Shape channel, mis. (3,) atau ()
+        dtype: Tipe data image
+        fill (int): Nilai piksel
+
+    Returns:
+        np.ndarray: Image (height, width) + channels
+    """
+    key = (channels, np.dtype(dtype).str, fill)
+    image = _BLANK_IMAGES.get(key)
+    if image is None:
+        height, width = DEPTH_RESOLUTIONS[KINECT_CONFIG['depth_mode']]
+        image = np.full((height, width) + channels, fill, dtype=dtype)
+        _BLANK_IMAGES[key] = image
+    return image
+
+
+class _ReplayPosition:
+    """Posisi joint dengan atribut x, y, z seperti k4a_float3_t"""
+
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class _ReplayJoint:
+    """Joint dengan atribut position dan confidence_level seperti pykinect"""
+
+    __slots__ = ('position', 'confidence_level')
+
+    def __init__(self, position, confidence_level):
+        self.position = _ReplayPosition(*position)
+        self.confidence_level = int(confidence_level)
+
+
+class ReplayBody:
+    """
+    Body hasil replay dengan interface yang kompatibel dengan pykinect Body
+
+    Attributes:
+        id (int): ID body dari tracker saat rekaman
+        positions (np.ndarray): Posisi joint (JOINT_COUNT, 3)
+        confidences (np.ndarray): Confidence joint (JOINT_COUNT,)
+    """
+
+    def __init__(self, record):
+        """
+        Inisialisasi ReplayBody
+
+        Args:
+            record: Record numpy dari file session
+        """
+        self.id = int(record['body_id'])
+        self.positions = record['positions']
+        self.confidences = record['confidence']
+        self._joints = None
+
+    @property
+    def joints(self):
+        """list: Joint object (dibuat saat pertama kali diakses)"""
+        if self._joints is None:
+            self._joints = [
+                _ReplayJoint(pos, conf)
+                for pos, conf in zip(self.positions.tolist(),
+                                     self.confidences.tolist())
+            ]
+        return self._joints
+
+
+class ReplayBodyFrame:
+    """Body frame hasil replay dengan interface pykinect Frame"""
+
+    def __init__(self, records, timestamp_usec):
+        """
+        Inisialisasi ReplayBodyFrame
+
+        Args:
+            records: Record numpy milik frame ini
+            timestamp_usec (int): Device timestamp frame
+        """
+        self._records = records
+        self._timestamp_usec = timestamp_usec
+        self._num_bodies = int(records[0]['num_bodies'])
+
+    def get_num_bodies(self):
+        """Jumlah body pada frame"""
+        return self._num_bodies
+
+    def get_body(self, index=0):
+        """Body ke-index pada frame"""
+        return ReplayBody(self._records[index])
+
+    def get_device_timestamp_usec(self):
+        """Device timestamp frame (mikrodetik)"""
+        return self._timestamp_usec
+
+    def get_segmentation_image(self):
+        """Segmentation tidak direkam: kembalikan image hitam"""
+        return True, _blank_image()
+
+    def get_body_index_map_image(self):
+        """Body index map tidak direkam: kembalikan map tanpa body"""
+        return True, _blank_image((), np.uint8, BODY_INDEX_BACKGROUND)
+
+    def draw_bodies(self, image, *args, **kwargs):
+        """Skeleton tidak digambar (tidak ada kalibrasi kamera)"""
+        return image
+
+
+class ReplayCapture:
+    """Capture hasil replay (depth tidak direkam)"""
+
+    def get_colored_depth_image(self):
+        """Depth tidak direkam: kembalikan image hitam"""
+        return True, _blank_image()
+
+    def get_depth_image(self):
+        """Depth tidak direkam: kembalikan depth map nol"""
+        return True, _blank_image((), np.uint16)
+
+
+class SessionReplay(KinectManager):
+    """
+    Sumber frame dari file session dengan interface KinectManager
+
+    File dibuka dengan np.memmap sehingga session berjam-jam tidak dimuat
+    ke memori. Pada mode realtime, frame diputar sesuai device timestamp;
+    jika tidak, frame diputar secepat mungkin.
+
+    Attributes:
+        path (str): Path file session
+        realtime (bool): Putar sesuai timestamp rekaman
+        loop (bool): Ulangi dari awal saat session habis
+        num_frames (int): Jumlah frame dalam session
+    """
+
+    def __init__(self, path, realtime=False, loop=False, threaded=False):
+        """
+        Inisialisasi SessionReplay
+
+        Args:
+            path (str): Path file session
+            realtime (bool): Putar sesuai timestamp rekaman
+            loop (bool): Ulangi dari awal saat session habis
+            threaded (bool): Baca frame di background thread
+        """
+        super().__init__(threaded=threaded)
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+
+        self.records = None
+        self.num_frames = 0
+        self._frame_starts = None
+        self._position = 0
+        self._finished = False
+        self._capture = ReplayCapture()
+        self._clock_start = None
+
+    @staticmethod
+    def open_records(path):
+        """
+        Memory-map record dari file session
+
+        Args:
+            path (str): Path file session
+
+        Returns:
+            np.memmap: Array record (read-only)
+
+        Raises:
+            ValueError: Jika file bukan session yang valid
+        """
+        header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+        if len(header) == 0 or header[0]['magic'] != SESSION_MAGIC:
+            raise ValueError(f"Bukan file session: {path}")
+
+        dtype = record_dtype(int(header[0]['joint_count']))
+        if dtype.itemsize != header[0]['record_size']:
+            raise ValueError(f"Ukuran record tidak cocok: {path}")
+
+        data_size = os.path.getsize(path) - HEADER_DTYPE.itemsize
+        count = data_size // dtype.itemsize
+        if count == 0:
+            return np.zeros(0, dtype=dtype)
+
+        return np.memmap(path, dtype=dtype, mode='r',
+                         offset=HEADER_DTYPE.itemsize, shape=(count,))
+
+    @staticmethod
+    def frame_starts(records):
+        """
+        Index record pertama setiap frame
+
+        Args:
+            records (np.ndarray): Array record dari open_records()
+
+        Returns:
+            np.ndarray: Index int64 (num_frames + 1,); record frame ke-i ada
+                di records[starts[i]:starts[i + 1]]
+        """
+        frames = records['frame']
+        if len(frames) == 0:
+            return np.zeros(1, dtype=np.int64)
+        boundaries = np.flatnonzero(frames[1:] != frames[:-1]) + 1
+        return np.concatenate(([0], boundaries, [len(frames)])).astype(np.int64)
+
+    def initialize(self):
+        """
+        Buka file session
+
+        Returns:
+            bool: True jika berhasil
+        """
+        try:
+            self.records = self.open_records(self.path)
+        except Exception as e:
+            print(f"❌ Error membuka session: {e}")
+            self.is_initialized = False
+            return False
+
+        self._frame_starts = self.frame_starts(self.records)
+        self.num_frames = len(self._frame_starts) - 1
+        self._position = 0
+        self._finished = self.num_frames == 0
+        self._clock_start = None
+
+        print(f"📼 Replay session {self.path} ({self.num_frames} frame)")
+        self.is_initialized = True
+
+        if self.threaded:
+            self._start_capture_thread()
+
+        return True
+
+    def _read_frame(self):
+        """
+        Ambil frame berikutnya dari session
+
+        Returns:
+            tuple: (capture, body_frame) atau (None, None) jika habis
+        """
+        if self._position >= self.num_frames:
+            if not self.loop or self.num_frames == 0:
+                self._finished = True
+                if self.threaded:
+                    # Hindari busy loop di capture thread
+                    time.sleep(self.capture_timeout)
+                return None, None
+            self._position = 0
+            self._clock_start = None
+
+        start = self._frame_starts[self._position]
+        end = self._frame_starts[self._position + 1]
+        records = self.records[start:end]
+        timestamp = int(records[0]['timestamp_usec'])
+        self._position += 1
+
+        if self.realtime:
+            self._wait_until(timestamp)
+
+        return self._capture, ReplayBodyFrame(records, timestamp)
+
+    def _wait_until(self, timestamp_usec):
+        """
+        Tunggu sampai waktu replay mencapai timestamp frame
+
+        Args:
+            timestamp_usec (int): Device timestamp frame
+        """
+        now = time.perf_counter()
+        if self._clock_start is None:
+            self._clock_start = (now, timestamp_usec)
+            return
+
+        wall_start, ts_start = self._clock_start
+        delay = wall_start + (timestamp_usec - ts_start) / 1e6 - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def is_finished(self):
+        """
+        Cek apakah session sudah habis diputar
+
+        Returns:
+            bool: True jika semua frame sudah diputar (dan tidak loop)
+        """
+        return self._finished
+
+    def cleanup(self):
+        """Tutup file session"""
+        self._stop_capture_thread()
+        self.records = None
+        self.is_initialized = False
@@ -0,0 +1,188 @@
+"""
+Sprite Cache Module
+Overlay teks/kotak yang di-render sekali lalu di-blit ke frame
+"""
+
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+
+class Sprite:
+    """
+    Potongan overlay yang sudah di-render beserta mask-nya
+
+    Piksel disimpan premultiplied terhadap latar hitam. Piksel yang tertutup
+    penuh (kotak dan teks di dalamnya) cukup disalin; hanya tepi teks
+    anti-aliasing di luar kotak yang di-blend dengan frame.
+
+    Attributes:
+        pixels (np.ndarray): Piksel overlay (h, w[, c])
+        opaque (np.ndarray): Mask piksel tertutup penuh, None jika seluruh
+            persegi panjang tertutup (blit cukup dengan satu copy)
+        x (int): Posisi kiri pada frame
+        y (int): Posisi atas pada frame
+    """
+
+    __slots__ = ('pixels', 'opaque', 'x', 'y', '_edge_y', '_edge_x', '_edge_inv')
+
+    def __init__(self, pixels, alpha, x, y):
+        """
+        Inisialisasi Sprite
+
+        Args:
+            pixels (np.ndarray): Piksel overlay premultiplied
+            alpha (np.ndarray): Coverage uint8 (h, w), 255 = tertutup penuh
+            x (int): Posisi kiri pada frame
+            y (int): Posisi atas pada frame
+        """
+        self.pixels = pixels
+        self.x = x
+        self.y = y
+
+        full = alpha == 255
+        if full.all():
+            self.opaque = None
+        else:
+            self.opaque = full[:, :, np.newaxis] if pixels.ndim == 3 else full
+
+        # Piksel tepi (tertutup sebagian) untuk blending
+        self._edge_y, self._edge_x = np.nonzero((alpha > 0) & ~full)
+        inv = 255 - alpha[self._edge_y, self._edge_x].astype(np.uint16)
+        self._edge_inv = inv[:, np.newaxis] if pixels.ndim == 3 else inv
+
+    def blit(self, image):
+        """
+        Salin sprite ke image (di-clip ke batas image)
+
+        Args:
+            image (np.ndarray): Frame tujuan
+        """
+        height, width = image.shape[:2]
+        sprite_h, sprite_w = self.pixels.shape[:2]
+
+        x0, y0 = max(self.x, 0), max(self.y, 0)
+        x1 = min(self.x + sprite_w, width)
+        y1 = min(self.y + sprite_h, height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        src = (slice(y0 - self.y, y1 - self.y), slice(x0 - self.x, x1 - self.x))
+        dst = image[y0:y1, x0:x1]
+        if self.opaque is None:
+            dst[...] = self.pixels[src]
+            return
+
+        np.copyto(dst, self.pixels[src], where=self.opaque[src])
+
+        if len(self._edge_y):
+            ys = self._edge_y + self.y
+            xs = self._edge_x + self.x
+            inside = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+            under = image[ys[inside], xs[inside]].astype(np.uint16)
+            over = self.pixels[self._edge_y[inside], self._edge_x[inside]]
+            blended = over + (under * self._edge_inv[inside] + 127) // 255
+            image[ys[inside], xs[inside]] = blended
+
+
+def render_sprite(rects, texts, channels=(3,), dtype=np.uint8):
+    """
+    Render kotak terisi dan teks Hershey ke sprite
+
+    Hasil blit sama dengan menggambar langsung cv2.rectangle/cv2.putText di
+    frame karena rasterisasi tidak berubah terhadap translasi integer;
+    tepi anti-aliasing di luar kotak bisa berbeda pembulatan +-1.
+
+    Args:
+        rects (list): List (pt1, pt2, color) kotak terisi
+        texts (list): List (text, org, font_scale, color, thickness)
+        channels (tuple): Shape channel frame tujuan, mis. (3,) atau ()
+        dtype: Tipe data frame tujuan
+
+    Returns:
+        Sprite: Sprite siap blit
+    """
+    font = cv2.FONT_HERSHEY_SIMPLEX
+
+    # Batas area: gabungan kotak dan bounding box teks (+ margin ketebalan)
+    xs, ys = [], []
+    for pt1, pt2, _ in rects:
+        xs += [pt1[0], pt2[0] + 1]
+        ys += [pt1[1], pt2[1] + 1]
+    for text, org, scale, _, thickness in texts:
+        (text_w, text_h), baseline = cv2.getTextSize(text, font, scale, thickness)
+        margin = thickness + 2
+        xs += [org[0] - margin, org[0] + text_w + margin]
+        ys += [org[1] - text_h - margin, org[1] + baseline + margin]
+
+    x, y = min(xs), min(ys)
+    width, height = max(xs) - x, max(ys) - y
+
+    pixels = np.zeros((height, width) + tuple(channels), dtype=dtype)
+    alpha = np.zeros((height, width), dtype=np.uint8)
+
+    for pt1, pt2, color in rects:
+        local = ((pt1[0] - x, pt1[1] - y), (pt2[0] - x, pt2[1] - y))
+        cv2.rectangle(pixels, *local, color, -1)
+        cv2.rectangle(alpha, *local, 255, -1)
+    for text, org, scale, color, thickness in texts:
+        local = (org[0] - x, org[1] - y)
+        cv2.putText(pixels, text, local, font, scale, color, thickness)
+        cv2.putText(alpha, text, local, font, scale, 255, thickness)
+
+    return Sprite(pixels, alpha, x, y)
+
+
+class SpriteCache:
+    """
+    Cache LRU sprite overlay berdasarkan isi overlay
+
+    Attributes:
+        max_entries (int): Jumlah maksimal sprite yang disimpan
+        hits (int): Jumlah sprite yang diambil dari cache
+        misses (int): Jumlah sprite yang di-render
+    """
+
+    def __init__(self, max_entries=64):
+        """
+        Inisialisasi SpriteCache
+
+        Args:
+            max_entries (int): Jumlah maksimal sprite
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._sprites = OrderedDict()
+
+    def get(self, key, render):
+        """
+        Ambil sprite dari cache, render jika belum ada
+
+        Args:
+            key (tuple): Isi overlay (hashable)
+            render (callable): Fungsi tanpa argumen yang menghasilkan Sprite
+
+        Returns:
+            Sprite: Sprite untuk key
+        """
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = render()
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def clear(self):
+        """Kosongkan cache"""
+        self._sprites.clear()
+
+    def __len__(self):
+        return len(self._sprites)
@@ -0,0 +1,210 @@
+"""
+Stage Profiler Module
+Pengukuran latency per tahap main loop dengan histogram berukuran tetap
+"""
+
+import time
+
+import numpy as np
+
+# Histogram log2 dengan 8 sub-bin per oktaf (resolusi ~9%), 1 ns - ~70 detik
+SUB_BINS = 8
+SUB_BITS = 3
+NUM_BINS = 37 * SUB_BINS
+
+
+def _bin_index(ns):
+    """
+    Index bin histogram untuk durasi ns
+
+    Args:
+        ns (int): Durasi dalam nanodetik
+
+    Returns:
+        int: Index bin
+    """
+    bits = ns.bit_length()
+    if bits <= SUB_BITS:
+        return ns
+    index = bits * SUB_BINS + ((ns >> (bits - SUB_BITS - 1)) & (SUB_BINS - 1))
+    return min(index, NUM_BINS - 1)
+
+
+def _bin_lower_edges():
+    """
+    Batas bawah setiap bin histogram (ns)
+
+    Returns:
+        np.ndarray: Array float64 (NUM_BINS,)
+    """
+    edges = np.zeros(NUM_BINS, dtype=np.float64)
+    edges[:SUB_BINS] = np.arange(SUB_BINS)
+    for index in range((SUB_BITS + 1) * SUB_BINS, NUM_BINS):
+        bits, sub = divmod(index, SUB_BINS)
+        edges[index] = (SUB_BINS + sub) << (bits - SUB_BITS - 1)
+    return edges
+
+
+BIN_EDGES_NS = _bin_lower_edges()
+
+
+class StageProfiler:
+    """
+    Profiler latency per tahap dengan monotonic clock
+
+    Setiap panggilan mark(stage) mencatat waktu sejak mark sebelumnya (atau
+    start_frame) ke histogram stage tersebut. Memori tetap: satu histogram
+    NUM_BINS counter per stage, update O(1). Jika disabled, start_frame, mark
+    dan lap diganti no-op sehingga overhead hanya satu pemanggilan fungsi.
+
+    Attributes:
+        enabled (bool): Status profiler
+        stages (list): Nama stage sesuai urutan pertama kali tercatat
+    """
+
+    def __init__(self, enabled=True, stages=()):
+        """
+        Inisialisasi StageProfiler
+
+        Args:
+            enabled (bool): Aktifkan pengukuran
+            stages (iterable): Nama stage untuk mengatur urutan tampilan
+        """
+        self.enabled = enabled
+        self.stages = []
+
+        self._index = {}
+        self._counts = []
+        self._total_ns = []
+        self._max_ns = []
+        self._last_ns = []
+        self._clock = time.perf_counter_ns
+        self._mark_time = self._clock()
+
+        for stage in stages:
+            self._stage_index(stage)
+
+        if not enabled:
+            self.start_frame = self._noop
+            self.mark = self._noop
+            self.lap = self._noop
+
+    @staticmethod
+    def _noop(*args):
+        """Method pengganti ketika profiler disabled"""
+
+    def _stage_index(self, stage):
+        """Index stage, tambahkan histogram baru jika belum ada"""
+        index = self._index.get(stage)
+        if index is None:
+            index = len(self.stages)
+            self._index[stage] = index
+            self.stages.append(stage)
+            self._counts.append([0] * NUM_BINS)
+            self._total_ns.append(0)
+            self._max_ns.append(0)
+            self._last_ns.append(0)
+        return index
+
+    def start_frame(self):
+        """Tandai awal frame (tidak mencatat durasi)"""
+        self._mark_time = self._clock()
+
+    def lap(self):
+        """Reset titik acuan tanpa mencatat durasi ke stage mana pun"""
+        self._mark_time = self._clock()
+
+    def mark(self, stage):
+        """
+        Catat durasi sejak mark sebelumnya ke stage
+
+        Args:
+            stage (str): Nama stage
+        """
+        now = self._clock()
+        elapsed = now - self._mark_time
+        self._mark_time = now
+
+        index = self._stage_index(stage)
+        self._counts[index][_bin_index(elapsed)] += 1
+        self._total_ns[index] += elapsed
+        self._last_ns[index] = elapsed
+        if elapsed > self._max_ns[index]:
+            self._max_ns[index] = elapsed
+
+    def percentile(self, stage, q):
+        """
+        Estimasi persentil durasi stage dari histogram
+
+        Args:
+            stage (str): Nama stage
+            q (float): Persentil (0-100)
+
+        Returns:
+            float: Durasi dalam milidetik (0 jika belum ada data)
+        """
+        counts = np.array(self._counts[self._index[stage]], dtype=np.int64)
+        total = counts.sum()
+        if total == 0:
+            return 0.0
+        cumulative = np.cumsum(counts)
+        index = int(np.searchsorted(cumulative, total * q / 100.0))
+        return BIN_EDGES_NS[min(index, NUM_BINS - 1)] / 1e6
+
+    def summary(self):
+        """
+        Ringkasan statistik semua stage
+
+        Returns:
+            dict: {stage: {'count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms',
+                   'max_ms', 'last_ms'}}
+        """
+        result = {}
+        for stage, index in self._index.items():
+            count = sum(self._counts[index])
+            if count == 0:
+                continue
+            result[stage] = {
+                'count': count,
+                'mean_ms': self._total_ns[index] / count / 1e6,
+                'p50_ms': self.percentile(stage, 50),
+                'p95_ms': self.percentile(stage, 95),
+                'p99_ms': self.percentile(stage, 99),
+                'max_ms': self._max_ns[index] / 1e6,
+                'last_ms': self._last_ns[index] / 1e6,
+            }
+        return result
+
+    def overlay_lines(self):
+        """
+        Baris teks ringkas untuk overlay
+
+        Returns:
+            list: List string "stage  last / p95 ms"
+        """
+        return [
+            f"{stage:<12} {s['last_ms']:6.2f} / p95 {s['p95_ms']:6.2f} ms"
+            for stage, s in self.summary().items()
+        ]
+
+    def print_summary(self):
+        """Cetak ringkasan latency per stage"""
+        summary = self.summary()
+        if not summary:
+            return
+
+        print("\n⏱️  Latency per Stage (ms):")
+        print(f"  {'stage':<14}{'count':>8}{'mean':>9}{'p50':>9}"
+              f"{'p95':>9}{'p99':>9}{'max':>9}")
+        for stage, s in summary.items():
+            print(f"  {stage:<14}{s['count']:>8}{s['mean_ms']:>9.2f}"
+                  f"{s['p50_ms']:>9.2f}{s['p95_ms']:>9.2f}"
+                  f"{s['p99_ms']:>9.2f}{s['max_ms']:>9.2f}")
+
+    def reset(self):
+        """Kosongkan semua histogram"""
+        for index in range(len(self.stages)):
+            self._counts[index] = [0] * NUM_BINS
+            self._total_ns[index] = 0
+            self._max_ns[index] = 0
+            self._last_ns[index] = 0
@@ -0,0 +1,296 @@
+"""
+Transport Module
+Backend link robot: serial (pyserial), UDP dan TCP (asyncio)
+"""
+
+import abc
+import asyncio
+import socket
+import threading
+
+import serial
+
+
+class _LoopThread:
+    """Event loop asyncio bersama di background thread untuk semua transport"""
+
+    _lock = threading.Lock()
+    _loop = None
+
+    @classmethod
+    def get(cls):
+        """
+        Ambil event loop (dibuat saat pertama dipakai)
+
+        Returns:
+            asyncio.AbstractEventLoop: Loop yang berjalan di thread daemon
+        """
+        with cls._lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever,
+                                          name='TransportLoop', daemon=True)
+                thread.start()
+                cls._loop = loop
+            return cls._loop
+
+
+def parse_address(address, default_host='127.0.0.1'):
+    """
+    Parse 'host:port' (atau ':port')
+
+    Args:
+        address (str): Alamat tanpa skema
+        default_host (str): Host jika kosong
+
+    Returns:
+        tuple: (host, port)
+
+    Raises:
+        ValueError: Jika port tidak valid
+    """
+    host, _, port = address.rpartition(':')
+    if not port.isdigit():
+        raise ValueError(f"Alamat tidak valid: {address!r} (format host:port)")
+    return host.strip('[]') or default_host, int(port)
+
+
+class NetworkTransport(asyncio.Protocol, abc.ABC):
+    """
+    Transport jaringan dengan interface seperti serial.Serial (base abstrak,
+    subclass wajib mengimplementasikan _connect())
+
+    Socket dikelola event loop asyncio bersama; write() hanya menjadwalkan
+    pengiriman ke loop sehingga thread pemanggil tidak menunggu jaringan.
+    Data masuk dikumpulkan di buffer untuk read() (echo protocol biner).
+    Satu koneksi dibuka sekali dan dipakai ulang untuk semua perintah.
+
+    Seperti serial.Serial, is_open tetap True sampai close(); koneksi yang
+    putus membuat write()/read() melempar ConnectionError sehingga writer
+    melapor error dan RobotController menutup lalu membuka ulang link.
+
+    Attributes:
+        host (str): Host tujuan
+        port (int): Port tujuan
+        timeout (float): Timeout koneksi dan read() (detik)
+        is_open (bool): True sejak terhubung sampai close()
+    """
+
+    scheme = None
+
+    def __init__(self, host, port, timeout=1.0):
+        """
+        Inisialisasi NetworkTransport (belum terhubung, lihat open())
+
+        Args:
+            host (str): Host tujuan
+            port (int): Port tujuan
+            timeout (float): Timeout koneksi dan read() (detik)
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.is_open = False
+
+        self._loop = _LoopThread.get()
+        self._transport = None
+        self._cond = threading.Condition()
+        self._buffer = bytearray()
+        self._cancelled = False
+        self._lost = False
+        self._error = None
+
+    @classmethod
+    def open(cls, address, timeout=1.0):
+        """
+        Buka koneksi ke 'host:port'
+
+        Args:
+            address (str): Alamat tanpa skema
+            timeout (float): Timeout koneksi (detik)
+
+        Returns:
+            NetworkTransport: Transport yang sudah terhubung
+        """
+        host, port = parse_address(address)
+        transport = cls(host, port, timeout)
+        future = asyncio.run_coroutine_threadsafe(transport._connect(),
+                                                  transport._loop)
+        try:
+            future.result(timeout)
+        except Exception:
+            future.cancel()
+            raise
+        return transport
+
+    @abc.abstractmethod
+    async def _connect(self):
+        """Buka socket di event loop (diimplementasikan subclass)"""
+
+    @property
+    def name(self):
+        """str: URL transport"""
+        return f"{self.scheme}://{self.host}:{self.port}"
+
+    # Callback asyncio (berjalan di thread event loop)
+
+    def connection_made(self, transport):
+        self._transport = transport
+        self.is_open = True
+
+    def data_received(self, data):
+        with self._cond:
+            self._buffer.extend(data)
+            self._cond.notify_all()
+
+    def connection_lost(self, exc):
+        with self._cond:
+            self._lost = True
+            self._error = exc or 'ditutup oleh robot'
+            self._cond.notify_all()
+
+    # Interface serial.Serial
+
+    def write(self, data):
+        """
+        Jadwalkan pengiriman data (tidak memblokir)
+
+        Args:
+            data (bytes): Data
+
+        Returns:
+            int: Jumlah byte
+
+        Raises:
+            ConnectionError: Jika koneksi putus atau sudah tertutup
+        """
+        if not self.is_open or self._lost:
+            raise ConnectionError(f"{self.name} terputus: {self._error}")
+        self._loop.call_soon_threadsafe(self._send, bytes(data))
+        return len(data)
+
+    def _send(self, data):
+        """Kirim data (di thread event loop)"""
+        if self._transport is not None and not self._transport.is_closing():
+            self._transport.write(data)
+
+    def flush(self):
+        """Tunggu sampai semua write() sebelumnya diserahkan ke socket"""
+        if not self.is_open or self._lost:
+            return
+        done = threading.Event()
+        self._loop.call_soon_threadsafe(done.set)
+        done.wait(self.timeout)
+
+    @property
+    def in_waiting(self):
+        """int: Jumlah byte yang siap dibaca"""
+        return len(self._buffer)
+
+    def read(self, size=1):
+        """
+        Baca sampai size byte, tunggu maksimal timeout jika buffer kosong
+
+        Args:
+            size (int): Jumlah byte maksimal
+
+        Returns:
+            bytes: Data (kosong jika timeout atau cancel_read())
+
+        Raises:
+            ConnectionError: Jika koneksi putus/tertutup dan buffer kosong
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: (self._buffer or self._lost or not self.is_open or
+                         self._cancelled),
+                self.timeout
+            )
+            self._cancelled = False
+            if not self._buffer and (self._lost or not self.is_open):
+                raise ConnectionError(f"{self.name} terputus: {self._error}")
+
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+            return data
+
+    def cancel_read(self):
+        """Bangunkan read() yang sedang menunggu"""
+        with self._cond:
+            self._cancelled = True
+            self._cond.notify_all()
+
+    def close(self):
+        """Tutup koneksi"""
+        with self._cond:
+            self.is_open = False
+            self._cond.notify_all()
+        if self._transport is not None:
+            self._loop.call_soon_threadsafe(self._transport.close)
+
+
+class TcpTransport(NetworkTransport):
+    """Transport TCP dengan Nagle dinonaktifkan (TCP_NODELAY)"""
+
+    scheme = 'tcp'
+
+    async def _connect(self):
+        transport, _ = await self._loop.create_connection(
+            lambda: self, self.host, self.port
+        )
+        sock = transport.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class UdpTransport(NetworkTransport, asyncio.DatagramProtocol):
+    """Transport UDP: satu datagram per write()"""
+
+    scheme = 'udp'
+
+    async def _connect(self):
+        await self._loop.create_datagram_endpoint(
+            lambda: self, remote_addr=(self.host, self.port)
+        )
+
+    def _send(self, data):
+        if self._transport is not None and not self._transport.is_closing():
+            self._transport.sendto(data)
+
+    def datagram_received(self, data, addr):
+        self.data_received(data)
+
+    def error_received(self, exc):
+        # ICMP (mis. port unreachable) tidak menutup endpoint UDP
+        self._error = exc
+
+
+# Skema URL -> backend jaringan; selain ini diteruskan ke pyserial
+TRANSPORTS = {
+    'tcp': TcpTransport,
+    'udp': UdpTransport,
+}
+
+
+def open_transport(url, baud_rate=9600, timeout=1.0):
+    """
+    Buka link robot sesuai skema URL
+
+    'udp://host:port' dan 'tcp://host:port' memakai backend asyncio; port
+    serial ('COM5', '/dev/ttyUSB0') dan URL pyserial lain ('loop://',
+    'rfc2217://...') dibuka dengan serial.serial_for_url.
+
+    Args:
+        url (str): Port serial atau URL transport
+        baud_rate (int): Baud rate (hanya serial)
+        timeout (float): Timeout koneksi/read (detik)
+
+    Returns:
+        Object dengan interface serial.Serial (write, flush, read,
+        in_waiting, is_open, close)
+    """
+    scheme, sep, address = url.partition('://')
+    backend = TRANSPORTS.get(scheme.lower()) if sep else None
+    if backend is not None:
+        return backend.open(address, timeout)
+    return serial.serial_for_url(url, baud_rate, timeout=timeout)
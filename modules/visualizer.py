@@ -11,6 +11,8 @@ from config.settings import (
     GESTURE_COLORS, 
     COMMAND_NAMES
 )
+from .depth_preview import PreviewBlender
+from .sprite_cache import SpriteCache, render_sprite
 
 
 class Visualizer:
@@ -21,18 +23,31 @@ class Visualizer:
         window_name (str): Nama window OpenCV
         show_gestures (bool): Toggle tampilan gesture
         fps_display (bool): Toggle tampilan FPS
+        sprites (SpriteCache): Cache LRU overlay gesture, perintah dan status
+        blender (PreviewBlender): Kernel colorize-and-blend depth + body index
     """
     
-    def __init__(self, window_name=None):
+    def __init__(self, window_name=None, create_window=True):
         """
         Inisialisasi Visualizer
         
         Args:
             window_name (str, optional): Nama window. Default dari config.
+            create_window (bool): Buat window OpenCV. False untuk render
+                tanpa display (mis. benchmark).
         """
         self.window_name = window_name or DISPLAY_CONFIG['window_name']
         self.show_gestures = DISPLAY_CONFIG['show_gestures']
         self.fps_display = DISPLAY_CONFIG['fps_display']
+        self.show_profile = True
+        
+        # Overlay di-render sekali per isi lalu di-blit dari cache
+        self.sprites = SpriteCache(DISPLAY_CONFIG['sprite_cache_size'])
+        self.frame_bucket = max(1, DISPLAY_CONFIG['status_frame_bucket'])
+        self.fps_bucket = DISPLAY_CONFIG['status_fps_bucket']
+        
+        # Preview dari depth/body index raw dengan buffer reusable
+        self.blender = PreviewBlender()
         
         # FPS calculation
         self.fps = 0
@@ -40,7 +55,9 @@ class Visualizer:
         self.fps_start_time = time.time()
         
         # Create window
-        cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
+        self.has_window = create_window
+        if create_window:
+            cv2.namedWindow(self.window_name, cv2.WINDOW_NORMAL)
     
     def update_fps(self):
         """Update perhitungan FPS"""
@@ -73,108 +90,142 @@ class Visualizer:
         except:
             return depth_image
     
-    def draw_gestures(self, image, gestures, body_id=0):
+    def blend_raw(self, depth, body_index):
         """
-        Gambar info gesture di image
+        Buat preview langsung dari depth map 16-bit dan body index map 8-bit
+        
+        Colorize dan blend dalam satu lookup table, hasil identik dengan
+        combine_images() atas image hasil colorize pykinect. Image yang
+        dikembalikan adalah buffer yang dipakai ulang setiap frame.
         
         Args:
-            image: Image untuk digambar
-            gestures (list): List gesture yang terdeteksi
-            body_id (int): ID body
+            depth: Depth map uint16, atau None
+            body_index: Body index map uint8, atau None
             
         Returns:
-            Image dengan gesture info
+            Preview image BGR, None jika kedua map None
         """
-        if not self.show_gestures or image is None:
-            return image
+        return self.blender.blend(depth, body_index)
+    
+    def _blit(self, image, key, layout, *args):
+        """
+        Blit sprite overlay dari cache, render dengan layout jika belum ada
         
+        Args:
+            image: Image tujuan
+            key (tuple): Isi overlay untuk cache
+            layout (callable): Fungsi yang menghasilkan (rects, texts)
+            *args: Argumen untuk layout
+        """
+        channels = image.shape[2:]
+        sprite = self.sprites.get(
+            key + (channels, image.dtype.str),
+            lambda: render_sprite(*layout(*args), channels, image.dtype)
+        )
+        sprite.blit(image)
+    
+    @staticmethod
+    def _gestures_layout(gestures, body_id):
+        """Kotak dan teks untuk overlay gesture"""
         y_offset = 60 + (body_id * 120)
         
         # Background box untuk readability
         box_height = len(gestures) * 25 + 30
-        cv2.rectangle(
-            image,
-            (10, y_offset - 25),
-            (400, y_offset + box_height),
-            (0, 0, 0),
-            -1
-        )
+        rects = [((10, y_offset - 25), (400, y_offset + box_height), (0, 0, 0))]
         
         # Body ID header
-        cv2.putText(
-            image,
-            f"Body {body_id}:",
-            (15, y_offset),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.6,
-            (255, 255, 255),
-            2
-        )
+        texts = [(f"Body {body_id}:", (15, y_offset), 0.6, (255, 255, 255), 2)]
         
         # Display setiap gesture
         for i, gesture in enumerate(gestures):
             color = GESTURE_COLORS.get(gesture, (255, 255, 255))
-            cv2.putText(
-                image,
+            texts.append((
                 f"  - {gesture}",
                 (15, y_offset + 25 + (i * 25)),
-                cv2.FONT_HERSHEY_SIMPLEX,
                 0.5,
                 color,
                 1
-            )
+            ))
         
-        return image
+        return rects, texts
     
-    def draw_robot_command(self, image, command, connected, gestures=None):
+    def draw_gestures(self, image, gestures, body_id=0):
         """
-        Gambar info perintah robot
+        Gambar info gesture di image
         
         Args:
             image: Image untuk digambar
-            command (str): Perintah robot (F, B, L, R, S)
-            connected (bool): Status koneksi robot
-            gestures (list, optional): List gesture untuk positioning
+            gestures (list): List gesture yang terdeteksi
+            body_id (int): ID body
             
         Returns:
-            Image dengan command info
+            Image dengan gesture info
         """
-        if image is None:
+        if not self.show_gestures or image is None:
             return image
         
-        # Hitung posisi berdasarkan jumlah gesture
-        num_gestures = len(gestures) if gestures else 1
+        gestures = tuple(gestures)
+        self._blit(image, ('gestures', gestures, body_id),
+                   self._gestures_layout, gestures, body_id)
+        return image
+    
+    @staticmethod
+    def _command_layout(command, connected, num_gestures):
+        """Kotak dan teks untuk overlay perintah robot"""
         cmd_offset = 60 + (num_gestures * 30) + 20
         
         cmd_name = COMMAND_NAMES.get(command, "UNKNOWN")
         cmd_color = (0, 255, 0) if connected else (0, 0, 255)
         
-        # Background box
-        cv2.rectangle(
-            image,
-            (10, cmd_offset - 10),
-            (400, cmd_offset + 30),
-            (0, 0, 0),
-            -1
-        )
-        
-        # Command text
-        cv2.putText(
-            image,
+        rects = [((10, cmd_offset - 10), (400, cmd_offset + 30), (0, 0, 0))]
+        texts = [(
             f"PERINTAH: {cmd_name} ({command})",
             (15, cmd_offset + 15),
-            cv2.FONT_HERSHEY_SIMPLEX,
             0.7,
             cmd_color,
             2
-        )
+        )]
+        return rects, texts
+    
+    def draw_robot_command(self, image, command, connected, gestures=None):
+        """
+        Gambar info perintah robot
         
+        Args:
+            image: Image untuk digambar
+            command (str): Perintah robot (F, B, L, R, S)
+            connected (bool): Status koneksi robot
+            gestures (list, optional): List gesture untuk positioning
+            
+        Returns:
+            Image dengan command info
+        """
+        if image is None:
+            return image
+        
+        # Hitung posisi berdasarkan jumlah gesture
+        num_gestures = len(gestures) if gestures else 1
+        connected = bool(connected)
+        
+        self._blit(image, ('command', command, connected, num_gestures),
+                   self._command_layout, command, connected, num_gestures)
         return image
     
+    @staticmethod
+    def _status_layout(info_text, connected):
+        """Kotak dan teks untuk status bar"""
+        status_color = (0, 255, 0) if connected else (0, 0, 255)
+        rects = [((5, 5), (len(info_text) * 11, 45), (0, 0, 0))]
+        texts = [(info_text, (10, 30), 0.7, status_color, 2)]
+        return rects, texts
+    
     def draw_status(self, image, frame_number, connected):
         """
         Gambar status bar
         
+        Nomor frame dan FPS dibulatkan ke bucket (DISPLAY_CONFIG) agar
+        sprite status bar bisa dipakai ulang selama beberapa frame.
+        
         Args:
             image: Image untuk digambar
             frame_number (int): Nomor frame
@@ -186,35 +237,59 @@ class Visualizer:
         if image is None:
             return image
         
-        status_color = (0, 255, 0) if connected else (0, 0, 255)
+        connected = bool(connected)
         status_text = "TERHUBUNG" if connected else "TERPUTUS"
         
+        frame_number -= frame_number % self.frame_bucket
         info_parts = [f"Frame: {frame_number}", f"Robot: {status_text}"]
         
         if self.fps_display:
-            info_parts.insert(1, f"FPS: {self.fps:.1f}")
+            fps = round(self.fps / self.fps_bucket) * self.fps_bucket
+            info_parts.insert(1, f"FPS: {fps:.1f}")
         
         info_text = " | ".join(info_parts)
         
+        self._blit(image, ('status', info_text, connected),
+                   self._status_layout, info_text, connected)
+        return image
+    
+    def draw_profile(self, image, lines):
+        """
+        Gambar overlay latency per stage
+        
+        Args:
+            image: Image untuk digambar
+            lines (list): Baris teks dari StageProfiler.overlay_lines()
+            
+        Returns:
+            Image dengan overlay latency
+        """
+        if not self.show_profile or image is None or not lines:
+            return image
+        
+        height, width = image.shape[:2]
+        x = max(width - 330, 0)
+        y = height - 20 * len(lines) - 15
+        
         # Background box
         cv2.rectangle(
             image,
-            (5, 5),
-            (len(info_text) * 11, 45),
+            (x, y - 5),
+            (width - 5, height - 5),
             (0, 0, 0),
             -1
         )
         
-        # Status text
-        cv2.putText(
-            image, 
-            info_text,
-            (10, 30),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.7,
-            status_color,
-            2
-        )
+        for i, line in enumerate(lines):
+            cv2.putText(
+                image,
+                line,
+                (x + 5, y + 12 + i * 20),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.45,
+                (255, 255, 255),
+                1
+            )
         
         return image
     
@@ -240,6 +315,20 @@ class Visualizer:
         """
         return cv2.waitKey(delay)
     
+    def poll_key(self):
+        """
+        Proses event window dan ambil key tanpa menunggu
+        
+        Dipakai pada frame yang tidak ditampilkan agar window tetap responsif.
+        
+        Returns:
+            int: Key code, -1 jika tidak ada
+        """
+        poll = getattr(cv2, 'pollKey', None)
+        if poll is None:
+            return cv2.waitKey(1)
+        return poll()
+    
     def toggle_gestures(self):
         """Toggle tampilan gesture"""
         self.show_gestures = not self.show_gestures
@@ -250,9 +339,15 @@ class Visualizer:
         self.fps_display = not self.fps_display
         return self.fps_display
     
+    def toggle_profile(self):
+        """Toggle tampilan latency per stage"""
+        self.show_profile = not self.show_profile
+        return self.show_profile
+    
     def cleanup(self):
         """Tutup semua window"""
-        cv2.destroyAllWindows()
+        if self.has_window:
+            cv2.destroyAllWindows()
     
     def __del__(self):
         """Destructor - pastikan window ditutup"""
@@ -0,0 +1,228 @@
+"""
+Wave Buffer Module
+Ring buffer NumPy untuk trajectory pergelangan tangan dengan statistik inkremental
+"""
+
+import numpy as np
+
+
+class WaveBuffer:
+    """
+    Ring buffer preallocated untuk beberapa trajectory 1D (track) sekaligus
+
+    Setiap track menyimpan `size` frame terakhir. Sample yang hilang (NaN)
+    tetap menempati satu frame di window tetapi tidak ikut statistik, sama
+    seperti perilaku deteksi lambaian sebelumnya. Jumlah, jumlah kuadrat dan
+    jumlah perubahan arah di-update O(1) saat frame masuk dan keluar window,
+    sehingga biaya per frame tidak bergantung pada `size`.
+
+    Perubahan arah ke-i melibatkan tiga sample valid berurutan
+    (s[i-2], s[i-1], s[i]) dan dicatat pada slot s[i-2], sehingga otomatis
+    dikurangi ketika s[i-2] keluar dari window.
+
+    Attributes:
+        num_tracks (int): Jumlah trajectory yang disimpan
+        size (int): Panjang window dalam frame
+        min_samples (int): Minimal sample valid untuk analisis
+        values (np.ndarray): Ring buffer nilai (num_tracks, size)
+    """
+
+    def __init__(self, num_tracks, size, min_samples=10):
+        """
+        Inisialisasi WaveBuffer
+
+        Args:
+            num_tracks (int): Jumlah trajectory
+            size (int): Panjang window dalam frame
+            min_samples (int): Minimal sample valid untuk analisis
+        """
+        self.num_tracks = num_tracks
+        self.size = size
+        self.min_samples = min_samples
+
+        self.values = np.zeros((num_tracks, size), dtype=np.float64)
+        self.valid = np.zeros((num_tracks, size), dtype=bool)
+        self.change_at = np.zeros((num_tracks, size), dtype=np.int32)
+
+        self.frame = np.zeros(num_tracks, dtype=np.int64)
+        self.count = np.zeros(num_tracks, dtype=np.int64)
+        self.sum = np.zeros(num_tracks, dtype=np.float64)
+        self.sumsq = np.zeros(num_tracks, dtype=np.float64)
+        self.changes = np.zeros(num_tracks, dtype=np.int64)
+
+        # Dua sample valid terakhir per track (untuk diff dan sign change)
+        self.last_frame = np.zeros(num_tracks, dtype=np.int64)
+        self.prev_frame = np.zeros(num_tracks, dtype=np.int64)
+        self.last_value = np.zeros(num_tracks, dtype=np.float64)
+        self.last_sign = np.zeros(num_tracks, dtype=np.int8)
+
+        self._all_tracks = np.arange(num_tracks, dtype=np.intp)
+        self.reset()
+
+    def _tracks(self, tracks):
+        """Normalisasi argumen tracks menjadi array index"""
+        if tracks is None:
+            return self._all_tracks
+        return np.asarray(tracks, dtype=np.intp)
+
+    def push(self, values, tracks=None):
+        """
+        Tambahkan satu frame ke setiap track
+
+        Args:
+            values (array-like): Nilai per track, NaN jika sample hilang
+            tracks (array-like, optional): Index track yang di-update.
+                Default: semua track.
+        """
+        t = self._tracks(tracks)
+        x = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(x)
+        x = np.where(valid, x, 0.0)
+
+        frame = self.frame[t]
+        slot = frame % self.size
+
+        # 1. Keluarkan frame tertua dari window (slot akan ditimpa)
+        old_valid = self.valid[t, slot]
+        old = np.where(old_valid, self.values[t, slot], 0.0)
+        self.count[t] -= old_valid
+        self.sum[t] -= old
+        self.sumsq[t] -= old * old
+        self.changes[t] -= self.change_at[t, slot]
+
+        # 2. Masukkan frame baru
+        self.values[t, slot] = x
+        self.valid[t, slot] = valid
+        self.change_at[t, slot] = 0
+        self.count[t] += valid
+        self.sum[t] += x
+        self.sumsq[t] += x * x
+
+        # 3. Perubahan arah terhadap dua sample valid sebelumnya di window
+        window_start = frame - self.size + 1
+        has_last = valid & (self.last_frame[t] >= window_start)
+        has_prev = has_last & (self.prev_frame[t] >= window_start)
+        sign = np.sign(x - self.last_value[t]).astype(np.int8)
+        changed = has_prev & (sign != self.last_sign[t])
+
+        if changed.any():
+            ct = t[changed]
+            self.change_at[ct, self.prev_frame[ct] % self.size] += 1
+            self.changes[ct] += 1
+
+        vt = t[valid]
+        self.prev_frame[vt] = self.last_frame[vt]
+        self.last_frame[vt] = frame[valid]
+        self.last_value[vt] = x[valid]
+        self.last_sign[vt] = np.where(has_last, sign, 0)[valid]
+
+        # Hindari drift floating point ketika window kosong
+        empty = t[self.count[t] == 0]
+        self.sum[empty] = 0.0
+        self.sumsq[empty] = 0.0
+
+        self.frame[t] = frame + 1
+
+    def frames_in_window(self, tracks=None):
+        """
+        Jumlah frame (valid maupun tidak) di window
+
+        Args:
+            tracks (array-like, optional): Index track. Default: semua track.
+
+        Returns:
+            np.ndarray: Jumlah frame per track
+        """
+        return np.minimum(self.frame[self._tracks(tracks)], self.size)
+
+    def variance(self, tracks=None):
+        """
+        Variansi (populasi) sample valid di window
+
+        Args:
+            tracks (array-like, optional): Index track. Default: semua track.
+
+        Returns:
+            np.ndarray: Variansi per track (0 jika window kosong)
+        """
+        t = self._tracks(tracks)
+        n = np.maximum(self.count[t], 1)
+        mean = self.sum[t] / n
+        return np.maximum(self.sumsq[t] / n - mean * mean, 0.0)
+
+    def std(self, tracks=None):
+        """
+        Standar deviasi sample valid di window
+
+        Args:
+            tracks (array-like, optional): Index track. Default: semua track.
+
+        Returns:
+            np.ndarray: Standar deviasi per track
+        """
+        return np.sqrt(self.variance(tracks))
+
+    def sign_changes(self, tracks=None):
+        """
+        Jumlah perubahan arah gerakan di window
+
+        Args:
+            tracks (array-like, optional): Index track. Default: semua track.
+
+        Returns:
+            np.ndarray: Jumlah perubahan arah per track
+        """
+        return self.changes[self._tracks(tracks)].copy()
+
+    def is_waving(self, threshold, min_changes=3, tracks=None):
+        """
+        Deteksi lambaian pada setiap track
+
+        Args:
+            threshold (float): Minimal standar deviasi posisi (mm)
+            min_changes (int): Minimal jumlah perubahan arah
+            tracks (array-like, optional): Index track. Default: semua track.
+
+        Returns:
+            np.ndarray: Boolean per track
+        """
+        ready, variance, changes = self.window_stats(tracks)
+        return (ready &
+                (variance > threshold * threshold) &
+                (changes >= min_changes))
+
+    def window_stats(self, tracks=None):
+        """
+        Statistik window yang dipakai deteksi lambaian
+
+        Args:
+            tracks (array-like, optional): Index track. Default: semua track.
+
+        Returns:
+            tuple: (ready, variance, changes) per track. ready bernilai True
+                   jika window dan sample valid sudah mencapai min_samples.
+        """
+        t = self._tracks(tracks)
+        ready = ((self.frames_in_window(t) >= self.min_samples) &
+                 (self.count[t] >= self.min_samples))
+        return ready, self.variance(t), self.changes[t]
+
+    def reset(self, tracks=None):
+        """
+        Kosongkan track
+
+        Args:
+            tracks (array-like, optional): Index track. Default: semua track.
+        """
+        t = self._tracks(tracks)
+        self.valid[t] = False
+        self.change_at[t] = 0
+        self.frame[t] = 0
+        self.count[t] = 0
+        self.sum[t] = 0.0
+        self.sumsq[t] = 0.0
+        self.changes[t] = 0
+        self.last_frame[t] = -self.size - 1
+        self.prev_frame[t] = -self.size - 1
+        self.last_value[t] = 0.0
+        self.last_sign[t] = 0
@@ -0,0 +1,3 @@
+"""
+Test suite Robot Gesture Control System (jalankan dari root project: python -m pytest)
+"""
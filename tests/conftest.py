@@ -0,0 +1,38 @@
+"""
+Fixture bersama: session .skel berlabel dari pose sintetis
+"""
+
+import pytest
+
+from benchmarks.synthetic import SyntheticBody
+from modules.skeleton_session import SessionRecorder
+
+# Jarak timestamp antar frame (30 fps, mikrodetik)
+FRAME_USEC = 33333
+
+
+@pytest.fixture
+def record_session(tmp_path, capsys):
+    """
+    Factory session berlabel di tmp_path
+
+    Dipanggil dengan (name, poses, labels): poses = list pose (32, 3) atau
+    None (frame tanpa body), labels = list (start, end, gesture).
+    Mengembalikan path file .skel.
+    """
+    def record(name, poses, labels):
+        path = str(tmp_path / f"{name}.skel")
+        recorder = SessionRecorder(path)
+        for frame, pose in enumerate(poses):
+            bodies = [] if pose is None else [SyntheticBody(1, pose)]
+            recorder.record(bodies, frame * FRAME_USEC)
+        recorder.close()
+
+        with open(str(tmp_path / f"{name}.labels.csv"), 'w') as f:
+            f.write("# label uji\nstart,end,gesture\n\n")
+            for start, end, gesture in labels:
+                f.write(f"{start},{end},{gesture}\n")
+        capsys.readouterr()
+        return path
+
+    return record
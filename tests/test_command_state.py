@@ -0,0 +1,44 @@
+"""
+Test hysteresis CommandStateMachine
+"""
+
+import pytest
+
+from modules.command_state import CommandStateMachine
+
+
+def run(state, frames):
+    """Jalankan (perintah, gestures) per frame, kembalikan perintah aktif"""
+    return ''.join(state.update(command, gestures) for command, gestures in frames)
+
+
+RIGHT = ('R', ['TANGAN_KANAN'])
+NEUTRAL = ('S', ['NETRAL'])
+WAVE = ('S', ['LAMBAI'])
+
+
+def test_single_neutral_frame_does_not_stop():
+    state = CommandStateMachine(initial='R')
+    commands = run(state, [RIGHT] * 10 + [NEUTRAL] + [RIGHT] * 10)
+    assert commands == 'R' * 21
+    assert state.transitions == 0
+
+
+def test_sustained_neutral_stops_after_exit_frames():
+    state = CommandStateMachine(initial='R')
+    commands = run(state, [RIGHT] * 10 + [NEUTRAL] * 5)
+    assert commands == 'R' * 12 + 'SSS'
+
+
+def test_wave_stops_immediately():
+    state = CommandStateMachine(initial='R')
+    commands = run(state, [RIGHT] * 10 + [WAVE])
+    assert commands[-1] == 'S'
+
+
+def test_unknown_passthrough_gesture_rejected():
+    with pytest.raises(ValueError):
+        CommandStateMachine(config={
+            'command_enter_frames': 3, 'command_exit_frames': 3,
+            'command_dwell_frames': 5, 'command_passthrough': ('S',),
+        })
@@ -0,0 +1,38 @@
+"""
+Test palet body index dan PreviewBlender
+"""
+
+import numpy as np
+
+from modules.depth_preview import (
+    body_index_palette, colorize_body_index, colorize_depth, PreviewBlender
+)
+from modules.visualizer import Visualizer
+
+
+# body_colors pykinect_azure (k4abt/_k4abtTypes.py), index lain putih
+PYKINECT_BODY_COLORS = np.full((256, 3), 255, dtype=np.uint8)
+PYKINECT_BODY_COLORS[:7] = [[202, 183, 42], [42, 61, 202], [42, 202, 183],
+                            [202, 42, 61], [183, 42, 202], [42, 202, 61],
+                            [141, 202, 42]]
+
+
+def test_palette_matches_pykinect_body_colors():
+    assert np.array_equal(body_index_palette(), PYKINECT_BODY_COLORS)
+
+
+def test_palette_does_not_cycle():
+    palette = body_index_palette([(1, 2, 3)], background=(9, 9, 9))
+    assert tuple(palette[0]) == (1, 2, 3)
+    assert (palette[1:] == 9).all()
+
+
+def test_blend_matches_colorize_and_combine():
+    rng = np.random.default_rng(0)
+    depth = rng.integers(0, 6000, (32, 48), dtype=np.uint16)
+    body_index = rng.choice([0, 1, 6, 7, 255], (32, 48)).astype(np.uint8)
+
+    visualizer = Visualizer(create_window=False)
+    expected = visualizer.combine_images(colorize_depth(depth),
+                                         colorize_body_index(body_index))
+    assert np.array_equal(PreviewBlender().blend(depth, body_index), expected)
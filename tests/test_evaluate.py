@@ -0,0 +1,116 @@
+"""
+Test evaluasi offline tools.evaluate atas session sintetis
+"""
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import gesture_pose
+from config.settings import GESTURE_CONFIG
+from tools.evaluate import (
+    GESTURE_INDEX, GESTURES, NO_BODY, evaluate_session, labels_path,
+    load_labels, summarize
+)
+
+
+def poses(*segments):
+    """Pose per frame dari (gesture, jumlah frame); gesture None = tanpa body"""
+    frames = []
+    for gesture, count in segments:
+        frames += [None if gesture is None else gesture_pose(gesture, t)
+                   for t in range(count)]
+    return frames
+
+
+@pytest.fixture
+def session(record_session):
+    # NETRAL, kanan, NETRAL, lalu label TANGAN_KIRI saat tidak ada body (missed)
+    return record_session(
+        'session',
+        poses(('NETRAL', 30), ('TANGAN_KANAN', 30), ('NETRAL', 30), (None, 20)),
+        [(30, 60, 'TANGAN_KANAN'), (90, 110, 'TANGAN_KIRI')],
+    )
+
+
+def test_load_labels_segments(session):
+    labels = load_labels(labels_path(session), 120)
+    assert labels.shape == (120,)
+    assert (labels[:30] == GESTURE_INDEX['NETRAL']).all()
+    assert (labels[30:60] == GESTURE_INDEX['TANGAN_KANAN']).all()
+    assert (labels[60:90] == GESTURE_INDEX['NETRAL']).all()
+    assert (labels[90:110] == GESTURE_INDEX['TANGAN_KIRI']).all()
+    assert (labels[110:] == GESTURE_INDEX['NETRAL']).all()
+
+
+@pytest.mark.parametrize('row', ['0,10,TERBANG', '10,10,LAMBAI', '-1,5,LAMBAI'])
+def test_load_labels_rejects_bad_rows(tmp_path, row):
+    path = tmp_path / 'bad.labels.csv'
+    path.write_text(f"start,end,gesture\n{row}\n")
+    with pytest.raises(ValueError):
+        load_labels(str(path), 20)
+
+
+def test_confusion_and_matches(session):
+    result = evaluate_session(session, use_state_machine=False, smoothing=False)
+    confusion = np.array(result['confusion'])
+    no_body = len(GESTURES)
+
+    assert result['frames'] == 110
+    assert confusion.sum() == 110
+    assert confusion[GESTURE_INDEX['TANGAN_KANAN'], GESTURE_INDEX['TANGAN_KANAN']] == 30
+    assert confusion[GESTURE_INDEX['NETRAL'], GESTURE_INDEX['NETRAL']] == 60
+    assert confusion[GESTURE_INDEX['TANGAN_KIRI'], no_body] == 20
+    # Semua frame cocok kecuali 20 frame TANGAN_KIRI tanpa body
+    assert result['command_matches'] == 90
+
+
+def test_onset_latency_and_missed(session):
+    raw = evaluate_session(session, use_state_machine=False, smoothing=False)
+    assert raw['onsets'] == [
+        ['TANGAN_KANAN', 30, 0, 0.0],
+        ['NETRAL', 60, 0, 0.0],
+        ['TANGAN_KIRI', 90, None, None],
+    ]
+
+    # Dengan hysteresis perintah baru dipakai setelah enter frame
+    delay = GESTURE_CONFIG['command_enter_frames'] - 1
+    held = evaluate_session(session, use_state_machine=True, smoothing=False)
+    gesture, frame, latency_frames, latency_ms = held['onsets'][0]
+    assert (gesture, frame, latency_frames) == ('TANGAN_KANAN', 30, delay)
+    assert latency_ms == pytest.approx(delay * 33.333)
+    assert held['onsets'][2][2:] == [None, None]
+
+
+def test_summarize_precision_recall_and_latency(session):
+    summary = summarize([
+        evaluate_session(session, use_state_machine=False, smoothing=False)
+    ])
+    assert summary['frames'] == 110
+    assert summary['command_accuracy'] == pytest.approx(90 / 110)
+
+    right = summary['gestures']['TANGAN_KANAN']
+    assert (right['precision'], right['recall'], right['support']) == (1.0, 1.0, 30)
+    left = summary['gestures']['TANGAN_KIRI']
+    assert (left['precision'], left['recall'], left['support']) == (None, 0.0, 20)
+    assert summary['confusion']['TANGAN_KIRI'][NO_BODY] == 20
+
+    assert summary['latency']['TANGAN_KIRI'] == {'onsets': 1, 'missed': 1}
+    assert summary['latency']['TANGAN_KANAN']['mean_frames'] == 0.0
+
+
+def test_summarize_merges_sessions():
+    # Per session: 4 NETRAL benar, 1 NETRAL diprediksi KANAN, 5 KANAN benar
+    size = len(GESTURES)
+    confusion = np.zeros((size, size + 1), dtype=np.int64)
+    netral, kanan = GESTURE_INDEX['NETRAL'], GESTURE_INDEX['TANGAN_KANAN']
+    confusion[netral, netral] = 4
+    confusion[netral, kanan] = 1
+    confusion[kanan, kanan] = 5
+    result = {'frames': 10, 'confusion': confusion.tolist(),
+              'command_matches': 9, 'onsets': []}
+
+    summary = summarize([result, result])
+    assert summary['sessions'] == 2
+    assert summary['command_accuracy'] == pytest.approx(0.9)
+    assert summary['gestures']['TANGAN_KANAN']['precision'] == pytest.approx(10 / 12)
+    assert summary['gestures']['NETRAL']['recall'] == pytest.approx(0.8)
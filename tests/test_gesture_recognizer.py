@@ -0,0 +1,65 @@
+"""
+Test predicate GestureRecognizer di atas tabel rule
+"""
+
+import pytest
+
+from benchmarks.synthetic import gesture_pose, SyntheticBody
+from modules.gesture_recognizer import GestureRecognizer
+
+
+@pytest.fixture
+def recognizer():
+    return GestureRecognizer(smoothing=False)
+
+
+def keypoints_of(recognizer, gesture):
+    return recognizer.extract_keypoints(SyntheticBody(1, gesture_pose(gesture, 0)))
+
+
+@pytest.fixture
+def count_evaluations(recognizer, monkeypatch):
+    calls = []
+    evaluate = recognizer.rules.evaluate_features
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return evaluate(*args, **kwargs)
+
+    monkeypatch.setattr(recognizer.rules, 'evaluate_features', counting)
+    return calls
+
+
+@pytest.mark.parametrize('gesture, right, left, both, face', [
+    ('NETRAL', False, False, False, False),
+    ('TANGAN_KANAN', True, False, False, False),
+    ('TANGAN_KIRI', False, True, False, False),
+    ('KEDUA_TANGAN', True, True, True, False),
+    ('TANGAN_DI_WAJAH', False, False, False, True),
+])
+def test_predicates_match_pose(recognizer, gesture, right, left, both, face):
+    keypoints = keypoints_of(recognizer, gesture)
+    assert recognizer.is_right_hand_raised(keypoints) is right
+    assert recognizer.is_left_hand_raised(keypoints) is left
+    assert recognizer.is_both_hands_raised(keypoints) is both
+    assert recognizer.is_hand_near_face(keypoints) is face
+
+
+def test_predicates_share_one_evaluation(recognizer, count_evaluations):
+    keypoints = keypoints_of(recognizer, 'KEDUA_TANGAN')
+    assert recognizer.is_both_hands_raised(keypoints)
+    assert recognizer.is_right_hand_raised(keypoints)
+    assert recognizer.is_left_hand_raised(keypoints)
+    assert not recognizer.is_hand_near_face(keypoints)
+    assert len(count_evaluations) == 1
+
+
+def test_changed_keypoints_are_evaluated_again(recognizer, count_evaluations):
+    keypoints = keypoints_of(recognizer, 'KEDUA_TANGAN')
+    assert recognizer.is_both_hands_raised(keypoints)
+
+    # Buffer yang sama diisi ulang dengan pose lain (seperti main loop)
+    keypoints[:] = keypoints_of(recognizer, 'TANGAN_KANAN')
+    assert not recognizer.is_both_hands_raised(keypoints)
+    assert recognizer.is_right_hand_raised(keypoints)
+    assert len(count_evaluations) == 2
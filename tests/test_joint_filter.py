@@ -0,0 +1,110 @@
+"""
+Test filter One-Euro JointFilter dan efeknya pada churn perintah
+"""
+
+import numpy as np
+
+from benchmarks.synthetic import NEUTRAL_POSE, SyntheticBody
+from config.settings import JOINT_FILTER_CONFIG
+from modules.gesture_recognizer import GestureRecognizer
+from modules.joint_filter import JointFilter
+from modules.robot_controller import RobotController
+
+
+JOINTS = ('right_wrist', 'left_wrist')
+
+
+def keypoints(*positions):
+    """Keypoints (1, joint, 4) dari posisi (x, y, z) per joint"""
+    points = np.zeros((1, len(positions), 4), dtype=np.float32)
+    points[0, :, :3] = positions
+    return points
+
+
+def test_cold_start_passes_raw_position():
+    joint_filter = JointFilter(JOINTS)
+    raw = keypoints((100, -500, 2000), (-100, -500, 2000))
+    out = joint_filter.apply(raw.copy())
+    assert np.array_equal(out, raw)
+
+
+def test_jitter_is_damped_after_start():
+    joint_filter = JointFilter(JOINTS)
+    joint_filter.apply(keypoints((0, 0, 2000), (0, 0, 2000)))
+    out = joint_filter.apply(keypoints((20, 0, 2000), (0, 0, 2000)))
+    assert 0 < out[0, 0, 0] < 20
+
+
+def test_nan_joint_restarts_from_raw_position():
+    joint_filter = JointFilter(JOINTS)
+    for _ in range(5):
+        joint_filter.apply(keypoints((0, 0, 2000), (0, 0, 2000)))
+
+    lost = joint_filter.apply(keypoints((np.nan,) * 3, (0, 0, 2000)))
+    assert np.isnan(lost[0, 0, :3]).all()
+
+    # Muncul kembali jauh dari posisi lama: tidak di-blend dengan state lama
+    back = joint_filter.apply(keypoints((500, 100, 1800), (0, 0, 2000)))
+    assert np.array_equal(back[0, 0, :3], [500, 100, 1800])
+
+
+def test_per_joint_overrides():
+    config = dict(JOINT_FILTER_CONFIG,
+                  joints={'left_wrist': {'min_cutoff': 10.0, 'beta': 0.0}})
+    joint_filter = JointFilter(JOINTS, config=config)
+    assert joint_filter.min_cutoff.tolist() == [JOINT_FILTER_CONFIG['min_cutoff'], 10.0]
+    assert joint_filter.beta[1] == 0.0
+
+    # Cutoff lebih tinggi = mengikuti lompatan lebih cepat
+    joint_filter.apply(keypoints((0, 0, 2000), (0, 0, 2000)))
+    out = joint_filter.apply(keypoints((50, 0, 2000), (50, 0, 2000)))
+    assert out[0, 1, 0] > out[0, 0, 0]
+
+
+def test_configure_keeps_state():
+    joint_filter = JointFilter(JOINTS)
+    for _ in range(5):
+        joint_filter.apply(keypoints((0, 0, 2000), (0, 0, 2000)))
+
+    joint_filter.configure(dict(JOINT_FILTER_CONFIG, min_cutoff=2.0))
+    assert (joint_filter.min_cutoff == 2.0).all()
+    out = joint_filter.apply(keypoints((40, 0, 2000), (0, 0, 2000)))
+    # Masih difilter dari posisi lama, bukan cold start
+    assert 0 < out[0, 0, 0] < 40
+
+
+def test_reset_selected_track_only():
+    joint_filter = JointFilter(JOINTS, num_tracks=2)
+    pair = np.concatenate([keypoints((0, 0, 2000), (0, 0, 2000))] * 2)
+    joint_filter.apply(pair.copy())
+
+    joint_filter.reset([1])
+    moved = np.concatenate([keypoints((30, 0, 2000), (0, 0, 2000))] * 2)
+    out = joint_filter.apply(moved.copy())
+    assert out[0, 0, 0] < 30
+    assert out[1, 0, 0] == 30
+
+
+def count_command_changes(smoothing, frames=300, wrist_y=-630, noise=15.0):
+    """Pergantian perintah untuk tangan kanan yang diam di sekitar threshold"""
+    rng = np.random.RandomState(0)
+    recognizer = GestureRecognizer(smoothing=smoothing)
+    robot = RobotController(port='loop://')
+
+    commands = []
+    for _ in range(frames):
+        pose = NEUTRAL_POSE.copy()
+        pose[13] = (250, -450, 1980)
+        pose[14] = (260, wrist_y, 1960)
+        pose[15] = (262, wrist_y - 60, 1960)
+        pose += rng.normal(0, noise, pose.shape)
+        gestures = recognizer.recognize_gesture(SyntheticBody(1, pose))
+        commands.append(robot.gesture_to_command(gestures))
+    return sum(a != b for a, b in zip(commands, commands[1:]))
+
+
+def test_smoothing_reduces_command_churn_near_threshold():
+    raw = count_command_changes(smoothing=False)
+    smoothed = count_command_changes(smoothing=True)
+    assert raw > 0
+    assert smoothed < 0.5 * raw
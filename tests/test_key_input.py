@@ -0,0 +1,70 @@
+"""
+Test StdinKeyReader dengan stream StringIO dan signal
+"""
+
+import io
+import signal
+import time
+
+import pytest
+
+from modules.key_input import StdinKeyReader
+
+
+def drain(reader, count, timeout=2.0):
+    """Ambil count key (menunggu thread pembaca)"""
+    keys = []
+    deadline = time.monotonic() + timeout
+    while len(keys) < count and time.monotonic() < deadline:
+        key = reader.poll_key()
+        if key == -1:
+            time.sleep(0.005)
+            continue
+        keys.append(key)
+    return keys
+
+
+def test_poll_key_returns_stream_keys_in_order():
+    reader = StdinKeyReader(io.StringIO("sq\n\n  c \n"), signal_keys={})
+    assert reader.poll_key() == -1
+    reader.start()
+    try:
+        assert drain(reader, 3) == [ord('s'), ord('q'), ord('c')]
+        assert reader.poll_key() == -1
+    finally:
+        reader.cleanup()
+
+
+def test_push_key_queues_in_order():
+    reader = StdinKeyReader(io.StringIO(""), signal_keys={})
+    reader.push_key('r')
+    reader.push_key('c')
+    assert [reader.poll_key(), reader.poll_key(), reader.poll_key()] == [
+        ord('r'), ord('c'), -1]
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGUSR1'), reason="SIGUSR1 tidak tersedia")
+def test_signal_maps_to_key_and_cleanup_restores_handler():
+    def previous(signum, frame):
+        pass
+
+    original = signal.signal(signal.SIGUSR1, previous)
+    try:
+        reader = StdinKeyReader(io.StringIO(""), signal_keys={'SIGUSR1': 's'})
+        reader.start()
+        assert signal.getsignal(signal.SIGUSR1) is not previous
+
+        signal.raise_signal(signal.SIGUSR1)
+        assert drain(reader, 1) == [ord('s')]
+
+        reader.cleanup()
+        assert signal.getsignal(signal.SIGUSR1) is previous
+    finally:
+        signal.signal(signal.SIGUSR1, original)
+
+
+def test_unknown_signal_names_are_skipped():
+    reader = StdinKeyReader(io.StringIO(""), signal_keys={'SIGBOGUS': 'x'})
+    reader.start()
+    reader.cleanup()
+    assert reader.poll_key() == -1
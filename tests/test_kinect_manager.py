@@ -0,0 +1,140 @@
+"""
+Test KinectManager mode threaded dengan device dan body tracker tiruan
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from modules.kinect_manager import KinectManager, body_id
+
+
+class FakeCapture:
+    """Capture yang tidak valid lagi setelah update() berikutnya (seperti pykinect)"""
+
+    def __init__(self, number):
+        self.number = number
+        self.released = False
+
+    def get_depth_image(self):
+        if self.released:
+            raise RuntimeError("capture sudah dilepas")
+        return True, np.full((4, 4), self.number, dtype=np.uint16)
+
+
+class FakeDevice:
+    """Device.update() melepas capture sebelumnya"""
+
+    def __init__(self, delay=0.002):
+        self.delay = delay
+        self.number = 0
+        self.capture = None
+        self.closed = False
+        self.updating = threading.Event()
+
+    def update(self):
+        self.updating.set()
+        if self.capture is not None:
+            self.capture.released = True
+        self.number += 1
+        self.capture = FakeCapture(self.number)
+        time.sleep(self.delay)
+        return self.capture
+
+    def close(self):
+        self.closed = True
+
+
+class FakeImage:
+    """Image pykinect: data numpy lewat to_numpy()"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def to_numpy(self):
+        return True, self.data
+
+
+class FakeBodyFrame:
+    def get_num_bodies(self):
+        return 0
+
+    def get_body_index_map(self):
+        # pykinect mengembalikan Image, bukan (ret, ndarray)
+        return FakeImage(np.full((4, 4), 255, dtype=np.uint8))
+
+    def get_body_index_map_image(self):
+        return self.get_body_index_map().to_numpy()
+
+
+class FakeTracker:
+    def __init__(self):
+        self.destroyed = False
+
+    def update(self):
+        return FakeBodyFrame()
+
+    def destroy(self):
+        self.destroyed = True
+
+
+def test_threaded_depth_survives_next_update():
+    kinect = KinectManager(threaded=True, device=FakeDevice(),
+                           body_tracker=FakeTracker())
+    assert kinect.initialize()
+    try:
+        for _ in range(20):
+            frame = kinect.get_frame_handle()
+            assert frame is not None
+            # Producer sudah memanggil update() lagi saat frame dibaca
+            time.sleep(0.01)
+            ok, depth = frame.raw_depth()
+            assert ok
+            assert depth.dtype == np.uint16
+        assert kinect.total_frames_skipped > 0
+    finally:
+        kinect.cleanup()
+
+
+def test_cleanup_waits_for_capture_thread():
+    device = FakeDevice(delay=2.0)
+    tracker = FakeTracker()
+    kinect = KinectManager(threaded=True, device=device, body_tracker=tracker)
+    kinect.capture_timeout = 0.1
+    assert kinect.initialize()
+    assert device.updating.wait(1.0)
+
+    # Thread masih di dalam update(): device tidak boleh ditutup
+    kinect.cleanup()
+    assert not device.closed
+    assert not tracker.destroyed
+
+    kinect.capture_timeout = 5.0
+    kinect.cleanup()
+    assert device.closed
+    assert tracker.destroyed
+
+
+def test_body_id_from_handle():
+    class Handle:
+        id = 7
+
+    class PykinectBody:
+        def handle(self):
+            return Handle()
+
+    class ReplayLikeBody:
+        id = 3
+
+    assert body_id(PykinectBody(), 0) == 7
+    assert body_id(ReplayLikeBody(), 0) == 3
+    assert body_id(object(), 5) == 5
+
+
+def test_body_index_map_from_pykinect_image():
+    kinect = KinectManager(device=FakeDevice(), body_tracker=FakeTracker())
+    ret, body_index = kinect.get_body_index_map(FakeBodyFrame())
+    assert ret
+    assert body_index.dtype == np.uint8
+    assert (body_index == 255).all()
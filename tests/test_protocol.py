@@ -0,0 +1,57 @@
+"""
+Test encode/decode frame protocol biner dan statistik ProtocolLink
+"""
+
+import time
+
+from modules.protocol import (
+    encode_frame, FrameDecoder, ProtocolLink, MSG_COMMAND, MSG_HEARTBEAT
+)
+
+
+def test_round_trip_with_and_without_speed():
+    decoder = FrameDecoder()
+    data = encode_frame(MSG_COMMAND, 'F', 7) + encode_frame(MSG_HEARTBEAT, 'L', 8, 200)
+    frames = decoder.feed(data)
+    assert [(f.msg_type, f.command, f.seq, f.speed) for f in frames] == [
+        (MSG_COMMAND, 'F', 7, None), (MSG_HEARTBEAT, 'L', 8, 200)]
+    assert decoder.bad_bytes == 0
+
+
+def test_decoder_resyncs_after_corrupt_bytes():
+    decoder = FrameDecoder()
+    good = encode_frame(MSG_COMMAND, 'R', 1)
+    corrupt = bytearray(encode_frame(MSG_COMMAND, 'B', 2))
+    corrupt[-1] ^= 0xFF
+    frames = decoder.feed(b'\x00' + bytes(corrupt) + good)
+    assert [f.command for f in frames] == ['R']
+    assert decoder.bad_bytes > 0
+
+
+def test_decoder_handles_split_frames():
+    decoder = FrameDecoder()
+    frame = encode_frame(MSG_COMMAND, 'S', 3, 100)
+    assert decoder.feed(frame[:2]) == []
+    assert [f.command for f in decoder.feed(frame[2:])] == ['S']
+
+
+def test_link_counts_echo_and_loss():
+    link = ProtocolLink(ack_timeout=0.01)
+    echoed = link.encode_command('F')
+    link.encode_command('L')
+    link.receive(echoed)
+    time.sleep(0.02)
+
+    stats = link.get_stats()
+    assert (stats['sent'], stats['acked'], stats['lost']) == (2, 1, 1)
+    assert stats['loss_rate'] == 0.5
+    assert 'rtt_avg_ms' in stats
+
+
+def test_heartbeat_carries_last_command():
+    link = ProtocolLink(heartbeat_interval=0.5)
+    assert link.heartbeat_due() == 0.0
+    link.encode_command('B')
+    assert link.heartbeat_due() > 0
+    frame, = FrameDecoder().feed(link.encode_heartbeat())
+    assert (frame.msg_type, frame.command) == (MSG_HEARTBEAT, 'B')
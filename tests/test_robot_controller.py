@@ -0,0 +1,21 @@
+"""
+Test RobotController tanpa hardware
+"""
+
+import gc
+import sys
+
+import pytest
+
+from modules.robot_controller import RobotController
+
+
+def test_unknown_protocol_rejected_without_destructor_error(monkeypatch):
+    unraisable = []
+    monkeypatch.setattr(sys, 'unraisablehook', unraisable.append)
+
+    with pytest.raises(ValueError):
+        RobotController(port='loop://', protocol='bogus')
+    gc.collect()
+
+    assert unraisable == []
@@ -0,0 +1,81 @@
+"""
+Test RobotPool dengan port loop://
+"""
+
+import time
+
+import pytest
+
+from modules.robot_pool import RobotPool
+
+
+def wait_for(condition, timeout=2.0):
+    """Tunggu sampai condition() True"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_link_stats_survive_disconnect():
+    pool = RobotPool([{'name': 'a', 'port': 'loop://'}])
+    pool.connect()
+    pool.send_command('F')
+    pool.disconnect()
+
+    stats = pool.get_link_stats()['a']
+    # STOP saat disconnect tetap tercatat setelah writer ditutup
+    assert stats['writes'] >= 1
+    assert 'latency_avg_ms' in stats
+
+
+def test_links_use_their_own_overrides():
+    pool = RobotPool([
+        {'name': 'a', 'port': 'loop://', 'settle_time': 0.0,
+         'command_delay': 0.0},
+        {'name': 'b', 'port': 'loop://', 'settle_time': 0.05,
+         'protocol': 'binary', 'heartbeat_interval': 5.0, 'ack_timeout': 0.3,
+         'reconnect_max_delay': 2.0},
+    ])
+    a, b = pool.links['a'], pool.links['b']
+    assert pool.connect()
+    try:
+        assert a.writer.settle_time == 0.0
+        assert b.writer.settle_time == 0.05
+        assert a.link is None
+        assert b.link.heartbeat_interval == 5.0
+        assert b.link.ack_timeout == 0.3
+        assert b.config['reconnect_max_delay'] == 2.0
+        assert a.config['reconnect_max_delay'] != 2.0
+
+        # STOP awal sudah ditulis kedua link
+        assert wait_for(lambda: a.get_link_stats()['writes'] >= 1 and
+                        b.get_link_stats()['writes'] >= 1)
+
+        # Rate limit per link: a meneruskan setiap F, b hanya perubahan
+        for count in range(2, 5):
+            a.send_command('F')
+            b.send_command('F')
+            assert wait_for(lambda: a.get_link_stats()['writes'] >= count)
+        assert wait_for(lambda: b.get_link_stats().get('acked', 0) >= 2)
+        assert b.get_link_stats()['writes'] == 2
+    finally:
+        pool.disconnect()
+
+    stats = pool.get_link_stats()
+    assert stats['a']['writes'] > stats['b']['writes']
+    assert 'sent' not in stats['a']
+    assert stats['b']['sent'] >= 1
+
+
+def test_unknown_link_key_rejected():
+    with pytest.raises(ValueError):
+        RobotPool([{'name': 'a', 'port': 'loop://', 'sped': 100}])
+
+
+def test_sync_write_rejected_for_several_links():
+    with pytest.raises(ValueError):
+        RobotPool([{'name': 'a', 'port': 'loop://'},
+                   {'name': 'b', 'port': 'loop://', 'async_write': False}])
@@ -0,0 +1,170 @@
+"""
+Test snapshot RuntimeConfig dan ConfigReloader
+"""
+
+import time
+
+import pytest
+
+from config import settings
+from config.runtime import (
+    ConfigError, ConfigReloader, GestureSettings, JointFilterSettings,
+    RuntimeConfig, load_config
+)
+
+
+def gesture_values(**overrides):
+    values = dict(settings.GESTURE_CONFIG)
+    values.update(overrides)
+    return values
+
+
+def write_config(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def wait_for(condition, timeout=2.0):
+    """Tunggu sampai condition() True"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_section_from_dict_accepts_settings():
+    section = GestureSettings.from_dict(gesture_values())
+    assert section.to_dict() == gesture_values()
+
+
+def test_section_rejects_unknown_key():
+    with pytest.raises(ConfigError, match='tidak dikenal'):
+        GestureSettings.from_dict(gesture_values(raise_treshold=90))
+
+
+def test_section_rejects_missing_key():
+    values = gesture_values()
+    del values['buffer_size']
+    with pytest.raises(ConfigError, match='hilang'):
+        GestureSettings.from_dict(values)
+
+
+@pytest.mark.parametrize('key, value', [
+    ('buffer_size', 15.5),
+    ('buffer_size', True),
+    ('raise_threshold', '100'),
+    ('command_thresholds', []),
+])
+def test_section_rejects_wrong_type(key, value):
+    with pytest.raises(ConfigError, match='harus'):
+        GestureSettings.from_dict(gesture_values(**{key: value}))
+
+
+def test_section_coerces_int_to_float_and_list_to_tuple():
+    section = GestureSettings.from_dict(
+        gesture_values(raise_threshold=90, command_passthrough=['LAMBAI']))
+    assert isinstance(section.raise_threshold, float)
+    assert section.command_passthrough == ('LAMBAI',)
+
+
+def test_section_rejects_non_positive_values():
+    with pytest.raises(ConfigError, match='>= 1'):
+        GestureSettings.from_dict(gesture_values(buffer_size=0))
+    values = dict(settings.JOINT_FILTER_CONFIG, rate=0.0)
+    with pytest.raises(ConfigError, match='> 0'):
+        JointFilterSettings.from_dict(values)
+
+
+def test_partial_override_merges_over_base(tmp_path):
+    path = write_config(tmp_path / 'override.py',
+                        "GESTURE_CONFIG = {'raise_threshold': 90}\n")
+    config = load_config(path)
+
+    assert config.gesture.raise_threshold == 90
+    assert config.gesture.wave_threshold == settings.GESTURE_CONFIG['wave_threshold']
+    assert config.display == RuntimeConfig.from_settings().display
+    assert config.rules == tuple(settings.GESTURE_RULES)
+    assert config.restart_required == ()
+
+
+def test_restart_required_reports_startup_changes(tmp_path):
+    path = write_config(tmp_path / 'override.py', (
+        "KINECT_CONFIG = {'depth_mode': 'NFOV_UNBINNED'}\n"
+        "ROBOT_CONFIG = {'port': 'COM9', 'baud_rate': %d}\n"
+        "GESTURE_CONFIG = {'max_bodies': 2}\n"
+        "DISPLAY_CONFIG = {'window_name': 'x'}\n"
+    ) % settings.ROBOT_CONFIG['baud_rate'])
+    config = load_config(path)
+
+    assert set(config.restart_required) == {
+        "KINECT_CONFIG['depth_mode']",
+        "ROBOT_CONFIG['port']",
+        "GESTURE_CONFIG['max_bodies']",
+        "DISPLAY_CONFIG['window_name']",
+    }
+
+
+def test_reloader_keeps_old_snapshot_on_invalid_reload(tmp_path):
+    path = write_config(tmp_path / 'override.py',
+                        "GESTURE_CONFIG = {'raise_threshold': 90}\n")
+    reloader = ConfigReloader(path)
+    startup = reloader.load()
+    reloader.start()
+    try:
+        write_config(tmp_path / 'override.py',
+                     "GESTURE_CONFIG = {'buffer_size': 0}\n")
+        reloader.request()
+        assert wait_for(lambda: reloader.failures == 1)
+        assert reloader.poll() is None
+        assert reloader.current is startup
+
+        write_config(tmp_path / 'override.py', "GESTURE_CONFIG = {'bogus': 1\n")
+        reloader.request()
+        assert wait_for(lambda: reloader.failures == 2)
+        assert reloader.poll() is None
+    finally:
+        reloader.stop()
+    assert reloader.reloads == 0
+
+
+def test_reloader_rejects_config_refused_by_validate(tmp_path):
+    def validate(config):
+        if config.gesture.raise_threshold > 100:
+            raise ValueError("terlalu tinggi")
+
+    path = write_config(tmp_path / 'override.py', "")
+    reloader = ConfigReloader(path, validate=validate)
+    reloader.load()
+    reloader.start()
+    try:
+        write_config(tmp_path / 'override.py',
+                     "GESTURE_CONFIG = {'raise_threshold': 150}\n")
+        reloader.request()
+        assert wait_for(lambda: reloader.failures == 1)
+        assert reloader.poll() is None
+    finally:
+        reloader.stop()
+
+
+def test_poll_hands_over_each_snapshot_once(tmp_path):
+    path = write_config(tmp_path / 'override.py', "")
+    reloader = ConfigReloader(path)
+    reloader.load()
+    reloader.start()
+    try:
+        write_config(tmp_path / 'override.py',
+                     "GESTURE_CONFIG = {'raise_threshold': 80}\n")
+        reloader.request()
+        polled = []
+        assert wait_for(lambda: polled.append(reloader.poll()) or polled[-1])
+
+        config = polled[-1]
+        assert config.version == 1
+        assert config.gesture.raise_threshold == 80
+        assert reloader.current is config
+        assert reloader.poll() is None
+        assert reloader.reloads == 1
+    finally:
+        reloader.stop()
@@ -0,0 +1,109 @@
+"""
+Test SerialWriter di atas port loopback pyserial (loop://)
+"""
+
+import time
+
+import pytest
+import serial
+
+from modules.serial_writer import SerialWriter
+
+
+@pytest.fixture
+def port():
+    """Port loopback: byte yang ditulis bisa dibaca kembali"""
+    ser = serial.serial_for_url('loop://', timeout=0.1)
+    yield ser
+    ser.close()
+
+
+def read_all(ser, expected, timeout=1.0):
+    """Baca byte dari loopback sampai `expected` byte atau timeout"""
+    data = b''
+    deadline = time.perf_counter() + timeout
+    while len(data) < expected and time.perf_counter() < deadline:
+        data += ser.read(max(1, ser.in_waiting))
+    return data
+
+
+def wait_for(condition, timeout=1.0):
+    """Tunggu sampai condition() True"""
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_latest_wins_coalescing(port):
+    # Selama settle link sibuk: hanya perintah terakhir yang dikirim
+    writer = SerialWriter(port, settle_time=0.2)
+    writer.start()
+    for command in (b'F', b'L', b'R'):
+        writer.post(command)
+
+    assert wait_for(lambda: writer.writes == 1)
+    writer.stop()
+
+    assert read_all(port, 1) == b'R'
+    assert port.in_waiting == 0
+    stats = writer.get_stats()
+    assert stats['writes'] == 1
+    assert stats['drops'] == 2
+    assert stats['max_queue_depth'] == 1
+
+
+def test_urgent_jumps_queue(port):
+    writer = SerialWriter(port, settle_time=0.2)
+    writer.start()
+    writer.post(b'F')
+    writer.post_urgent(b'S')
+
+    assert wait_for(lambda: writer.writes == 1)
+    writer.post(b'B')
+    assert wait_for(lambda: writer.writes == 2)
+    writer.stop()
+
+    # Perintah normal yang menunggu dibuang, tidak menimpa STOP
+    assert read_all(port, 2) == b'SB'
+    assert writer.get_stats()['drops'] == 1
+
+
+def test_urgent_and_pending_both_sent_urgent_first(port):
+    writer = SerialWriter(port, settle_time=0.2)
+    writer.start()
+    writer.post_urgent(b'S')
+    writer.post(b'F')
+    assert writer.queue_depth == 2
+
+    assert wait_for(lambda: writer.writes == 2)
+    writer.stop()
+    assert read_all(port, 2) == b'SF'
+
+
+def test_stop_flushes_pending(port):
+    # stop() memotong settle dan tetap mengirim perintah yang menunggu
+    writer = SerialWriter(port, settle_time=5.0)
+    writer.start()
+    writer.post(b'L')
+
+    start = time.perf_counter()
+    writer.stop(timeout=2.0)
+    assert time.perf_counter() - start < 1.0
+
+    assert read_all(port, 1) == b'L'
+    assert writer.writes == 1
+    assert not writer.is_alive()
+
+
+def test_latency_excludes_settle_time(port):
+    writer = SerialWriter(port, settle_time=0.3)
+    writer.start()
+    writer.post(b'S')
+
+    assert wait_for(lambda: writer.writes == 1)
+    writer.stop()
+
+    stats = writer.get_stats()
+    assert stats['latency_last_ms'] < 100
+    assert stats['latency_max_ms'] < 100
@@ -0,0 +1,103 @@
+"""
+Test tools.sweep: grid vectorized = evaluasi per kombinasi
+"""
+
+import argparse
+import itertools
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import gesture_pose
+from config.settings import GESTURE_CONFIG
+from tools.evaluate import evaluate_session, run_session
+from tools.sweep import pareto_front, parse_grid, sweep_session
+
+
+@pytest.fixture
+def session(record_session):
+    """Tangan kanan naik-turun di sekitar threshold, lambaian dan wajah"""
+    rng = np.random.RandomState(0)
+    frames = []
+    for t in range(240):
+        segment = t // 40
+        if segment % 3 == 0:
+            pose = gesture_pose('NETRAL', t)
+            height = -560 - 140 * (0.5 + 0.5 * np.sin(t / 5))
+            pose[14, 1] = height
+            pose[15, 1] = height - 60
+        elif segment % 3 == 1:
+            pose = gesture_pose('LAMBAI', t)
+        else:
+            pose = gesture_pose('TANGAN_DI_WAJAH', t)
+        frames.append(pose + rng.normal(0, 20, pose.shape))
+    labels = [(0, 40, 'TANGAN_KANAN'), (40, 80, 'LAMBAI'),
+              (80, 120, 'TANGAN_DI_WAJAH'), (120, 160, 'TANGAN_KANAN'),
+              (160, 200, 'LAMBAI'), (200, 240, 'TANGAN_DI_WAJAH')]
+    return record_session('sweep', frames, labels)
+
+
+def test_grid_matches_per_combination_evaluation(session, monkeypatch):
+    grid = {
+        'raise_threshold': (60, 120, 160),
+        'face_distance_threshold': (100, 250),
+        'buffer_size': (10, 20),
+    }
+    result = sweep_session(session, grid, smoothing=False)
+    assert result['correct'].shape == (2, 3, 2)
+
+    for b, r, f in itertools.product(range(2), range(3), range(2)):
+        monkeypatch.setitem(GESTURE_CONFIG, 'buffer_size', grid['buffer_size'][b])
+        monkeypatch.setitem(GESTURE_CONFIG, 'raise_threshold', grid['raise_threshold'][r])
+        monkeypatch.setitem(GESTURE_CONFIG, 'face_distance_threshold',
+                            grid['face_distance_threshold'][f])
+
+        evaluated = evaluate_session(session, use_state_machine=False,
+                                     smoothing=False)
+        _, _, commands = run_session(session, use_state_machine=False,
+                                     smoothing=False)
+        changes = sum(prev != cur for prev, cur in zip(['S'] + commands, commands))
+
+        assert result['correct'][b, r, f] == evaluated['command_matches']
+        assert result['changes'][b, r, f] == changes
+
+    # Grid memang menghasilkan kombinasi yang berbeda
+    assert len(np.unique(result['correct'])) > 1
+    assert len(np.unique(result['changes'])) > 1
+
+
+def test_pareto_front_dominated_points():
+    accuracy = np.array([0.9, 0.8, 0.95, 0.7, 0.95])
+    churn = np.array([10.0, 12.0, 20.0, 5.0, 25.0])
+    # 1 kalah dari 0; 4 kalah dari 2 (akurasi sama, churn lebih besar)
+    assert pareto_front(accuracy, churn).tolist() == [3, 0, 2]
+
+
+def test_pareto_front_ties():
+    accuracy = np.array([0.9, 0.9, 0.8])
+    churn = np.array([10.0, 10.0, 10.0])
+    # Titik identik hanya diambil sekali, yang akurasinya lebih rendah dibuang
+    front = pareto_front(accuracy, churn)
+    assert len(front) == 1
+    assert front[0] in (0, 1)
+
+
+def test_parse_grid_formats():
+    assert parse_grid('raise_threshold=40:100:20') == ('raise_threshold', (40, 60, 80, 100))
+    assert parse_grid('wave_threshold=50,75.5') == ('wave_threshold', (50, 75.5))
+    assert parse_grid('buffer_size=10,15') == ('buffer_size', (10, 15))
+
+
+@pytest.mark.parametrize('text', [
+    'raise_threshold',                  # tanpa '='
+    'max_bodies=1,2',                   # bukan parameter rule
+    'raise_threshold=40:100',           # range tidak lengkap
+    'raise_threshold=40:100:0',         # step nol
+    'raise_threshold=a,b',              # bukan angka
+    'raise_threshold=100:40:10',        # grid kosong
+    'buffer_size=10.5',                 # buffer_size bukan bulat
+    'buffer_size=0',                    # buffer_size tidak positif
+])
+def test_parse_grid_errors(text):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_grid(text)
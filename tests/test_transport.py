@@ -0,0 +1,59 @@
+"""
+Test transport jaringan dengan NetReceiver di localhost
+"""
+
+import time
+
+import pytest
+
+from modules.protocol import encode_frame, MSG_COMMAND
+from modules.transport import NetworkTransport, open_transport
+from tools.net_receiver import NetReceiver
+
+
+def wait_for(condition, timeout=2.0):
+    """Tunggu sampai condition() True"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def test_subclass_without_connect_fails_at_construction():
+    class Incomplete(NetworkTransport):
+        scheme = 'x'
+
+    with pytest.raises(TypeError):
+        Incomplete('127.0.0.1', 1)
+
+
+@pytest.mark.parametrize('scheme', ['udp', 'tcp'])
+def test_ascii_commands_arrive_in_order(scheme):
+    receiver = NetReceiver(scheme, ascii_mode=True)
+    url = receiver.start()
+    link = open_transport(url)
+    try:
+        for command in 'FLRS':
+            link.write(command.encode())
+        assert wait_for(lambda: len(receiver.commands) == 4)
+        assert [command for _, command in receiver.commands] == list('FLRS')
+    finally:
+        link.close()
+        receiver.stop()
+
+
+@pytest.mark.parametrize('scheme', ['udp', 'tcp'])
+def test_binary_frame_is_echoed(scheme):
+    receiver = NetReceiver(scheme)
+    url = receiver.start()
+    link = open_transport(url)
+    try:
+        frame = encode_frame(MSG_COMMAND, 'F', 1)
+        link.write(frame)
+        assert wait_for(lambda: link.in_waiting >= len(frame))
+        assert link.read(len(frame)) == frame
+    finally:
+        link.close()
+        receiver.stop()
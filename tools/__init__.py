@@ -0,0 +1,6 @@
+"""
+Tools pendukung untuk Robot Gesture Control System
+
+Jalankan dari root project:
+    python -m tools.robot_standin
+"""
@@ -0,0 +1,451 @@
+"""
+Offline Evaluation
+Jalankan pipeline GestureRecognizer + gesture_to_command (+ CommandStateMachine)
+di atas direktori session rekaman (.skel) berlabel, tanpa Azure Kinect.
+Session dibagi ke process pool; hasilnya precision/recall per gesture,
+confusion matrix dan latency perintah sejak onset gesture.
+
+Label ground truth disimpan di samping session sebagai CSV
+'<nama>.labels.csv' (frame end eksklusif; frame tanpa label = NETRAL):
+
+    start,end,gesture
+    30,120,TANGAN_KANAN
+    150,210,LAMBAI
+
+Penggunaan (dari root project):
+    python -m tools.evaluate sessions/
+    python -m tools.evaluate sessions/ --jobs 32 --output hasil.json
+    python -m tools.evaluate sessions/ --set raise_threshold=120 --no-state-machine
+"""
+
+import argparse
+import ast
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from config.settings import GESTURE_CONFIG, GESTURE_RULES, GESTURE_COMMANDS
+from modules.command_state import CommandStateMachine
+from modules.gesture_recognizer import MultiBodyGestureRecognizer
+from modules.robot_controller import RobotController
+from modules.skeleton_session import SessionReplay, ReplayBody
+
+# Ekstensi file session dan file label
+SESSION_EXT = '.skel'
+LABELS_EXT = '.labels.csv'
+
+# Label untuk frame yang tidak tercakup segmen mana pun
+DEFAULT_LABEL = next(rule['gesture'] for rule in GESTURE_RULES
+                     if rule.get('default'))
+
+# Kolom prediksi tambahan: frame tanpa body
+NO_BODY = '-'
+
+GESTURES = tuple(rule['gesture'] for rule in GESTURE_RULES)
+GESTURE_INDEX = {name: i for i, name in enumerate(GESTURES)}
+PRIORITY = {rule['gesture']: rule.get('priority', 0) for rule in GESTURE_RULES}
+
+
+def labels_path(session_path):
+    """
+    Path file label untuk session
+
+    Args:
+        session_path (str): Path file .skel
+
+    Returns:
+        str: Path '<nama>.labels.csv'
+    """
+    root, _ = os.path.splitext(session_path)
+    return root + LABELS_EXT
+
+
+def find_sessions(directory):
+    """
+    Cari session berlabel di direktori (rekursif)
+
+    Args:
+        directory (str): Direktori session
+
+    Returns:
+        tuple: (sessions, unlabeled) list path, terurut
+    """
+    pattern = os.path.join(directory, '**', '*' + SESSION_EXT)
+    sessions, unlabeled = [], []
+    for path in sorted(glob.glob(pattern, recursive=True)):
+        (sessions if os.path.exists(labels_path(path)) else unlabeled).append(path)
+    return sessions, unlabeled
+
+
+def load_labels(path, num_frames, default=DEFAULT_LABEL):
+    """
+    Baca label segmen menjadi label per frame
+
+    Args:
+        path (str): Path file CSV (kolom start, end, gesture)
+        num_frames (int): Jumlah frame session
+        default (str): Label frame di luar segmen
+
+    Returns:
+        np.ndarray: Index gesture (GESTURES) per frame, int64 (num_frames,)
+
+    Raises:
+        ValueError: Jika gesture tidak dikenal atau segmen tidak valid
+    """
+    labels = np.full(num_frames, GESTURE_INDEX[default], dtype=np.int64)
+
+    with open(path, newline='') as f:
+        rows = [row for row in f if row.strip() and not row.startswith('#')]
+    for row in csv.DictReader(rows):
+        gesture = row['gesture'].strip()
+        if gesture not in GESTURE_INDEX:
+            raise ValueError(f"{path}: gesture tidak dikenal {gesture!r}")
+        start, end = int(row['start']), int(row['end'])
+        if not 0 <= start < end:
+            raise ValueError(f"{path}: segmen tidak valid {start}-{end}")
+        labels[start:end] = GESTURE_INDEX[gesture]
+
+    return labels
+
+
+def apply_overrides(overrides):
+    """Terapkan override GESTURE_CONFIG (initializer proses worker)"""
+    GESTURE_CONFIG.update(overrides)
+
+
+def run_session(path, use_state_machine=True, smoothing=None):
+    """
+    Jalankan pipeline recognition di atas satu session
+
+    Sama dengan main.py: body utama dari MultiBodyGestureRecognizer,
+    perintah dari RobotController.gesture_to_command lalu (opsional)
+    CommandStateMachine; frame tanpa body menghasilkan STOP.
+
+    Args:
+        path (str): Path file .skel
+        use_state_machine (bool): Lewatkan perintah ke CommandStateMachine
+        smoothing (bool, optional): Filter posisi joint. Default dari config.
+
+    Returns:
+        tuple: (timestamps, predicted, commands) per frame; timestamps int64
+               (mikrodetik), predicted = gesture utama (str, NO_BODY jika
+               tidak ada body), commands = perintah yang dikirim (str)
+    """
+    records = SessionReplay.open_records(path)
+    starts = SessionReplay.frame_starts(records)
+    num_frames = len(starts) - 1
+
+    recognizer = MultiBodyGestureRecognizer(smoothing=smoothing)
+    robot = RobotController()
+    state = CommandStateMachine() if use_state_machine else None
+
+    timestamps = np.empty(num_frames, dtype=np.int64)
+    predicted = []
+    commands = []
+
+    for i in range(num_frames):
+        frame = records[starts[i]:starts[i + 1]]
+        timestamps[i] = frame[0]['timestamp_usec']
+        bodies = [ReplayBody(record) for record in frame] \
+            if frame[0]['num_bodies'] else []
+
+        results = recognizer.recognize_bodies(bodies)
+        if not results:
+            predicted.append(NO_BODY)
+            commands.append('S')
+            continue
+
+        gestures = results[recognizer.primary_id]
+        known = [g for g in gestures if g in PRIORITY]
+        predicted.append(max(known, key=PRIORITY.__getitem__) if known
+                         else DEFAULT_LABEL)
+        command = robot.gesture_to_command(gestures)
+        commands.append(state.update(command, gestures) if state else command)
+
+    return timestamps, predicted, commands
+
+
+def evaluate_session(path, use_state_machine=True, smoothing=None):
+    """
+    Evaluasi satu session terhadap labelnya (dipanggil di worker)
+
+    Latency diukur untuk setiap onset, yaitu frame di mana perintah yang
+    diharapkan (GESTURE_COMMANDS label) berubah: jarak dari onset sampai
+    frame pertama dengan perintah keluaran = perintah yang diharapkan,
+    sebelum onset berikutnya. Jika tidak tercapai, onset dihitung missed.
+
+    Args:
+        path (str): Path file .skel (label di labels_path(path))
+        use_state_machine (bool): Lewatkan perintah ke CommandStateMachine
+        smoothing (bool, optional): Filter posisi joint. Default dari config.
+
+    Returns:
+        dict: path, frames, confusion (list [label][prediksi], kolom
+              terakhir NO_BODY), command_matches, onsets (list
+              [gesture, frame, latency_frames, latency_ms]; latency None
+              jika missed)
+    """
+    timestamps, predicted, commands = run_session(path, use_state_machine,
+                                                  smoothing)
+    num_frames = len(commands)
+    labels = load_labels(labels_path(path), num_frames)
+
+    columns = dict(GESTURE_INDEX, **{NO_BODY: len(GESTURES)})
+    predicted_index = np.array([columns[g] for g in predicted], dtype=np.int64)
+    confusion = np.zeros((len(GESTURES), len(columns)), dtype=np.int64)
+    np.add.at(confusion, (labels, predicted_index), 1)
+
+    expected = [GESTURE_COMMANDS[GESTURES[i]] for i in labels.tolist()]
+    matches = [e == c for e, c in zip(expected, commands)]
+
+    # Onset: perintah yang diharapkan berubah (sebelum frame 0 = STOP)
+    onsets = [t for t in range(num_frames)
+              if expected[t] != (expected[t - 1] if t else 'S')]
+    results = []
+    for k, onset in enumerate(onsets):
+        end = onsets[k + 1] if k + 1 < len(onsets) else num_frames
+        reached = next((t for t in range(onset, end) if matches[t]), None)
+        latency_frames = latency_ms = None
+        if reached is not None:
+            latency_frames = reached - onset
+            latency_ms = float(timestamps[reached] - timestamps[onset]) / 1000
+        results.append([GESTURES[labels[onset]], onset,
+                        latency_frames, latency_ms])
+
+    return {
+        'path': path,
+        'frames': num_frames,
+        'confusion': confusion.tolist(),
+        'command_matches': int(sum(matches)),
+        'onsets': results,
+    }
+
+
+def evaluate(sessions, jobs=None, overrides=None, use_state_machine=True,
+             smoothing=None, progress=True):
+    """
+    Evaluasi banyak session secara paralel
+
+    Args:
+        sessions (list): Path file .skel
+        jobs (int, optional): Jumlah proses worker. Default: jumlah CPU.
+        overrides (dict, optional): Override GESTURE_CONFIG di worker
+        use_state_machine (bool): Lewatkan perintah ke CommandStateMachine
+        smoothing (bool, optional): Filter posisi joint. Default dari config.
+        progress (bool): Cetak progres per session
+
+    Returns:
+        tuple: (results, errors); results = list dict evaluate_session()
+               terurut sesuai sessions, errors = list (path, pesan)
+    """
+    results = {}
+    errors = []
+    jobs = min(jobs or os.cpu_count() or 1, max(len(sessions), 1))
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=apply_overrides,
+                             initargs=(overrides or {},)) as executor:
+        futures = {
+            executor.submit(evaluate_session, path, use_state_machine,
+                            smoothing): path
+            for path in sessions
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            path = futures[future]
+            try:
+                results[path] = future.result()
+            except Exception as e:
+                errors.append((path, str(e)))
+                if progress:
+                    print(f"❌ [{done}/{len(sessions)}] {path}: {e}")
+                continue
+            if progress:
+                print(f"✅ [{done}/{len(sessions)}] {path} "
+                      f"({results[path]['frames']} frame)")
+
+    return [results[path] for path in sessions if path in results], errors
+
+
+def summarize(results):
+    """
+    Gabungkan hasil semua session
+
+    Args:
+        results (list): Hasil evaluate_session()
+
+    Returns:
+        dict: sessions, frames, command_accuracy, confusion {label:
+              {prediksi: jumlah}}, gestures {nama: {precision, recall,
+              support}}, latency {gesture: {onsets, missed, mean_ms,
+              p50_ms, p95_ms, mean_frames}}
+    """
+    columns = GESTURES + (NO_BODY,)
+    confusion = np.zeros((len(GESTURES), len(columns)), dtype=np.int64)
+    frames = matches = 0
+    onsets = {}
+    for result in results:
+        confusion += np.asarray(result['confusion'], dtype=np.int64)
+        frames += result['frames']
+        matches += result['command_matches']
+        for gesture, _, latency_frames, latency_ms in result['onsets']:
+            onsets.setdefault(gesture, []).append((latency_frames, latency_ms))
+
+    true_positive = np.diag(confusion[:, :len(GESTURES)])
+    support = confusion.sum(axis=1)
+    predicted = confusion[:, :len(GESTURES)].sum(axis=0)
+    gestures = {
+        name: {
+            'precision': float(true_positive[i] / predicted[i]) if predicted[i] else None,
+            'recall': float(true_positive[i] / support[i]) if support[i] else None,
+            'support': int(support[i]),
+        }
+        for i, name in enumerate(GESTURES)
+    }
+
+    latency = {}
+    for gesture in GESTURES:
+        values = onsets.get(gesture)
+        if not values:
+            continue
+        hit = [(f, ms) for f, ms in values if ms is not None]
+        stats = {'onsets': len(values), 'missed': len(values) - len(hit)}
+        if hit:
+            latency_ms = np.array([ms for _, ms in hit])
+            stats.update({
+                'mean_ms': float(latency_ms.mean()),
+                'p50_ms': float(np.percentile(latency_ms, 50)),
+                'p95_ms': float(np.percentile(latency_ms, 95)),
+                'mean_frames': float(np.mean([f for f, _ in hit])),
+            })
+        latency[gesture] = stats
+
+    return {
+        'sessions': len(results),
+        'frames': frames,
+        'command_accuracy': matches / frames if frames else None,
+        'confusion': {
+            GESTURES[i]: dict(zip(columns, confusion[i].tolist()))
+            for i in range(len(GESTURES))
+        },
+        'gestures': gestures,
+        'latency': latency,
+    }
+
+
+def _fmt(value, spec='.3f'):
+    """Format angka atau '-' jika None"""
+    return '-' if value is None else format(value, spec)
+
+
+def print_report(summary):
+    """Cetak ringkasan evaluasi"""
+    print(f"\n📊 {summary['sessions']} session, {summary['frames']} frame, "
+          f"akurasi perintah {_fmt(summary['command_accuracy'], '.1%')}")
+
+    print(f"\n{'gesture':<16} {'precision':>9} {'recall':>7} {'support':>8}")
+    for name, stats in summary['gestures'].items():
+        print(f"{name:<16} {_fmt(stats['precision']):>9} "
+              f"{_fmt(stats['recall']):>7} {stats['support']:>8}")
+
+    columns = GESTURES + (NO_BODY,)
+    width = max(len(name) for name in columns) + 1
+    print("\n🔢 Confusion matrix (baris = label, kolom = prediksi):")
+    print(' ' * 16 + ''.join(f"{name[:width - 1]:>{width}}" for name in columns))
+    for name, row in summary['confusion'].items():
+        print(f"{name:<16}" + ''.join(f"{row[c]:>{width}}" for c in columns))
+
+    if summary['latency']:
+        print(f"\n⏱️  Latency perintah sejak onset:")
+        print(f"{'gesture':<16} {'onsets':>6} {'missed':>6} {'mean':>8} "
+              f"{'p50':>8} {'p95':>8} {'frames':>6}")
+        for name, stats in summary['latency'].items():
+            print(f"{name:<16} {stats['onsets']:>6} {stats['missed']:>6} "
+                  f"{_fmt(stats.get('mean_ms'), '.0f'):>6}ms "
+                  f"{_fmt(stats.get('p50_ms'), '.0f'):>6}ms "
+                  f"{_fmt(stats.get('p95_ms'), '.0f'):>6}ms "
+                  f"{_fmt(stats.get('mean_frames'), '.1f'):>6}")
+
+
+def parse_override(text):
+    """
+    Parse 'key=value' menjadi (key, value) untuk GESTURE_CONFIG
+
+    Raises:
+        argparse.ArgumentTypeError: Jika format atau key tidak valid
+    """
+    key, sep, value = text.partition('=')
+    if not sep or key not in GESTURE_CONFIG:
+        raise argparse.ArgumentTypeError(
+            f"harus key=value dengan key di GESTURE_CONFIG: {text!r}")
+    try:
+        return key, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        raise argparse.ArgumentTypeError(f"nilai tidak valid: {text!r}")
+
+
+def parse_args(argv=None):
+    """Parse argumen command line"""
+    parser = argparse.ArgumentParser(
+        description="Evaluasi offline gesture recognition atas session berlabel"
+    )
+    parser.add_argument('directory', help="Direktori session .skel (rekursif)")
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument('--set', type=parse_override, action='append',
+                        default=[], metavar='KEY=VALUE', dest='overrides',
+                        help="Override GESTURE_CONFIG, mis. raise_threshold=120")
+    parser.add_argument('--no-state-machine', action='store_true',
+                        help="Evaluasi perintah tanpa CommandStateMachine")
+    parser.add_argument('--no-smoothing', action='store_true',
+                        help="Nonaktifkan filter posisi joint")
+    parser.add_argument('--output', '-o', metavar='PATH',
+                        help="Simpan ringkasan dan hasil per session ke JSON")
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help="Jangan cetak progres per session")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Jalankan evaluasi"""
+    args = parse_args(argv)
+
+    sessions, unlabeled = find_sessions(args.directory)
+    if unlabeled:
+        print(f"⚠️  {len(unlabeled)} session tanpa file label dilewati")
+    if not sessions:
+        print(f"❌ Tidak ada session berlabel di {args.directory}")
+        return 1
+
+    overrides = dict(args.overrides)
+    start = time.perf_counter()
+    results, errors = evaluate(
+        sessions, jobs=args.jobs, overrides=overrides,
+        use_state_machine=not args.no_state_machine,
+        smoothing=False if args.no_smoothing else None,
+        progress=not args.quiet,
+    )
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    print_report(summary)
+    print(f"\n⏱️  {len(sessions)} session dalam {elapsed:.1f}s")
+    if errors:
+        print(f"❌ {len(errors)} session gagal dievaluasi")
+
+    if args.output:
+        report = dict(summary, overrides=overrides, errors=errors,
+                      results=results)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Hasil disimpan ke {args.output}")
+
+    return 1 if errors and not results else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
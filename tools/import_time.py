@@ -0,0 +1,179 @@
+"""
+Import Time
+Ukur waktu import (startup) module project di proses Python baru dengan
+`python -X importtime`, diulang beberapa kali dan diambil median, beserta
+dependency berat yang ikut dimuat (cv2, serial, pykinect_azure).
+
+Penggunaan (dari root project):
+    python -m tools.import_time
+    python -m tools.import_time modules.gesture_recognizer --repeat 20
+    python -m tools.import_time --json import_time.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Target default: package, recognizer saja, tools offline dan main.py
+DEFAULT_TARGETS = (
+    'modules',
+    'modules.gesture_recognizer',
+    'modules.skeleton_session',
+    'modules.robot_controller',
+    'modules.visualizer',
+    'tools.evaluate',
+    'main',
+)
+
+# Dependency yang dilaporkan jika ikut dimuat
+HEAVY_MODULES = ('numpy', 'cv2', 'serial', 'pykinect_azure')
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Kode yang dijalankan di proses baru: import target lalu cetak module berat
+_PROBE = (
+    "import sys, time; start = time.perf_counter(); import {target}; "
+    "print(time.perf_counter() - start); "
+    "print(','.join(m for m in {heavy!r} if m in sys.modules))"
+)
+
+
+def parse_importtime(text):
+    """
+    Parse output stderr `-X importtime`
+
+    Args:
+        text (str): Output stderr
+
+    Returns:
+        dict: Package top-level -> waktu self total (mikrodetik)
+    """
+    packages = {}
+    for line in text.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        package = name.strip().split('.')[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+    return packages
+
+
+def measure(target, python=sys.executable):
+    """
+    Import target satu kali di proses baru
+
+    Args:
+        target (str): Nama module, mis. 'modules.gesture_recognizer'
+        python (str): Interpreter
+
+    Returns:
+        dict: import_ms (waktu `import target` di proses tersebut),
+              packages {package: ms self}, heavy (list dependency berat)
+
+    Raises:
+        RuntimeError: Jika import gagal
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [PROJECT_ROOT] + [p for p in env.get('PYTHONPATH', '').split(os.pathsep) if p]
+    )
+    code = _PROBE.format(target=target, heavy=HEAVY_MODULES)
+    proc = subprocess.run([python, '-X', 'importtime', '-c', code],
+                          cwd=PROJECT_ROOT, env=env, capture_output=True,
+                          text=True)
+    if proc.returncode != 0:
+        message = proc.stderr.strip().splitlines()
+        raise RuntimeError(message[-1] if message else f"exit {proc.returncode}")
+
+    seconds, heavy = proc.stdout.splitlines()[-2:]
+    return {
+        'import_ms': float(seconds) * 1000,
+        'packages': {name: us / 1000
+                     for name, us in parse_importtime(proc.stderr).items()},
+        'heavy': [name for name in heavy.split(',') if name],
+    }
+
+
+def profile(target, repeat=5):
+    """
+    Ukur import target beberapa kali
+
+    Run pertama hanya untuk memanaskan cache bytecode dan file system,
+    tidak ikut dihitung.
+
+    Args:
+        target (str): Nama module
+        repeat (int): Jumlah pengukuran
+
+    Returns:
+        dict: median_ms, min_ms, max_ms, packages (median ms per package),
+              heavy
+    """
+    measure(target)
+    runs = [measure(target) for _ in range(repeat)]
+    times = [run['import_ms'] for run in runs]
+    names = set().union(*(run['packages'] for run in runs))
+    packages = {
+        name: statistics.median(run['packages'].get(name, 0.0) for run in runs)
+        for name in names
+    }
+    return {
+        'median_ms': statistics.median(times),
+        'min_ms': min(times),
+        'max_ms': max(times),
+        'packages': dict(sorted(packages.items(), key=lambda item: -item[1])),
+        'heavy': runs[-1]['heavy'],
+    }
+
+
+def parse_args(argv=None):
+    """Parse argumen command line"""
+    parser = argparse.ArgumentParser(description="Ukur waktu import module")
+    parser.add_argument('targets', nargs='*', default=list(DEFAULT_TARGETS),
+                        help="Module yang diukur (default: DEFAULT_TARGETS)")
+    parser.add_argument('--repeat', '-n', type=int, default=5,
+                        help="Jumlah pengukuran per target (default: 5)")
+    parser.add_argument('--top', type=int, default=4,
+                        help="Jumlah package terlama yang ditampilkan")
+    parser.add_argument('--json', metavar='PATH',
+                        help="Simpan hasil ke JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Ukur dan cetak waktu import setiap target"""
+    args = parse_args(argv)
+    print(f"⏱️  Import time ({sys.executable}, Python "
+          f"{sys.version.split()[0]}, median {args.repeat} run)\n")
+    print(f"{'target':<28} {'median':>8} {'min':>8} {'max':>8}  "
+          f"dependency berat / package terlama")
+
+    results = {}
+    failed = False
+    for target in args.targets:
+        try:
+            result = profile(target, args.repeat)
+        except RuntimeError as e:
+            print(f"{target:<28} ❌ {e}")
+            failed = True
+            continue
+        results[target] = result
+        top = ', '.join(f"{name} {ms:.1f}" for name, ms
+                        in list(result['packages'].items())[:args.top])
+        print(f"{target:<28} {result['median_ms']:>6.1f}ms "
+              f"{result['min_ms']:>6.1f}ms {result['max_ms']:>6.1f}ms  "
+              f"[{', '.join(result['heavy']) or '-'}] {top}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Hasil disimpan ke {args.json}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Network Receiver Stand-in
+Penerima tiruan UDP/TCP di localhost untuk menguji transport jaringan
+RobotController: mencatat waktu tiba setiap paket, men-decode frame protocol
+biner (atau huruf ASCII) dan meng-echo frame valid.
+
+Penggunaan (dari root project):
+    python -m tools.net_receiver --transport udp --port 4210
+    python -m tools.net_receiver --transport tcp --port 4210 --ascii
+
+Lalu set ROBOT_CONFIG['port'] = 'udp://127.0.0.1:4210' (atau tcp://...).
+Waktu tiba memakai time.perf_counter sehingga bisa dibandingkan langsung
+dengan waktu kirim jika receiver berjalan di proses yang sama (start()).
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+
+import numpy as np
+
+from modules.protocol import FrameDecoder, encode_frame, COMMAND_CODES
+
+
+class _ReceiverProtocol(asyncio.Protocol, asyncio.DatagramProtocol):
+    """Protocol asyncio per koneksi TCP (atau satu endpoint UDP)"""
+
+    def __init__(self, receiver):
+        self.receiver = receiver
+        self.transport = None
+        self._decoders = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+        if transport.get_extra_info('peername') is not None:
+            self.receiver.connections += 1
+            self.receiver._clients.add(transport)
+
+    def connection_lost(self, exc):
+        self.receiver._clients.discard(self.transport)
+
+    def data_received(self, data):
+        for reply in self.receiver._handle(data, self._decoder(None)):
+            self.transport.write(reply)
+
+    def datagram_received(self, data, addr):
+        for reply in self.receiver._handle(data, self._decoder(addr)):
+            self.transport.sendto(reply, addr)
+
+    def _decoder(self, key):
+        """Decoder per pengirim agar stream tidak tercampur"""
+        decoder = self._decoders.get(key)
+        if decoder is None:
+            decoder = self._decoders[key] = FrameDecoder()
+        return decoder
+
+
+class NetReceiver:
+    """
+    Penerima UDP/TCP tiruan
+
+    Attributes:
+        transport (str): 'udp' atau 'tcp'
+        host (str): Alamat bind
+        port (int): Port bind (0 = dipilih OS, terisi setelah start())
+        ascii_mode (bool): Terima huruf ASCII, bukan frame biner
+        echo (bool): Echo frame biner valid (untuk RTT/loss di host)
+        arrivals (list): (waktu perf_counter, bytes) setiap paket yang diterima
+        commands (list): (waktu perf_counter, perintah) setiap frame/huruf valid
+        connections (int): Jumlah koneksi TCP yang diterima
+    """
+
+    def __init__(self, transport='udp', host='127.0.0.1', port=0,
+                 ascii_mode=False, echo=True, verbose=False):
+        """
+        Inisialisasi NetReceiver
+
+        Args:
+            transport (str): 'udp' atau 'tcp'
+            host (str): Alamat bind
+            port (int): Port bind (0 = dipilih OS)
+            ascii_mode (bool): Terima huruf ASCII
+            echo (bool): Echo frame biner valid
+            verbose (bool): Cetak setiap perintah
+
+        Raises:
+            ValueError: Jika transport tidak dikenal
+        """
+        if transport not in ('udp', 'tcp'):
+            raise ValueError(f"Transport tidak dikenal: {transport!r}")
+
+        self.transport = transport
+        self.host = host
+        self.port = port
+        self.ascii_mode = ascii_mode
+        self.echo = echo
+        self.verbose = verbose
+
+        self.arrivals = []
+        self.commands = []
+        self.connections = 0
+
+        self._loop = None
+        self._server = None
+        self._clients = set()
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+
+    @property
+    def url(self):
+        """str: URL untuk RobotController (mis. 'udp://127.0.0.1:4210')"""
+        return f"{self.transport}://{self.host}:{self.port}"
+
+    async def _serve(self):
+        """Buka socket server di loop milik receiver"""
+        loop = asyncio.get_event_loop()
+        if self.transport == 'udp':
+            self._server, _ = await loop.create_datagram_endpoint(
+                lambda: _ReceiverProtocol(self), local_addr=(self.host, self.port)
+            )
+            sock = self._server.get_extra_info('socket')
+        else:
+            self._server = await loop.create_server(
+                lambda: _ReceiverProtocol(self), self.host, self.port
+            )
+            sock = self._server.sockets[0]
+        self.port = sock.getsockname()[1]
+
+    def _handle(self, data, decoder):
+        """
+        Catat dan proses data dari host
+
+        Returns:
+            list: Frame echo yang dikirim balik
+        """
+        now = time.perf_counter()
+        self.arrivals.append((now, bytes(data)))
+
+        if self.ascii_mode:
+            for byte in data:
+                command = chr(byte)
+                if command in COMMAND_CODES:
+                    self._record(now, command)
+            return []
+
+        replies = []
+        for frame in decoder.feed(data):
+            self._record(now, frame.command)
+            if self.echo:
+                replies.append(encode_frame(frame.msg_type, frame.command,
+                                            frame.seq, frame.speed))
+        return replies
+
+    def _record(self, now, command):
+        """Catat perintah valid"""
+        if self.verbose and (not self.commands or self.commands[-1][1] != command):
+            print(f"🤖 Perintah: {command}")
+        self.commands.append((now, command))
+
+    def start(self):
+        """
+        Jalankan receiver di background thread
+
+        Returns:
+            str: URL receiver
+        """
+        self._thread = threading.Thread(target=self.run, name='NetReceiver',
+                                        daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+        return self.url
+
+    def run(self):
+        """Jalankan event loop receiver (blocking sampai stop())"""
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self._serve())
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            self._loop.close()
+            return
+
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            # Tutup koneksi TCP yang masih terbuka agar host melihat link putus
+            self._server.close()
+            for client in list(self._clients):
+                client.close()
+            self._loop.run_until_complete(asyncio.sleep(0))
+            self._loop.close()
+
+    def stop(self):
+        """Hentikan receiver"""
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def get_stats(self):
+        """
+        Statistik paket yang diterima
+
+        Returns:
+            dict: packets, bytes, commands, connections, dan jeda antar
+                  paket (ms): gap_avg_ms, gap_p95_ms, gap_max_ms
+        """
+        stats = {
+            'packets': len(self.arrivals),
+            'bytes': sum(len(data) for _, data in self.arrivals),
+            'commands': len(self.commands),
+            'connections': self.connections,
+        }
+        if len(self.arrivals) > 1:
+            gaps = np.diff([stamp for stamp, _ in self.arrivals]) * 1000
+            stats.update({
+                'gap_avg_ms': float(gaps.mean()),
+                'gap_p95_ms': float(np.percentile(gaps, 95)),
+                'gap_max_ms': float(gaps.max()),
+            })
+        return stats
+
+
+def parse_args(argv=None):
+    """Parse argumen command line"""
+    parser = argparse.ArgumentParser(description="Penerima UDP/TCP tiruan")
+    parser.add_argument('--transport', choices=('udp', 'tcp'), default='udp',
+                        help="Transport (default: udp)")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="Alamat bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=4210,
+                        help="Port bind (default: 4210)")
+    parser.add_argument('--ascii', action='store_true',
+                        help="Terima huruf ASCII (protocol 'ascii')")
+    parser.add_argument('--no-echo', action='store_true',
+                        help="Jangan echo frame biner")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Jalankan penerima sampai Ctrl+C"""
+    args = parse_args(argv)
+    receiver = NetReceiver(transport=args.transport, host=args.host,
+                           port=args.port, ascii_mode=args.ascii,
+                           echo=not args.no_echo, verbose=True)
+    try:
+        receiver.start()
+    except OSError as e:
+        print(f"❌ Gagal membuka {receiver.url}: {e}")
+        return 1
+
+    print(f"🤖 Penerima siap di {receiver.url}")
+    print(f"    Set ROBOT_CONFIG['port'] = '{receiver.url}'")
+
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        receiver.stop()
+        print(f"\n📊 {receiver.get_stats()}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
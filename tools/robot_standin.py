@@ -0,0 +1,235 @@
+"""
+Robot Stand-in
+Robot tiruan di pseudo-terminal (pty) untuk menguji RobotController tanpa
+hardware: men-decode frame protocol biner (atau huruf ASCII), meng-echo
+frame valid, dan menghentikan robot saat heartbeat tidak datang.
+
+Penggunaan (dari root project, Linux/macOS):
+    python -m tools.robot_standin
+    python -m tools.robot_standin --loss 0.1 --delay 0.02
+
+Lalu arahkan ROBOT_CONFIG['port'] (atau RobotController(port=...)) ke path
+pty yang dicetak. Untuk echo murni tanpa pty, pakai port 'loop://'.
+"""
+
+import argparse
+import os
+import random
+import select
+import sys
+import threading
+import time
+
+from config.settings import ROBOT_CONFIG
+from modules.protocol import (
+    FrameDecoder,
+    encode_frame,
+    MSG_HEARTBEAT,
+    COMMAND_CODES,
+)
+
+
+class StandInRobot:
+    """
+    Robot tiruan di sisi master sebuah pty
+
+    Attributes:
+        port (str): Path pty untuk RobotController (setelah open())
+        ascii_mode (bool): Terima huruf ASCII, bukan frame biner
+        loss (float): Probabilitas frame dibuang (tanpa echo)
+        delay (float): Jeda sebelum echo (detik)
+        watchdog (float): Batas diam link sebelum robot berhenti (detik)
+        command (str): Perintah yang sedang dijalankan
+        frames (int): Jumlah frame/huruf valid yang diterima
+        heartbeats (int): Jumlah heartbeat yang diterima
+        dropped (int): Jumlah frame yang sengaja dibuang
+        link_losses (int): Jumlah watchdog timeout
+    """
+
+    def __init__(self, ascii_mode=False, loss=0.0, delay=0.0, watchdog=None,
+                 seed=0, verbose=False):
+        """
+        Inisialisasi StandInRobot
+
+        Args:
+            ascii_mode (bool): Terima huruf ASCII
+            loss (float): Probabilitas frame dibuang
+            delay (float): Jeda sebelum echo (detik)
+            watchdog (float, optional): Batas diam link. Default 3x
+                heartbeat_interval di config.
+            seed (int): Seed random untuk loss
+            verbose (bool): Cetak setiap perubahan perintah
+        """
+        if watchdog is None:
+            watchdog = 3 * ROBOT_CONFIG['heartbeat_interval']
+
+        self.ascii_mode = ascii_mode
+        self.loss = loss
+        self.delay = delay
+        self.watchdog = watchdog
+        self.verbose = verbose
+
+        self.port = None
+        self.command = 'S'
+        self.frames = 0
+        self.heartbeats = 0
+        self.dropped = 0
+        self.link_losses = 0
+
+        self._master = None
+        self._slave = None
+        self._decoder = FrameDecoder()
+        self._random = random.Random(seed)
+        self._running = False
+        self._thread = None
+        self._last_frame = None
+
+    def open(self):
+        """
+        Buka pasangan pty
+
+        Returns:
+            str: Path pty untuk RobotController
+        """
+        import pty
+        import tty
+
+        self._master, self._slave = pty.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        return self.port
+
+    def start(self):
+        """Jalankan robot di background thread"""
+        if self._master is None:
+            self.open()
+        self._running = True
+        self._thread = threading.Thread(target=self.run, name='StandInRobot',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Hentikan robot dan tutup pty"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                os.close(fd)
+        self._master = self._slave = None
+
+    def run(self):
+        """Loop utama: baca pty, proses frame, cek watchdog"""
+        self._running = True
+        while self._running:
+            ready, _, _ = select.select([self._master], [], [], 0.05)
+            if ready:
+                try:
+                    data = os.read(self._master, 256)
+                except OSError:
+                    break
+                self._handle(data)
+            self._check_watchdog()
+
+    def _handle(self, data):
+        """Proses data dari host"""
+        if self.ascii_mode:
+            for byte in data:
+                command = chr(byte)
+                if command in COMMAND_CODES:
+                    self.frames += 1
+                    self._last_frame = time.monotonic()
+                    self._set_command(command)
+            return
+
+        for frame in self._decoder.feed(data):
+            if self.loss and self._random.random() < self.loss:
+                self.dropped += 1
+                continue
+
+            self.frames += 1
+            self._last_frame = time.monotonic()
+            if frame.msg_type == MSG_HEARTBEAT:
+                self.heartbeats += 1
+            self._set_command(frame.command)
+
+            # Echo frame apa adanya untuk RTT/loss di host
+            if self.delay:
+                time.sleep(self.delay)
+            os.write(self._master, encode_frame(
+                frame.msg_type, frame.command, frame.seq, frame.speed))
+
+    def _set_command(self, command):
+        """Ganti perintah yang dijalankan"""
+        if command != self.command and self.verbose:
+            print(f"🤖 Perintah: {self.command} → {command}")
+        self.command = command
+
+    def _check_watchdog(self):
+        """Berhenti jika link diam melewati watchdog"""
+        if self.ascii_mode or self._last_frame is None:
+            return
+        if time.monotonic() - self._last_frame > self.watchdog:
+            self.link_losses += 1
+            self._last_frame = None
+            if self.verbose:
+                print("⚠️  Link diam melewati watchdog → STOP")
+            self._set_command('S')
+
+    def get_stats(self):
+        """
+        Statistik robot
+
+        Returns:
+            dict: command, frames, heartbeats, dropped, bad_bytes, link_losses
+        """
+        return {
+            'command': self.command,
+            'frames': self.frames,
+            'heartbeats': self.heartbeats,
+            'dropped': self.dropped,
+            'bad_bytes': self._decoder.bad_bytes,
+            'link_losses': self.link_losses,
+        }
+
+
+def parse_args(argv=None):
+    """Parse argumen command line"""
+    parser = argparse.ArgumentParser(description="Robot tiruan di pty")
+    parser.add_argument('--ascii', action='store_true',
+                        help="Terima huruf ASCII (protocol 'ascii')")
+    parser.add_argument('--loss', type=float, default=0.0,
+                        help="Probabilitas frame dibuang (0-1)")
+    parser.add_argument('--delay', type=float, default=0.0,
+                        help="Jeda sebelum echo (detik)")
+    parser.add_argument('--watchdog', type=float,
+                        help="Batas diam link sebelum STOP (detik)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Jalankan robot tiruan sampai Ctrl+C"""
+    if os.name != 'posix':
+        print("❌ Robot stand-in membutuhkan pty (Linux/macOS)")
+        return 1
+
+    args = parse_args(argv)
+    robot = StandInRobot(ascii_mode=args.ascii, loss=args.loss,
+                         delay=args.delay, watchdog=args.watchdog, verbose=True)
+    port = robot.open()
+    print(f"🤖 Robot stand-in siap di {port}")
+    print(f"    Set ROBOT_CONFIG['port'] = '{port}'")
+
+    try:
+        robot.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"\n📊 {robot.get_stats()}")
+        robot.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,447 @@
+"""
+Threshold Sweep
+Evaluasi ribuan kombinasi threshold gesture sekaligus atas session rekaman
+berlabel dan cari Pareto front akurasi perintah vs. churn perintah.
+
+Parameter rule (raise_threshold, wave_threshold, face_distance_threshold,
+nose_margin, confidence_threshold) di-broadcast sebagai axis tambahan di
+GestureRuleSet.evaluate_conditions(): setiap frame dievaluasi sekali untuk
+seluruh grid, lalu bitmask kondisi dipetakan ke perintah dengan
+command_table().
+buffer_size mengubah state WaveBuffer sehingga di-loop (recognizer dijalankan
+sekali per nilai). Session dibagi ke process pool seperti tools.evaluate
+(format label sama).
+
+Metrik dihitung dari perintah mentah gesture_to_command body pengendali
+(tanpa CommandStateMachine):
+  - accuracy : persen frame dengan perintah = perintah label
+  - churn    : pergantian perintah per menit
+
+Penggunaan (dari root project):
+    python -m tools.sweep sessions/
+    python -m tools.sweep sessions/ --grid raise_threshold=40:200:10 \\
+        --grid buffer_size=10,15,20 --output sweep.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from config.settings import GESTURE_CONFIG, GESTURE_FEATURES, GESTURE_COMMANDS
+from modules.gesture_recognizer import (
+    MultiBodyGestureRecognizer, JOINT_INDEX, HAND_TRACKS
+)
+from modules.gesture_rules import GestureRuleSet
+from modules.skeleton_session import SessionReplay, ReplayBody
+from .evaluate import (
+    GESTURES, apply_overrides, find_sessions, labels_path, load_labels,
+    parse_override
+)
+
+# Parameter yang dipakai kondisi rule (bisa di-broadcast)
+RULE_PARAMS = tuple(sorted({
+    condition['value'].lstrip('-')
+    for conditions in GESTURE_FEATURES.values()
+    for condition in conditions
+    if isinstance(condition['value'], str)
+}))
+
+# Jumlah kolom kondisi GestureRuleSet (untuk ukuran chunk)
+NUM_CONDITIONS = sum(len(conditions) for conditions in GESTURE_FEATURES.values())
+
+# Parameter yang mengubah state recognizer (di-loop)
+LOOP_PARAMS = ('buffer_size',)
+
+# Grid default: 9 x 7 x 9 x 7 kombinasi rule x 4 buffer_size
+DEFAULT_GRID = {
+    'raise_threshold': tuple(range(40, 201, 20)),
+    'wave_threshold': tuple(range(40, 161, 20)),
+    'face_distance_threshold': tuple(range(100, 301, 25)),
+    'nose_margin': tuple(range(0, 151, 25)),
+    'buffer_size': (10, 15, 20, 30),
+}
+
+# Batas elemen array kondisi per chunk frame (grid x frame x kondisi)
+CHUNK_ELEMENTS = 1 << 24
+
+# Perintah sebagai index integer agar bisa dibandingkan dalam array
+COMMANDS = tuple(dict.fromkeys(GESTURE_COMMANDS.values()))
+COMMAND_INDEX = {command: i for i, command in enumerate(COMMANDS)}
+STOP = COMMAND_INDEX['S']
+
+
+def collect_session(path, buffer_size, smoothing=None):
+    """
+    Jalankan recognizer atas session dan simpan input rule body pengendali
+
+    Args:
+        path (str): Path file .skel
+        buffer_size (int): Ukuran window lambaian
+        smoothing (bool, optional): Filter posisi joint. Default dari config.
+
+    Returns:
+        tuple: (timestamps, has_body, keypoints, wave); keypoints
+               (N, num_joints, 4) float32, wave = (ready, variance, changes)
+               masing-masing (N, num_hands)
+    """
+    records = SessionReplay.open_records(path)
+    starts = SessionReplay.frame_starts(records)
+    num_frames = len(starts) - 1
+
+    recognizer = MultiBodyGestureRecognizer(buffer_size=buffer_size,
+                                            smoothing=smoothing)
+    num_hands = len(HAND_TRACKS)
+    timestamps = np.empty(num_frames, dtype=np.int64)
+    has_body = np.zeros(num_frames, dtype=bool)
+    keypoints = np.full((num_frames, recognizer.num_joints, 4), np.nan,
+                        dtype=np.float32)
+    ready = np.zeros((num_frames, num_hands), dtype=bool)
+    variance = np.zeros((num_frames, num_hands), dtype=np.float64)
+    changes = np.zeros((num_frames, num_hands), dtype=np.int64)
+
+    for i in range(num_frames):
+        frame = records[starts[i]:starts[i + 1]]
+        timestamps[i] = frame[0]['timestamp_usec']
+        bodies = [ReplayBody(record) for record in frame] \
+            if frame[0]['num_bodies'] else []
+
+        if not recognizer.recognize_bodies(bodies):
+            continue
+        has_body[i] = True
+        body_keypoints, wave = recognizer.body_state(recognizer.primary_id)
+        keypoints[i] = body_keypoints
+        ready[i], variance[i], changes[i] = wave
+
+    return timestamps, has_body, keypoints, (ready, variance, changes)
+
+
+def grid_axes(grid):
+    """
+    Parameter rule sebagai array dengan axis sendiri-sendiri
+
+    Args:
+        grid (dict): Nama parameter -> nilai
+
+    Returns:
+        tuple: (params, shape); params {nama: array} yang saling
+               di-broadcast menjadi shape grid rule
+    """
+    names = [name for name in grid if name not in LOOP_PARAMS]
+    shape = tuple(len(grid[name]) for name in names)
+    params = {}
+    for axis, name in enumerate(names):
+        axis_shape = [1] * len(names)
+        axis_shape[axis] = -1
+        params[name] = np.asarray(grid[name], dtype=np.float64).reshape(axis_shape)
+    return params, shape
+
+
+def sweep_session(path, grid, smoothing=None):
+    """
+    Hitung frame benar dan pergantian perintah untuk seluruh grid (di worker)
+
+    Args:
+        path (str): Path file .skel (label di labels_path(path))
+        grid (dict): Nama parameter -> nilai
+        smoothing (bool, optional): Filter posisi joint. Default dari config.
+
+    Returns:
+        dict: path, frames, seconds, correct dan changes berupa array int64
+              (len(buffer_size), *shape grid rule)
+    """
+    rules = GestureRuleSet(JOINT_INDEX, HAND_TRACKS)
+    params, shape = grid_axes(grid)
+    # Perintah per bitmask kondisi: satu lookup menggantikan matmul rule
+    rule_commands = np.array([COMMAND_INDEX[c] for c in rules.commands])
+    table = rules.command_table()
+    table = np.where(table >= 0, rule_commands[table], STOP)
+    buffer_sizes = grid.get('buffer_size', (GESTURE_CONFIG['buffer_size'],))
+
+    correct = np.zeros((len(buffer_sizes),) + shape, dtype=np.int64)
+    changes = np.zeros_like(correct)
+    num_combos = max(int(np.prod(shape)), 1)
+    chunk = max(CHUNK_ELEMENTS // (num_combos * NUM_CONDITIONS), 1)
+
+    for b, buffer_size in enumerate(buffer_sizes):
+        timestamps, has_body, keypoints, wave = collect_session(
+            path, int(buffer_size), smoothing)
+        num_frames = len(timestamps)
+        if b == 0:
+            labels = load_labels(labels_path(path), num_frames)
+            expected = np.array([COMMAND_INDEX[GESTURE_COMMANDS[GESTURES[i]]]
+                                 for i in labels.tolist()], dtype=np.int64)
+
+        # Perintah sebelum frame pertama: robot diam (STOP)
+        last = np.full(shape, STOP, dtype=np.int64)
+        for start in range(0, num_frames, chunk):
+            part = slice(start, start + chunk)
+            conditions = rules.evaluate_conditions(
+                keypoints[part], tuple(stat[part] for stat in wave), params)
+            commands = table[rules.condition_codes(conditions)]
+            commands = np.where(has_body[part], commands, STOP)
+
+            correct[b] += np.count_nonzero(commands == expected[part], axis=-1)
+            changes[b] += np.count_nonzero(commands[..., 1:] != commands[..., :-1],
+                                           axis=-1)
+            changes[b] += commands[..., 0] != last
+            last = commands[..., -1]
+
+    seconds = float(timestamps[-1] - timestamps[0]) / 1e6 if num_frames else 0.0
+    return {
+        'path': path,
+        'frames': num_frames,
+        'seconds': seconds,
+        'correct': correct,
+        'changes': changes,
+    }
+
+
+def sweep(sessions, grid, jobs=None, overrides=None, smoothing=None,
+          progress=True):
+    """
+    Sweep grid atas banyak session secara paralel
+
+    Args:
+        sessions (list): Path file .skel
+        grid (dict): Nama parameter -> nilai
+        jobs (int, optional): Jumlah proses worker. Default: jumlah CPU.
+        overrides (dict, optional): Override GESTURE_CONFIG di worker
+        smoothing (bool, optional): Filter posisi joint. Default dari config.
+        progress (bool): Cetak progres per session
+
+    Returns:
+        tuple: (totals, errors); totals = dict frames, seconds, sessions,
+               correct, changes (dijumlah atas session), errors = list
+               (path, pesan)
+    """
+    totals = {'frames': 0, 'seconds': 0.0, 'sessions': 0,
+              'correct': 0, 'changes': 0}
+    errors = []
+    jobs = min(jobs or os.cpu_count() or 1, max(len(sessions), 1))
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=apply_overrides,
+                             initargs=(overrides or {},)) as executor:
+        futures = {
+            executor.submit(sweep_session, path, grid, smoothing): path
+            for path in sessions
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                errors.append((path, str(e)))
+                if progress:
+                    print(f"❌ [{done}/{len(sessions)}] {path}: {e}")
+                continue
+            for key in ('frames', 'seconds', 'correct', 'changes'):
+                totals[key] = totals[key] + result[key]
+            totals['sessions'] += 1
+            if progress:
+                print(f"✅ [{done}/{len(sessions)}] {path} "
+                      f"({result['frames']} frame)")
+
+    return totals, errors
+
+
+def pareto_front(accuracy, churn):
+    """
+    Index kombinasi di Pareto front (accuracy maksimal, churn minimal)
+
+    Args:
+        accuracy (np.ndarray): Akurasi per kombinasi
+        churn (np.ndarray): Churn per kombinasi
+
+    Returns:
+        np.ndarray: Index kombinasi, terurut churn naik
+    """
+    order = np.lexsort((-accuracy, churn))
+    best = np.maximum.accumulate(accuracy[order])
+    keep = np.empty(len(order), dtype=bool)
+    keep[:1] = True
+    keep[1:] = accuracy[order][1:] > best[:-1]
+    return order[keep]
+
+
+def combinations(grid, totals):
+    """
+    Ratakan hasil sweep menjadi tabel kombinasi
+
+    Args:
+        grid (dict): Nama parameter -> nilai
+        totals (dict): Output sweep()
+
+    Returns:
+        tuple: (columns, accuracy, churn); columns {nama: nilai per
+               kombinasi}, urutan sama dengan correct.ravel()
+    """
+    names = [name for name in LOOP_PARAMS if name in grid]
+    names += [name for name in grid if name not in LOOP_PARAMS]
+    if 'buffer_size' not in grid:
+        names.insert(0, 'buffer_size')
+        grid = dict(grid, buffer_size=(GESTURE_CONFIG['buffer_size'],))
+
+    mesh = np.meshgrid(*[np.asarray(grid[name]) for name in names],
+                       indexing='ij')
+    columns = {name: values.ravel() for name, values in zip(names, mesh)}
+
+    frames = max(totals['frames'], 1)
+    minutes = max(totals['seconds'], 1e-9) / 60
+    accuracy = np.ravel(totals['correct']) / frames
+    churn = np.ravel(totals['changes']) / minutes
+    return columns, accuracy, churn
+
+
+def print_front(columns, accuracy, churn, front):
+    """Cetak kombinasi di Pareto front"""
+    names = list(columns)
+    width = [max(len(name), 5) for name in names]
+    print(f"\n🏆 Pareto front ({len(front)} kombinasi):")
+    print(' '.join(f"{name:>{w}}" for name, w in zip(names, width)) +
+          f" {'accuracy':>9} {'churn/min':>9}")
+    for i in front:
+        print(' '.join(f"{columns[name][i]:>{w}g}" for name, w in zip(names, width)) +
+              f" {accuracy[i]:>9.1%} {churn[i]:>9.1f}")
+
+
+def save_results(path, columns, accuracy, churn, front):
+    """
+    Simpan semua kombinasi ke CSV atau JSON (sesuai ekstensi)
+
+    Raises:
+        ValueError: Jika ekstensi tidak didukung
+    """
+    on_front = np.zeros(len(accuracy), dtype=bool)
+    on_front[front] = True
+
+    if path.lower().endswith('.json'):
+        rows = [
+            dict({name: values[i].item() for name, values in columns.items()},
+                 accuracy=float(accuracy[i]), churn_per_min=float(churn[i]),
+                 pareto=bool(on_front[i]))
+            for i in range(len(accuracy))
+        ]
+        with open(path, 'w') as f:
+            json.dump(rows, f, indent=2)
+        return
+
+    if not path.lower().endswith('.csv'):
+        raise ValueError(f"Format output tidak didukung: {path!r} (.json/.csv)")
+
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(list(columns) + ['accuracy', 'churn_per_min', 'pareto'])
+        for i in range(len(accuracy)):
+            writer.writerow([values[i].item() for values in columns.values()] +
+                            [float(accuracy[i]), float(churn[i]), int(on_front[i])])
+
+
+def parse_grid(text):
+    """
+    Parse 'key=start:stop:step' (stop inklusif) atau 'key=v1,v2,...'
+
+    Raises:
+        argparse.ArgumentTypeError: Jika format atau key tidak valid
+    """
+    key, sep, spec = text.partition('=')
+    if not sep or key not in RULE_PARAMS + LOOP_PARAMS:
+        raise argparse.ArgumentTypeError(
+            f"key harus salah satu dari {', '.join(RULE_PARAMS + LOOP_PARAMS)}: "
+            f"{text!r}")
+    try:
+        if ':' in spec:
+            start, stop, step = (float(v) for v in spec.split(':'))
+            if step <= 0:
+                raise ValueError(spec)
+            values = np.arange(start, stop + step / 2, step).tolist()
+        else:
+            values = [float(v) for v in spec.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"nilai tidak valid: {text!r}")
+    if not values:
+        raise argparse.ArgumentTypeError(f"grid kosong: {text!r}")
+    values = tuple(int(v) if v == int(v) else v for v in values)
+    if key in LOOP_PARAMS and any(v != int(v) or v < 1 for v in values):
+        raise argparse.ArgumentTypeError(f"{key} harus bilangan bulat positif")
+    return key, values
+
+
+def parse_args(argv=None):
+    """Parse argumen command line"""
+    parser = argparse.ArgumentParser(
+        description="Sweep threshold gesture atas session berlabel"
+    )
+    parser.add_argument('directory', help="Direktori session .skel (rekursif)")
+    parser.add_argument('--grid', type=parse_grid, action='append', default=[],
+                        metavar='KEY=SPEC',
+                        help="Nilai parameter: start:stop:step atau v1,v2,... "
+                             "(default: DEFAULT_GRID)")
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument('--set', type=parse_override, action='append',
+                        default=[], metavar='KEY=VALUE', dest='overrides',
+                        help="Override GESTURE_CONFIG yang tidak di-sweep")
+    parser.add_argument('--no-smoothing', action='store_true',
+                        help="Nonaktifkan filter posisi joint")
+    parser.add_argument('--output', '-o', metavar='PATH',
+                        help="Simpan semua kombinasi ke CSV atau JSON")
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help="Jangan cetak progres per session")
+    args = parser.parse_args(argv)
+    if args.output and not args.output.lower().endswith(('.json', '.csv')):
+        parser.error("--output harus berakhiran .json atau .csv")
+    return args
+
+
+def main(argv=None):
+    """Jalankan sweep"""
+    args = parse_args(argv)
+    grid = dict(args.grid) if args.grid else dict(DEFAULT_GRID)
+    overrides = dict(args.overrides)
+    grid.setdefault('buffer_size', (overrides.get('buffer_size',
+                                                  GESTURE_CONFIG['buffer_size']),))
+
+    sessions, unlabeled = find_sessions(args.directory)
+    if unlabeled:
+        print(f"⚠️  {len(unlabeled)} session tanpa file label dilewati")
+    if not sessions:
+        print(f"❌ Tidak ada session berlabel di {args.directory}")
+        return 1
+
+    num_combos = int(np.prod([len(values) for values in grid.values()]))
+    print(f"🔍 Sweep {num_combos} kombinasi "
+          f"({' x '.join(f'{k}[{len(v)}]' for k, v in grid.items())}) "
+          f"atas {len(sessions)} session")
+
+    start = time.perf_counter()
+    totals, errors = sweep(sessions, grid, jobs=args.jobs,
+                           overrides=overrides,
+                           smoothing=False if args.no_smoothing else None,
+                           progress=not args.quiet)
+    elapsed = time.perf_counter() - start
+    if errors:
+        print(f"❌ {len(errors)} session gagal dievaluasi")
+    if not totals['sessions']:
+        return 1
+
+    columns, accuracy, churn = combinations(grid, totals)
+    front = pareto_front(accuracy, churn)
+    print_front(columns, accuracy, churn, front)
+    print(f"\n⏱️  {num_combos} kombinasi x {totals['frames']} frame "
+          f"dalam {elapsed:.1f}s")
+
+    if args.output:
+        save_results(args.output, columns, accuracy, churn, front)
+        print(f"💾 Hasil disimpan ke {args.output}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())